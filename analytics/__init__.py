@@ -0,0 +1 @@
+# analytics 패키지 모듈 초기화
@@ -0,0 +1,293 @@
+import asyncio
+import time
+from typing import Any
+
+import numpy as np
+from loguru import logger
+
+from constants import SESSION_NAMES
+from database import iter_retrospectives
+from database.archive import archive_store
+from database.changes import ChangeType, get_data_version, on_change, on_resync
+from utils import get_cohort_session_names
+
+# 이동 평균 구간 (회차 수)
+MOVING_AVERAGE_WINDOW = 3
+
+# 사용자 평균에서 표준편차의 몇 배 이상 벗어나면 이상치로 보는지
+OUTLIER_Z_SCORE = 2.0
+
+# 추세와 이상치를 계산하기 위한 최소 감정 점수 개수
+MIN_SCORES_FOR_TREND = 3
+
+# 외부에서 수정된 데이터를 반영하기 위해 전체 데이터를 다시 불러오는 주기(초)
+FULL_RELOAD_SECONDS = 3600
+
+_SESSION_INDEX = {name: idx for idx, name in enumerate(SESSION_NAMES)}
+
+
+class EmotionAnalytics:
+    """
+    사용자별/회차별 감정 점수 통계를 계산합니다.
+
+    모든 회고를 (사용자, 회차) 순으로 정렬한 NumPy 배열로 보관하고,
+    사용자별 평균, 추세, 연속 공유 회차, 이상치를 반복문 없이 한 번에 계산합니다.
+    """
+
+    def __init__(self, rows: list[dict[str, Any]]) -> None:
+        rows = [row for row in rows if row["session_name"] in _SESSION_INDEX]
+
+        user_ids, user_codes = np.unique(
+            np.array([row["user_id"] for row in rows], dtype=str),
+            return_inverse=True,
+        )
+        session_idx = np.array(
+            [_SESSION_INDEX[row["session_name"]] for row in rows], dtype=np.int64
+        )
+        scores = np.array(
+            [
+                row["emotion_score"] if row["emotion_score"] is not None else np.nan
+                for row in rows
+            ],
+            dtype=np.float64,
+        )
+
+        order = np.lexsort((session_idx, user_codes))
+        self.user_ids = user_ids
+        self._user_index = {user_id: idx for idx, user_id in enumerate(user_ids)}
+        self.users = user_codes[order]
+        self.sessions = session_idx[order]
+        self.scores = scores[order]
+
+        self._compute_user_stats()
+        self._compute_streaks()
+        self._compute_session_means()
+
+    def _compute_user_stats(self) -> None:
+        """사용자별 평균, 표준편차, 추세(회차당 점수 변화), 이상치를 계산합니다."""
+        n_users = len(self.user_ids)
+        valid = ~np.isnan(self.scores)
+        users = self.users[valid]
+        x = self.sessions[valid].astype(np.float64)
+        y = self.scores[valid]
+
+        count = np.bincount(users, minlength=n_users).astype(np.float64)
+        sum_x = np.bincount(users, weights=x, minlength=n_users)
+        sum_y = np.bincount(users, weights=y, minlength=n_users)
+        sum_xx = np.bincount(users, weights=x * x, minlength=n_users)
+        sum_xy = np.bincount(users, weights=x * y, minlength=n_users)
+        sum_yy = np.bincount(users, weights=y * y, minlength=n_users)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = sum_y / count
+            std = np.sqrt(np.maximum(sum_yy / count - mean * mean, 0.0))
+            # 최소제곱 직선의 기울기
+            denominator = count * sum_xx - sum_x * sum_x
+            slope = (count * sum_xy - sum_x * sum_y) / denominator
+
+        enough = count >= MIN_SCORES_FOR_TREND
+        self.score_count = count.astype(np.int64)
+        self.mean = mean
+        self.std = std
+        self.slope = np.where(enough & (denominator > 0), slope, np.nan)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z = (self.scores - mean[self.users]) / std[self.users]
+        self.outliers = (
+            valid
+            & enough[self.users]
+            & (std[self.users] > 0)
+            & (np.abs(z) >= OUTLIER_Z_SCORE)
+        )
+
+    def _compute_streaks(self) -> None:
+        """사용자별 최장/최근 연속 공유 회차 수를 계산합니다."""
+        n_users = len(self.user_ids)
+        self.longest_streak = np.zeros(n_users, dtype=np.int64)
+        self.current_streak = np.zeros(n_users, dtype=np.int64)
+        if len(self.users) == 0:
+            return
+
+        # 같은 회차에 여러 번 공유한 경우 한 번으로 봅니다.
+        unique = np.ones(len(self.users), dtype=bool)
+        unique[1:] = (self.users[1:] != self.users[:-1]) | (
+            self.sessions[1:] != self.sessions[:-1]
+        )
+        users = self.users[unique]
+        sessions = self.sessions[unique]
+
+        # 사용자가 바뀌거나 회차가 이어지지 않으면 새로운 연속 구간이 시작됩니다.
+        run_start = np.ones(len(users), dtype=bool)
+        run_start[1:] = (users[1:] != users[:-1]) | (sessions[1:] - sessions[:-1] != 1)
+        run_ids = np.cumsum(run_start) - 1
+        run_lengths = np.bincount(run_ids)
+        run_users = users[run_start]
+        run_last_sessions = sessions[np.r_[np.flatnonzero(run_start)[1:] - 1, -1]]
+
+        np.maximum.at(self.longest_streak, run_users, run_lengths)
+
+        # 사용자의 마지막 구간이 가장 최근 회차까지 이어진 경우만 현재 연속 기록으로 봅니다.
+        last_run = np.full(n_users, -1, dtype=np.int64)
+        np.maximum.at(last_run, run_users, np.arange(len(run_lengths)))
+        latest_session = sessions.max()
+        has_run = last_run >= 0
+        is_current = np.zeros(n_users, dtype=bool)
+        is_current[has_run] = run_last_sessions[last_run[has_run]] >= latest_session - 1
+        self.current_streak[is_current] = run_lengths[last_run[is_current]]
+
+    def _compute_session_means(self) -> None:
+        """회차별 감정 점수 평균을 계산합니다."""
+        valid = ~np.isnan(self.scores)
+        sessions = self.sessions[valid]
+        count = np.bincount(sessions, minlength=len(SESSION_NAMES))
+        total = np.bincount(sessions, weights=self.scores[valid], minlength=len(SESSION_NAMES))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.session_mean = total / count
+        self.session_score_count = count
+
+    def user_summary(self, user_id: str) -> dict[str, Any] | None:
+        """
+        사용자의 감정 점수 요약을 반환합니다.
+
+        Returns:
+            평균, 추세, 이동 평균, 연속 공유 회차, 이상치 회차 (기록이 없으면 None)
+        """
+        idx = self._user_index.get(user_id)
+        if idx is None:
+            return None
+
+        rows = self.users == idx
+        valid = rows & ~np.isnan(self.scores)
+        scores = self.scores[valid]
+
+        return {
+            "score_count": int(self.score_count[idx]),
+            "mean": float(self.mean[idx]) if scores.size else None,
+            "slope": None if np.isnan(self.slope[idx]) else float(self.slope[idx]),
+            "moving_average": _moving_average(scores),
+            "longest_streak": int(self.longest_streak[idx]),
+            "current_streak": int(self.current_streak[idx]),
+            "outlier_sessions": [
+                SESSION_NAMES[session] for session in self.sessions[rows & self.outliers]
+            ],
+        }
+
+    def cohort_report(self, cohort_name: str, limit: int = 10) -> dict[str, Any]:
+        """
+        기수의 회차별 감정 점수 추이와 주의가 필요한 멤버를 반환합니다.
+
+        Args:
+            cohort_name: 기수 이름
+            limit: 주의가 필요한 멤버 최대 표시 수
+        """
+        session_indexes = np.array(
+            [_SESSION_INDEX[name] for name in get_cohort_session_names(cohort_name)],
+            dtype=np.int64,
+        )
+        session_indexes = session_indexes[self.session_score_count[session_indexes] > 0]
+        means = self.session_mean[session_indexes]
+
+        # 기수 회차에 참여한 사용자 중 점수가 하락 추세인 사용자
+        in_cohort = np.isin(self.sessions, session_indexes)
+        cohort_users = np.unique(self.users[in_cohort])
+        slopes = self.slope[cohort_users]
+        declining = cohort_users[~np.isnan(slopes) & (slopes < 0)]
+        declining = declining[np.argsort(self.slope[declining])][:limit]
+
+        # 가장 최근 회차의 이상치
+        latest_outliers = []
+        if session_indexes.size:
+            latest = in_cohort & self.outliers & (self.sessions == session_indexes[-1])
+            latest_outliers = [
+                (str(self.user_ids[user]), float(score))
+                for user, score in zip(self.users[latest], self.scores[latest])
+            ][:limit]
+
+        return {
+            "sessions": [SESSION_NAMES[idx] for idx in session_indexes],
+            "session_means": means.tolist(),
+            "moving_average": _moving_average(means),
+            "declining_users": [
+                (str(self.user_ids[user]), float(self.slope[user])) for user in declining
+            ],
+            "latest_outliers": latest_outliers,
+        }
+
+
+def _moving_average(values: np.ndarray) -> list[float]:
+    """최근 MOVING_AVERAGE_WINDOW 개 구간의 이동 평균 목록을 반환합니다."""
+    if values.size < MOVING_AVERAGE_WINDOW:
+        return []
+    window = np.ones(MOVING_AVERAGE_WINDOW) / MOVING_AVERAGE_WINDOW
+    return np.convolve(values, window, mode="valid").tolist()
+
+
+_rows: dict[int, dict[str, Any]] = {}
+_loaded_at: float | None = None
+_cache: tuple[int, EmotionAnalytics] | None = None
+_lock = asyncio.Lock()
+
+
+@on_change
+def _apply_change(change_type: ChangeType, row: dict[str, Any]) -> None:
+    """회고 변경 사항을 메모리에 보관 중인 행에 반영합니다."""
+    if _loaded_at is None:
+        return
+    if change_type == "delete":
+        # 보관으로 인한 삭제는 보관 파일에서 계속 집계하므로 그대로 둡니다.
+        if not row.get("_archived") and not archive_store.is_archived(row["id"]):
+            _rows.pop(row["id"], None)
+    else:
+        _rows[row["id"]] = {
+            "user_id": row["user_id"],
+            "session_name": row["session_name"],
+            "emotion_score": row.get("emotion_score"),
+        }
+
+
+@on_resync
+def _schedule_full_reload() -> None:
+    """놓친 변경이 있을 수 있으므로 다음 조회 때 전체 데이터를 다시 읽습니다."""
+    global _loaded_at
+    _loaded_at = None
+
+
+async def get_emotion_analytics() -> EmotionAnalytics:
+    """
+    감정 점수 분석 결과를 반환합니다.
+
+    데이터 버전이 바뀌었을 때만 다시 계산하며,
+    데이터베이스 전체 조회는 최초 1회와 FULL_RELOAD_SECONDS 주기로만 수행합니다.
+    """
+    global _loaded_at, _cache
+
+    async with _lock:
+        if _loaded_at is None or time.monotonic() - _loaded_at > FULL_RELOAD_SECONDS:
+            started_at = time.perf_counter()
+            rows = {}
+            async for page in iter_retrospectives(
+                columns="id,user_id,session_name,emotion_score"
+            ):
+                for row in page:
+                    rows[row["id"]] = row
+            async for page in archive_store.iter_retrospectives():
+                for row in page:
+                    rows[row["id"]] = {
+                        "user_id": row["user_id"],
+                        "session_name": row["session_name"],
+                        "emotion_score": row["emotion_score"],
+                    }
+            _rows.clear()
+            _rows.update(rows)
+            _loaded_at = time.monotonic()
+            _cache = None
+            logger.info(
+                f"감정 점수 데이터 로드 완료 - Rows: {len(rows)}, "
+                f"Elapsed: {time.perf_counter() - started_at:.2f}s"
+            )
+
+        version = get_data_version()
+        if _cache is None or _cache[0] != version:
+            _cache = (version, EmotionAnalytics(list(_rows.values())))
+
+        return _cache[1]
@@ -10,6 +10,15 @@ class Settings:
 
         self.SLACK_BOT_TOKEN: str = os.getenv("SLACK_BOT_TOKEN", "")
         self.SLACK_APP_TOKEN: str = os.getenv("SLACK_APP_TOKEN", "")
+        self.SLACK_SIGNING_SECRET: str = os.getenv("SLACK_SIGNING_SECRET", "")
+        # socket: Socket Mode 로 연결, http: /slack/events 로 Events API 요청을 받습니다.
+        self.SLACK_MODE: str = os.getenv("SLACK_MODE", "socket").lower()
+        self.SOCKET_MODE_CONNECTIONS: int = int(
+            os.getenv("SOCKET_MODE_CONNECTIONS", "2")
+        )
+        self.SOCKET_MODE_MAX_AGE_MINUTES: float = float(
+            os.getenv("SOCKET_MODE_MAX_AGE_MINUTES", "0")
+        )
 
         self.ADMIN_CHANNEL: str = os.getenv("ADMIN_CHANNEL", "")
         self.SUPPORT_CHANNEL: str = os.getenv("SUPPORT_CHANNEL", "")
@@ -18,5 +27,73 @@ class Settings:
 
         self.SUPABASE_URL: str = os.getenv("SUPABASE_URL", "")
         self.SUPABASE_KEY: str = os.getenv("SUPABASE_KEY", "")
+        # Supabase(PostgREST) HTTP 연결 풀 설정
+        self.SUPABASE_HTTP2: bool = os.getenv("SUPABASE_HTTP2", "true").lower() == "true"
+        self.SUPABASE_MAX_CONNECTIONS: int = int(
+            os.getenv("SUPABASE_MAX_CONNECTIONS", "20")
+        )
+        self.SUPABASE_MAX_KEEPALIVE_CONNECTIONS: int = int(
+            os.getenv("SUPABASE_MAX_KEEPALIVE_CONNECTIONS", "10")
+        )
+        self.SUPABASE_KEEPALIVE_EXPIRY_SECONDS: float = float(
+            os.getenv("SUPABASE_KEEPALIVE_EXPIRY_SECONDS", "60")
+        )
+        self.SUPABASE_CONNECT_TIMEOUT_SECONDS: float = float(
+            os.getenv("SUPABASE_CONNECT_TIMEOUT_SECONDS", "5")
+        )
+        self.SUPABASE_TIMEOUT_SECONDS: float = float(
+            os.getenv("SUPABASE_TIMEOUT_SECONDS", "20")
+        )
+        # 시작할 때 미리 열어둘 연결 수 (HTTP/2 는 연결 하나로 요청을 함께 보냅니다)
+        self.SUPABASE_WARMUP_CONNECTIONS: int = int(
+            os.getenv("SUPABASE_WARMUP_CONNECTIONS", "2")
+        )
+
+        self.MEMBERS_CHANNEL: str = os.getenv("MEMBERS_CHANNEL", "")
+
+        self.REMINDER_OFFSETS_HOURS: list[float] = [
+            float(hours)
+            for hours in os.getenv("REMINDER_OFFSETS_HOURS", "24,3").split(",")
+            if hours.strip()
+        ]
+        self.REMINDER_DRY_RUN: bool = (
+            os.getenv("REMINDER_DRY_RUN", "false").lower() == "true"
+        )
+        self.REMINDER_RATE_PER_SECOND: float = float(
+            os.getenv("REMINDER_RATE_PER_SECOND", "1")
+        )
+
+        self.REALTIME_ENABLED: bool = (
+            os.getenv("REALTIME_ENABLED", "false").lower() == "true"
+        )
+
+        self.WARM_STORE_ENABLED: bool = (
+            os.getenv("WARM_STORE_ENABLED", "false").lower() == "true"
+        )
+
+        self.BACKUP_ENABLED: bool = (
+            os.getenv("BACKUP_ENABLED", "false").lower() == "true"
+        )
+        self.BACKUP_HOUR: int = int(os.getenv("BACKUP_HOUR", "4"))
+
+        # 종료된 기수의 회고 보관 파일을 저장할 Supabase Storage 버킷
+        self.ARCHIVE_BUCKET: str = os.getenv("ARCHIVE_BUCKET", "archive")
+
+        # 1 보다 크면 워커 프로세스를 여러 개 실행합니다. (supervisor.py)
+        self.WORKERS: int = int(os.getenv("WORKERS", "1"))
+        self.WORKER_ID: int = int(os.getenv("WORKER_ID", "0"))
+        # 스케줄러 작업을 실행할 리더 선출 방식 (file: 같은 서버, postgres: 여러 서버)
+        self.LEADER_LOCK: str = os.getenv("LEADER_LOCK", "file").lower()
+
+        # 백그라운드 작업 큐에서 동시에 실행할 작업 수 (워커 프로세스마다)
+        self.JOB_QUEUE_CONCURRENCY: int = int(os.getenv("JOB_QUEUE_CONCURRENCY", "4"))
+
+        # 파일 I/O 스레드 풀 크기와, 실행 중이거나 스레드를 기다리는 작업의 최대 수
+        self.FILE_IO_MAX_WORKERS: int = int(os.getenv("FILE_IO_MAX_WORKERS", "4"))
+        self.FILE_IO_MAX_IN_FLIGHT: int = int(os.getenv("FILE_IO_MAX_IN_FLIGHT", "64"))
+        # 실행할 자리가 날 때까지 기다리는 최대 시간(초)
+        self.FILE_IO_WAIT_TIMEOUT_SECONDS: float = float(
+            os.getenv("FILE_IO_WAIT_TIMEOUT_SECONDS", "10")
+        )
 
 settings = Settings()
@@ -3,6 +3,12 @@ from zoneinfo import ZoneInfo
 
 MAX_PASS_COUNT = 2
 
+# trigger_id 는 3초 후 만료되므로 모달을 열기 전 조회에 쓸 수 있는 최대 시간(초)
+COMMAND_PREFETCH_BUDGET_SECONDS = 1.0
+
+# 로딩 모달을 연 뒤 조회가 끝나기를 기다리는 최대 시간(초)
+COMMAND_PREFETCH_TIMEOUT_SECONDS = 10.0
+
 # 고정된 마감일 목록
 DUE_DATES = [
     datetime.datetime(
@@ -43,6 +49,9 @@ DUE_DATES = [
     datetime.datetime(2025, 12, 23, 5, 0, 0, tzinfo=ZoneInfo("Asia/Seoul")),  # 3기 추가4회차
 ]
 
+# "N기 " 접두어가 없는 회차가 속한 기수
+DEFAULT_COHORT_NAME = "2기"
+
 # 각 마감일의 설명
 # 세션 표기가 같으면 이미 제출한 것으로 처리하므로 겹치지 않게 주의할 것.
 SESSION_NAMES = [
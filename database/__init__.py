@@ -7,6 +7,9 @@ from database.retrospective import (
     update_retrospective,
     delete_retrospective,
     get_latest_retrospectives,
+    get_submitted_user_ids,
+    iter_retrospectives,
+    upsert_retrospectives_from_slack,
 )
 
 __all__ = [
@@ -17,4 +20,7 @@ __all__ = [
     "update_retrospective",
     "delete_retrospective",
     "get_latest_retrospectives",
+    "get_submitted_user_ids",
+    "iter_retrospectives",
+    "upsert_retrospectives_from_slack",
 ]
@@ -0,0 +1,378 @@
+import asyncio
+import datetime
+import hashlib
+import os
+import time
+import zlib
+from collections import defaultdict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, AsyncIterator
+
+import orjson
+from loguru import logger
+
+from config import settings
+from database.resilience import is_unavailable, supabase_resilience
+from database.supabase import supabase
+from file_io import run_file_io
+
+# 보관 파일을 내려받아 두는 로컬 캐시 경로 (원본은 Supabase Storage 에 있습니다)
+ARCHIVE_DIR = Path("store/archive")
+
+# 보관된 기수 목록(archived_cohorts)을 다시 확인하는 주기(초)
+INDEX_TTL_SECONDS = 600
+
+# 테이블이 없을 때 PostgREST 가 반환하는 오류 코드
+MISSING_TABLE_CODES = ("42P01", "PGRST205")
+
+# 보관 파일에 저장할 컬럼 (순서 유지)
+ARCHIVE_COLUMNS = (
+    "id",
+    "user_id",
+    "session_name",
+    "slack_channel",
+    "slack_ts",
+    "good_points",
+    "improvements",
+    "learnings",
+    "action_item",
+    "emotion_score",
+    "emotion_reason",
+    "created_at",
+    "updated_at",
+)
+
+
+def _is_missing(error: BaseException) -> bool:
+    """archived_cohorts 테이블이나 보관 버킷(또는 보관 파일)이 없어 실패한 오류인지 확인합니다."""
+    # PostgREST 는 없는 테이블을 42P01(undefined_table) 또는 PGRST205 로, Storage 는 404 로 알립니다.
+    return getattr(error, "code", None) in MISSING_TABLE_CODES or str(
+        getattr(error, "status", "")
+    ) == "404"
+
+
+def _cohort_key(cohort_name: str) -> str:
+    # Storage 객체 경로에는 한글을 쓸 수 없으므로 기수 이름을 16진수로 바꿉니다.
+    return f"cohort_{cohort_name.encode().hex()}"
+
+
+def _index_object(cohort_name: str) -> str:
+    return f"{_cohort_key(cohort_name)}/index.json"
+
+
+def _data_object(cohort_name: str, sha256: str) -> str:
+    # 내용의 해시를 경로에 넣어, 다시 보관해도 기존 인덱스가 가리키는 파일을 덮어쓰지 않습니다.
+    return f"{_cohort_key(cohort_name)}/{sha256[:16]}.bin"
+
+
+def _cache_path(directory: Path, cohort_name: str, sha256: str) -> Path:
+    return directory / f"{_cohort_key(cohort_name)}.{sha256[:16]}.bin"
+
+
+def build_archive(
+    cohort_name: str, rows: list[dict[str, Any]]
+) -> tuple[bytes, dict[str, Any]]:
+    """
+    기수의 회고를 사용자별 압축 블록으로 묶은 보관 파일과 인덱스를 만듭니다.
+
+    각 블록은 한 사용자의 회고를 컬럼별 배열로 모아 zlib 으로 압축한 것이며,
+    인덱스에 사용자별 (오프셋, 길이, 회고 수) 와 회고 ID -> 사용자 ID,
+    보관 파일의 SHA-256 을 기록합니다.
+
+    Returns:
+        (보관 파일 내용, 인덱스)
+    """
+    rows_by_user: dict[str, list[dict[str, Any]]] = {}
+    for row in sorted(rows, key=lambda row: row["id"]):
+        rows_by_user.setdefault(row["user_id"], []).append(row)
+
+    blocks: list[bytes] = []
+    users: dict[str, list[int]] = {}
+    offset = 0
+    for user_id, user_rows in rows_by_user.items():
+        block = zlib.compress(
+            orjson.dumps(
+                {column: [row.get(column) for row in user_rows] for column in ARCHIVE_COLUMNS}
+            ),
+            level=9,
+        )
+        users[user_id] = [offset, len(block), len(user_rows)]
+        blocks.append(block)
+        offset += len(block)
+    data = b"".join(blocks)
+    sha256 = hashlib.sha256(data).hexdigest()
+
+    index = {
+        "cohort_name": cohort_name,
+        "archived_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "row_count": len(rows),
+        "session_names": sorted({row["session_name"] for row in rows}),
+        "users": users,
+        "ids": {str(row["id"]): row["user_id"] for row in rows},
+        "data_object": _data_object(cohort_name, sha256),
+        "sha256": sha256,
+        "size": len(data),
+    }
+    return data, index
+
+
+async def upload_archive(data: bytes, index: dict[str, Any]) -> None:
+    """
+    보관 파일과 인덱스를 Storage 에 올리고, 다시 내려받아 그대로 저장되었는지 확인합니다.
+
+    보관 파일을 먼저 올리고 인덱스를 마지막에 교체하므로, 인덱스는 항상 다 올라간 파일을 가리킵니다.
+
+    Raises:
+        ValueError: 업로드에 실패했거나 내려받은 내용이 다른 경우
+    """
+    bucket = supabase.storage.from_(settings.ARCHIVE_BUCKET)
+    index_object = _index_object(index["cohort_name"])
+    index_bytes = orjson.dumps(index)
+    try:
+        await bucket.upload(
+            index["data_object"],
+            data,
+            {"content-type": "application/octet-stream", "upsert": "true"},
+        )
+        await bucket.upload(
+            index_object, index_bytes, {"content-type": "application/json", "upsert": "true"}
+        )
+
+        stored_data = await bucket.download(index["data_object"])
+        stored_index = orjson.loads(await bucket.download(index_object))
+    except Exception as e:
+        logger.error(f"보관 파일 업로드 실패 - Cohort: {index['cohort_name']}, Error: {str(e)}")
+        raise ValueError(f"보관 파일 업로드 중 오류가 발생했습니다: {str(e)}")
+
+    if stored_index != orjson.loads(index_bytes):
+        raise ValueError("Storage 에 저장된 보관 인덱스가 올린 인덱스와 다릅니다.")
+    if (await asyncio.to_thread(hashlib.sha256, stored_data)).hexdigest() != index["sha256"]:
+        raise ValueError("Storage 에 저장된 보관 파일의 해시가 인덱스와 다릅니다.")
+
+
+def _write_cache(directory: Path, path: Path, data: bytes) -> None:
+    """내려받은 보관 파일을 캐시에 저장하고, 같은 기수의 이전 캐시 파일을 지웁니다."""
+    directory.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(".tmp")
+    temp_path.write_bytes(data)
+    os.replace(temp_path, path)
+
+    cohort_key = path.name.split(".")[0]
+    for stale_path in directory.glob(f"{cohort_key}.*.bin"):
+        if stale_path != path:
+            stale_path.unlink(missing_ok=True)
+
+
+@lru_cache(maxsize=256)
+def _read_block(path: Path, offset: int, length: int) -> tuple[dict[str, Any], ...]:
+    """보관 파일에서 사용자 블록 하나를 읽어 회고 목록으로 변환합니다."""
+    with open(path, "rb") as file:
+        file.seek(offset)
+        columns = orjson.loads(zlib.decompress(file.read(length)))
+
+    return tuple(
+        dict(zip(columns.keys(), values)) for values in zip(*columns.values())
+    )
+
+
+class ArchiveStore:
+    """
+    종료된 기수의 회고 보관 파일을 읽습니다.
+
+    보관된 기수 목록은 archived_cohorts 테이블에서, 인덱스와 보관 파일은 Storage 에서 가져오므로
+    모든 서버가 같은 보관본을 읽습니다. 인덱스만 메모리에 올려 두고, 보관 파일은 해시를 확인한 뒤
+    로컬에 캐시하여 필요한 사용자 블록만 읽어 압축을 풉니다. 최근에 읽은 블록은 캐시합니다.
+    """
+
+    def __init__(self, directory: Path = ARCHIVE_DIR) -> None:
+        self._directory = directory
+        self._indexes: dict[str, dict[str, Any]] | None = None
+        self._loaded_at = 0.0
+        self._load_lock = asyncio.Lock()
+        self._data_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    async def _get_indexes(self) -> dict[str, dict[str, Any]]:
+        if (
+            self._indexes is not None
+            and time.monotonic() - self._loaded_at < INDEX_TTL_SECONDS
+        ):
+            return self._indexes
+
+        async with self._load_lock:
+            if (
+                self._indexes is not None
+                and time.monotonic() - self._loaded_at < INDEX_TTL_SECONDS
+            ):
+                return self._indexes
+
+            try:
+                self._indexes = await self._load_indexes(self._indexes or {})
+            except Exception as e:
+                if _is_missing(e):
+                    # archive.sql 을 적용하지 않았다면 보관된 기수가 없는 것으로 봅니다.
+                    logger.warning(f"보관 테이블 또는 버킷 없음, 보관 기수 없음으로 처리 - Error: {str(e)}")
+                    self._indexes = {}
+                elif self._indexes is None:
+                    if not is_unavailable(e):
+                        logger.error(f"보관 기수 로드 실패 - Error: {str(e)}")
+                        raise ValueError(f"보관 기수 조회 중 오류가 발생했습니다: {str(e)}")
+                    # 데이터베이스가 응답하지 않으면 보관된 회고 없이 조회하고, 다음 조회에서 다시 불러옵니다.
+                    logger.warning(f"보관 기수 로드 실패, 보관 기수 없음으로 처리 - Error: {str(e)}")
+                    return {}
+                else:
+                    # 이미 보관된 기수는 바뀌지 않으므로 다음 확인 때까지 기존 인덱스를 사용합니다.
+                    logger.warning(f"보관 기수 갱신 실패, 기존 목록 사용 - Error: {str(e)}")
+            self._loaded_at = time.monotonic()
+            return self._indexes
+
+    async def _load_indexes(
+        self, previous: dict[str, dict[str, Any]]
+    ) -> dict[str, dict[str, Any]]:
+        """archived_cohorts 에 기록된 기수의 인덱스를 가져옵니다. (바뀌지 않은 인덱스는 다시 받지 않습니다)"""
+
+        async def fetch_cohorts() -> list[dict[str, Any]]:
+            result = await (
+                supabase.table("archived_cohorts").select("cohort_name,archived_at").execute()
+            )
+            return result.data
+
+        cohorts = await supabase_resilience.call(
+            "get_archived_cohorts", fetch_cohorts, hedge=True
+        )
+
+        async def fetch_index(cohort_name: str) -> dict[str, Any]:
+            data = await supabase.storage.from_(settings.ARCHIVE_BUCKET).download(
+                _index_object(cohort_name)
+            )
+            return orjson.loads(data)
+
+        stale = [
+            cohort["cohort_name"]
+            for cohort in cohorts
+            if cohort["cohort_name"] not in previous
+            or datetime.datetime.fromisoformat(previous[cohort["cohort_name"]]["archived_at"])
+            != datetime.datetime.fromisoformat(cohort["archived_at"])
+        ]
+        fetched = dict(zip(stale, await asyncio.gather(*(fetch_index(name) for name in stale))))
+        indexes = {
+            cohort["cohort_name"]: fetched.get(cohort["cohort_name"])
+            or previous[cohort["cohort_name"]]
+            for cohort in sorted(cohorts, key=lambda cohort: cohort["cohort_name"])
+        }
+        if stale:
+            logger.info(f"보관 기수 로드 완료 - Cohorts: {list(indexes)}")
+        return indexes
+
+    async def _get_data_path(self, index: dict[str, Any]) -> Path:
+        """보관 파일의 로컬 캐시 경로를 반환합니다. 캐시가 없으면 Storage 에서 내려받습니다."""
+        path = _cache_path(self._directory, index["cohort_name"], index["sha256"])
+        if await run_file_io(path.exists):
+            return path
+
+        async with self._data_locks[index["cohort_name"]]:
+            if await run_file_io(path.exists):
+                return path
+
+            data = await supabase.storage.from_(settings.ARCHIVE_BUCKET).download(
+                index["data_object"]
+            )
+            if (await asyncio.to_thread(hashlib.sha256, data)).hexdigest() != index["sha256"]:
+                raise ValueError(
+                    f"보관 파일의 해시가 인덱스와 다릅니다. - Cohort: {index['cohort_name']}"
+                )
+            await run_file_io(_write_cache, self._directory, path, data)
+            logger.info(
+                f"보관 파일 캐시 완료 - Cohort: {index['cohort_name']}, Size: {len(data)}"
+            )
+            return path
+
+    def reload(self) -> None:
+        """보관 기수가 바뀌었을 때 다음 조회에서 목록과 인덱스를 다시 확인하도록 합니다."""
+        self._loaded_at = 0.0
+        _read_block.cache_clear()
+
+    def is_archived(self, retrospective_id: int) -> bool:
+        """
+        이미 불러온 인덱스 기준으로 보관된 회고인지 확인합니다.
+
+        변경 리스너처럼 기다릴 수 없는 곳에서 사용하며, 인덱스를 불러오기 전에는 False 를 반환합니다.
+        """
+        return any(
+            str(retrospective_id) in index["ids"] for index in (self._indexes or {}).values()
+        )
+
+    async def get_archived_ids(self) -> set[int]:
+        """보관된 회고 ID 전체를 반환합니다."""
+        return {
+            int(retrospective_id)
+            for index in (await self._get_indexes()).values()
+            for retrospective_id in index["ids"]
+        }
+
+    async def get_cohort_names(self) -> list[str]:
+        """보관된 기수 이름 목록을 반환합니다."""
+        return list(await self._get_indexes())
+
+    async def _read_user(self, cohort_name: str, user_id: str) -> list[dict[str, Any]]:
+        index = (await self._get_indexes())[cohort_name]
+        location = index["users"].get(user_id)
+        if location is None:
+            return []
+
+        offset, length, _ = location
+        block = await run_file_io(
+            _read_block, await self._get_data_path(index), offset, length
+        )
+        return [dict(row) for row in block]
+
+    async def get_retrospectives_by_user_id(self, user_id: str) -> list[dict[str, Any]]:
+        """보관된 기수 전체에서 사용자의 회고를 조회합니다."""
+        rows = []
+        for cohort_name in await self._get_indexes():
+            rows.extend(await self._read_user(cohort_name, user_id))
+        return rows
+
+    async def get_retrospective_by_id(self, retrospective_id: int) -> dict[str, Any] | None:
+        """보관된 회고를 ID로 조회합니다. 없으면 None 을 반환합니다."""
+        for cohort_name, index in (await self._get_indexes()).items():
+            user_id = index["ids"].get(str(retrospective_id))
+            if user_id is None:
+                continue
+            for row in await self._read_user(cohort_name, user_id):
+                if row["id"] == retrospective_id:
+                    return row
+        return None
+
+    async def iter_retrospectives(
+        self,
+        session_names: list[str] | None = None,
+        cohort_names: list[str] | None = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        보관된 회고를 사용자 블록 단위로 조회합니다.
+
+        Args:
+            session_names: 조회할 회차 이름 목록 (기본값: 전체)
+            cohort_names: 조회할 기수 이름 목록 (기본값: 전체)
+
+        Yields:
+            회고 데이터 목록
+        """
+        for cohort_name, index in (await self._get_indexes()).items():
+            if cohort_names is not None and cohort_name not in cohort_names:
+                continue
+            if session_names is not None and not set(index["session_names"]) & set(
+                session_names
+            ):
+                continue
+
+            for user_id in index["users"]:
+                rows = await self._read_user(cohort_name, user_id)
+                if session_names is not None:
+                    rows = [row for row in rows if row["session_name"] in session_names]
+                if rows:
+                    yield rows
+
+
+archive_store = ArchiveStore()
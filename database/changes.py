@@ -0,0 +1,83 @@
+import inspect
+from typing import Any, Awaitable, Callable, Literal
+
+from loguru import logger
+
+ChangeType = Literal["insert", "update", "delete"]
+ChangeListener = Callable[[ChangeType, dict[str, Any]], Awaitable[None] | None]
+ResyncListener = Callable[[], Awaitable[None] | None]
+
+_listeners: list[ChangeListener] = []
+_resync_listeners: list[ResyncListener] = []
+_data_version = 0
+_feed_active = False
+
+
+def on_change(listener: ChangeListener) -> ChangeListener:
+    """회고 데이터 변경 시 호출할 리스너를 등록합니다. 데코레이터로 사용할 수 있습니다."""
+    _listeners.append(listener)
+    return listener
+
+
+def on_resync(listener: ResyncListener) -> ResyncListener:
+    """
+    변경 알림을 놓쳤을 수 있을 때 호출할 리스너를 등록합니다. 데코레이터로 사용할 수 있습니다.
+
+    변경 피드가 끊겼다가 다시 연결되면 호출되며, 캐시를 비우거나 다시 읽어야 합니다.
+    """
+    _resync_listeners.append(listener)
+    return listener
+
+
+def set_change_feed_active(active: bool) -> None:
+    """데이터베이스 변경 피드 구독 상태를 설정합니다."""
+    global _feed_active
+    _feed_active = active
+
+
+def is_change_feed_active() -> bool:
+    """
+    데이터베이스의 모든 변경(대시보드 직접 수정 포함)이 알림으로 전달되고 있는지 반환합니다.
+
+    True 일 때만 변경 알림으로 무효화하는 조회 캐시를 사용할 수 있습니다.
+    """
+    return _feed_active
+
+
+def get_data_version() -> int:
+    """회고 데이터 변경 시마다 증가하는 버전을 반환합니다. 캐시 무효화에 사용합니다."""
+    return _data_version
+
+
+async def notify_change(change_type: ChangeType, row: dict[str, Any]) -> None:
+    """
+    회고 데이터 변경을 등록된 리스너에 알립니다.
+
+    리스너에서 발생한 오류는 기록만 하고 다른 리스너 호출을 막지 않습니다.
+    """
+    global _data_version
+    _data_version += 1
+
+    for listener in _listeners:
+        try:
+            result = listener(change_type, row)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.error(
+                f"회고 변경 리스너 실패 - {change_type} ID: {row.get('id')}, Error: {str(e)}"
+            )
+
+
+async def notify_resync() -> None:
+    """등록된 리스너에 캐시를 다시 맞추도록 알립니다."""
+    global _data_version
+    _data_version += 1
+
+    for listener in _resync_listeners:
+        try:
+            result = listener()
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.error(f"회고 재동기화 리스너 실패 - Error: {str(e)}")
@@ -0,0 +1,217 @@
+import asyncio
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Any, Callable, Protocol
+
+from loguru import logger
+
+from config import settings
+from database.changes import (
+    ChangeType,
+    notify_change,
+    notify_resync,
+    on_change,
+    set_change_feed_active,
+)
+
+# 봇이 직접 알린 변경을 기억해 둘 최대 개수 (피드로 다시 들어오면 건너뜁니다)
+RECENT_LOCAL_CHANGES = 1000
+
+SubscribeCallback = Callable[[str, Exception | None], None]
+
+# 변경 피드에서 받은 변경을 전달하는 중인지 여부
+_from_feed: ContextVar[bool] = ContextVar("_from_feed", default=False)
+
+
+class ChangeChannel(Protocol):
+    """Supabase Realtime 채널 중 변경 피드에서 사용하는 기능"""
+
+    def on_postgres_changes(
+        self,
+        event: str,
+        callback: Callable[[dict[str, Any]], None],
+        table: str | None = None,
+        schema: str | None = None,
+    ) -> "ChangeChannel": ...
+
+    async def subscribe(self, callback: SubscribeCallback | None = None) -> Any: ...
+
+    async def unsubscribe(self) -> None: ...
+
+
+def _change_key(change_type: str, row: dict[str, Any]) -> tuple:
+    # 삭제 알림에는 기본 키만 담겨 오므로 수정 시각은 비교하지 않습니다.
+    return (
+        change_type,
+        row.get("id"),
+        None if change_type == "delete" else row.get("updated_at"),
+    )
+
+
+class ChangeFeed:
+    """
+    retrospectives 테이블의 Postgres 변경을 구독해 notify_change 로 전달합니다.
+
+    대시보드에서 직접 수정한 경우에도 메모리 캐시와 검색 색인이 맞춰집니다.
+    봇이 직접 저장하며 이미 알린 변경은 건너뛰고, 연결이 끊겼다가 다시 구독되면
+    그 사이 놓친 변경을 반영하도록 notify_resync 를 호출합니다.
+    """
+
+    def __init__(self) -> None:
+        self._channel: ChangeChannel | None = None
+        self._subscribed_once = False
+        self._local_changes: OrderedDict[tuple, None] = OrderedDict()
+        self._tasks: set[asyncio.Task] = set()
+        self.received_count = 0
+        self.skipped_count = 0
+        self.resync_count = 0
+
+    def remember_local_change(self, change_type: ChangeType, row: dict[str, Any]) -> None:
+        """봇이 직접 알린 변경을 기록합니다."""
+        self._local_changes[_change_key(change_type, row)] = None
+        while len(self._local_changes) > RECENT_LOCAL_CHANGES:
+            self._local_changes.popitem(last=False)
+
+    async def start(self, channel: ChangeChannel) -> None:
+        """
+        채널에 변경 구독을 등록합니다.
+
+        Args:
+            channel: Supabase Realtime 채널 (테스트에서는 LocalChangePublisher)
+        """
+        self._channel = channel
+        channel.on_postgres_changes(
+            "*", self._handle_payload, table="retrospectives", schema="public"
+        )
+        await channel.subscribe(self._handle_state)
+
+    async def stop(self) -> None:
+        """구독을 해제합니다."""
+        set_change_feed_active(False)
+        if self._channel is not None:
+            await self._channel.unsubscribe()
+            self._channel = None
+
+    def _spawn(self, coroutine) -> None:
+        task = asyncio.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _handle_state(self, state: str, error: Exception | None) -> None:
+        if state != "SUBSCRIBED":
+            set_change_feed_active(False)
+            logger.warning(f"회고 변경 피드 구독 상태 변경 - State: {state}, Error: {error}")
+            return
+
+        # 처음 구독할 때는 각 캐시가 비어 있으므로 다시 맞출 필요가 없습니다.
+        if self._subscribed_once:
+            self.resync_count += 1
+            logger.info("회고 변경 피드 재연결 - 캐시를 다시 맞춥니다.")
+            self._spawn(notify_resync())
+        self._subscribed_once = True
+        set_change_feed_active(True)
+        logger.info("회고 변경 피드 구독 완료")
+
+    def _handle_payload(self, payload: dict[str, Any]) -> None:
+        data = payload.get("data", payload)
+        change_type = data["type"].lower()
+        row = data.get("old_record") if change_type == "delete" else data.get("record")
+        if not row:
+            return
+
+        self.received_count += 1
+        key = _change_key(change_type, row)
+        if key in self._local_changes:
+            del self._local_changes[key]
+            self.skipped_count += 1
+            return
+
+        self._spawn(self._dispatch(change_type, row))
+
+    async def _dispatch(self, change_type: ChangeType, row: dict[str, Any]) -> None:
+        _from_feed.set(True)
+        await notify_change(change_type, row)
+
+
+class LocalChangePublisher:
+    """
+    테스트와 로컬 개발용 변경 채널입니다.
+
+    Supabase Realtime 채널과 같은 방식으로 ChangeFeed 에 연결되며,
+    publish 로 변경을 보내고 disconnect/reconnect 로 재연결을 흉내 낼 수 있습니다.
+    """
+
+    def __init__(self) -> None:
+        self._callbacks: list[Callable[[dict[str, Any]], None]] = []
+        self._state_callback: SubscribeCallback | None = None
+
+    def on_postgres_changes(
+        self,
+        event: str,
+        callback: Callable[[dict[str, Any]], None],
+        table: str | None = None,
+        schema: str | None = None,
+    ) -> "LocalChangePublisher":
+        self._callbacks.append(callback)
+        return self
+
+    async def subscribe(
+        self, callback: SubscribeCallback | None = None
+    ) -> "LocalChangePublisher":
+        self._state_callback = callback
+        self.reconnect()
+        return self
+
+    async def unsubscribe(self) -> None:
+        self._callbacks.clear()
+        self._state_callback = None
+
+    def publish(
+        self,
+        change_type: ChangeType,
+        record: dict[str, Any] | None = None,
+        old_record: dict[str, Any] | None = None,
+    ) -> None:
+        """Postgres 변경 알림과 같은 형식으로 변경을 보냅니다."""
+        payload = {
+            "data": {
+                "type": change_type.upper(),
+                "schema": "public",
+                "table": "retrospectives",
+                "record": record or {},
+                "old_record": old_record or {},
+            }
+        }
+        for callback in self._callbacks:
+            callback(payload)
+
+    def disconnect(self) -> None:
+        if self._state_callback:
+            self._state_callback("CLOSED", None)
+
+    def reconnect(self) -> None:
+        if self._state_callback:
+            self._state_callback("SUBSCRIBED", None)
+
+
+change_feed = ChangeFeed()
+
+
+async def start_change_feed() -> None:
+    """설정된 경우 Supabase Realtime 변경 피드 구독을 시작합니다."""
+    if not settings.REALTIME_ENABLED:
+        return
+
+    from database.supabase import supabase
+
+    try:
+        await change_feed.start(supabase.channel("retrospectives-changes"))
+    except Exception as e:
+        logger.error(f"회고 변경 피드 구독 실패 - Error: {str(e)}")
+
+
+@on_change
+def _remember_local_change(change_type: ChangeType, row: dict[str, Any]) -> None:
+    """피드로 되돌아올 봇의 변경을 기록합니다."""
+    if change_feed._channel is not None and not _from_feed.get():
+        change_feed.remember_local_change(change_type, row)
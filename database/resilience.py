@@ -0,0 +1,234 @@
+import asyncio
+import time
+from collections import Counter, defaultdict, deque
+from typing import Any, Awaitable, Callable, TypeVar
+
+from loguru import logger
+
+from exception import CircuitOpenException
+
+T = TypeVar("T")
+
+# 작업 종류별 최대 대기 시간(초)
+READ_TIMEOUT_SECONDS = 3
+WRITE_TIMEOUT_SECONDS = 5
+BULK_TIMEOUT_SECONDS = 15
+
+# 조회가 이 시간(초) 안에 끝나지 않으면 같은 조회를 한 번 더 보내 먼저 끝난 결과를 사용합니다.
+HEDGE_AFTER_SECONDS = 0.5
+
+# 연속으로 이 횟수만큼 실패하면 회로를 열어 요청을 보내지 않고 바로 실패합니다.
+FAILURE_THRESHOLD = 5
+
+# 회로를 연 뒤 이 시간(초)이 지나면 요청 하나로 다시 시도해 봅니다.
+OPEN_SECONDS = 30
+
+# 회로 상태
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def _is_failure(error: BaseException) -> bool:
+    """
+    회로 차단기에 실패로 기록할 오류인지 확인합니다.
+
+    응답 시간 초과, 연결 오류, 게이트웨이 오류(5xx), 쿼리 시간 초과만 실패로 보고,
+    데이터베이스가 응답한 오류(제약 조건 위반 등)는 정상 응답으로 봅니다.
+    """
+    if isinstance(error, (TimeoutError, OSError)):
+        return True
+
+    # postgrest 의 APIError 는 JSON 이 아닌 응답(게이트웨이 오류)에 HTTP 상태 코드를 담습니다.
+    code = getattr(error, "code", None)
+    if (isinstance(code, int) and code >= 500) or code == "57014":
+        return True
+
+    import httpx
+
+    return isinstance(error, httpx.TransportError)
+
+
+def is_unavailable(error: BaseException) -> bool:
+    """저장소가 응답하지 않아 실패한 오류인지 확인합니다. (회로가 열린 경우 포함)"""
+    return isinstance(error, CircuitOpenException) or _is_failure(error)
+
+
+class CircuitBreaker:
+    """
+    연속으로 실패하면 일정 시간 동안 요청을 보내지 않는 회로 차단기입니다.
+
+    열린 회로는 OPEN_SECONDS 가 지나면 반쯤 열린 상태가 되어 요청 하나만 보내 보고,
+    성공하면 닫고 실패하면 다시 엽니다.
+    """
+
+    def __init__(self, name: str, failure_threshold: int, open_seconds: float) -> None:
+        self.name = name
+        self.state = CLOSED
+        self._failure_threshold = failure_threshold
+        self._open_seconds = open_seconds
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._transitions: Counter[str] = Counter()
+        self._recent_transitions: deque[dict[str, Any]] = deque(maxlen=20)
+
+    def allow(self) -> bool:
+        """요청을 보내도 되는지 확인합니다."""
+        if self.state == OPEN:
+            if time.monotonic() - self._opened_at < self._open_seconds:
+                return False
+            self._set_state(HALF_OPEN)
+
+        if self.state == HALF_OPEN:
+            if self._probing:
+                return False
+            self._probing = True
+        return True
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._probing = False
+        if self.state != CLOSED:
+            self._set_state(CLOSED)
+
+    def record_cancel(self) -> None:
+        """요청이 취소되어 결과를 알 수 없으면, 다른 요청으로 다시 시도해 볼 수 있게 합니다."""
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        self._probing = False
+        if self.state == HALF_OPEN or self._failures >= self._failure_threshold:
+            self._opened_at = time.monotonic()
+            if self.state != OPEN:
+                self._set_state(OPEN)
+
+    def _set_state(self, state: str) -> None:
+        logger.warning(f"회로 상태 변경 - {self.name}: {self.state} -> {state}")
+        self._transitions[f"{self.state}->{state}"] += 1
+        self._recent_transitions.append(
+            {"from": self.state, "to": state, "at": time.time()}
+        )
+        self.state = state
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "transitions": dict(self._transitions),
+            "recent_transitions": list(self._recent_transitions),
+        }
+
+
+class Resilience:
+    """
+    외부 저장소 호출에 시간 제한, 회로 차단기, 중복 조회(hedging), 대체 결과를 적용합니다.
+
+    저장소가 느려져도 핸들러가 무한정 기다리지 않고 정해진 시간 안에 실패하거나,
+    캐시 등 대체 결과로 응답할 수 있도록 합니다.
+    """
+
+    def __init__(self, breaker: CircuitBreaker) -> None:
+        self.breaker = breaker
+        self._stats: defaultdict[str, Counter[str]] = defaultdict(Counter)
+
+    async def call(
+        self,
+        operation: str,
+        request: Callable[[], Awaitable[T]],
+        timeout: float = READ_TIMEOUT_SECONDS,
+        hedge: bool = False,
+        fallback: Callable[[], Awaitable[T | None]] | None = None,
+    ) -> T:
+        """
+        저장소를 호출합니다.
+
+        Args:
+            operation: 작업 이름 (지표에 사용합니다)
+            request: 호출할 때마다 새 요청을 만드는 함수
+            timeout: 최대 대기 시간(초)
+            hedge: 여러 번 보내도 되는 조회라면 느릴 때 한 번 더 보냅니다.
+            fallback: 호출에 실패했을 때 대신 사용할 결과를 반환하는 함수 (None 이면 실패)
+
+        Raises:
+            CircuitOpenException: 회로가 열려 있고 대체 결과가 없는 경우
+        """
+        stats = self._stats[operation]
+        stats["calls"] += 1
+
+        if not self.breaker.allow():
+            stats["rejected"] += 1
+            error: Exception = CircuitOpenException(
+                "데이터베이스 응답이 지연되고 있어요. 잠시 후 다시 시도해주세요."
+            )
+        else:
+            try:
+                if hedge:
+                    result = await self._hedged(stats, request, timeout)
+                else:
+                    result = await asyncio.wait_for(request(), timeout=timeout)
+            except asyncio.CancelledError:
+                self.breaker.record_cancel()
+                raise
+            except Exception as e:
+                if not _is_failure(e):
+                    self.breaker.record_success()
+                    raise
+                self.breaker.record_failure()
+                stats["timeouts" if isinstance(e, TimeoutError) else "failures"] += 1
+                error = e
+            else:
+                self.breaker.record_success()
+                return result
+
+        if fallback is not None and (value := await fallback()) is not None:
+            stats["fallbacks"] += 1
+            logger.warning(f"대체 결과 사용 - {operation}: {type(error).__name__}")
+            return value
+        raise error
+
+    async def _hedged(
+        self,
+        stats: Counter[str],
+        request: Callable[[], Awaitable[T]],
+        timeout: float,
+    ) -> T:
+        """요청이 HEDGE_AFTER_SECONDS 안에 끝나지 않으면 한 번 더 보내고 먼저 성공한 결과를 반환합니다."""
+        first = asyncio.ensure_future(request())
+        tasks = [first]
+        try:
+            async with asyncio.timeout(timeout):
+                done, _ = await asyncio.wait(tasks, timeout=HEDGE_AFTER_SECONDS)
+                if not done:
+                    stats["hedges"] += 1
+                    tasks.append(asyncio.ensure_future(request()))
+
+                pending = set(tasks)
+                while True:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        if task.exception() is None:
+                            if task is not first:
+                                stats["hedge_wins"] += 1
+                            return task.result()
+                        error = task.exception()
+                    if not pending:
+                        # 보낸 요청이 모두 실패했습니다.
+                        raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            "breaker": self.breaker.metrics(),
+            "operations": {name: dict(stats) for name, stats in self._stats.items()},
+        }
+
+
+supabase_resilience = Resilience(
+    CircuitBreaker("supabase", FAILURE_THRESHOLD, OPEN_SECONDS)
+)
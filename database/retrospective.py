@@ -1,8 +1,41 @@
-from typing import Any
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Hashable
 
 from loguru import logger
 
+from exception import ConflictException
+from database.archive import archive_store
+from database.changes import (
+    ChangeType,
+    is_change_feed_active,
+    notify_change,
+    on_change,
+    on_resync,
+)
+from database.resilience import (
+    BULK_TIMEOUT_SECONDS,
+    WRITE_TIMEOUT_SECONDS,
+    is_unavailable,
+    supabase_resilience,
+)
 from database.supabase import supabase
+from database.warm_store import warm_store
+
+# 조회 캐시 (변경 피드가 구독 중일 때만 바로 사용하며 변경 알림으로 무효화합니다)
+# (변경 피드가 없어도 채워두었다가, 데이터베이스가 응답하지 않을 때 대체 결과로 사용합니다)
+_submitted_cache: OrderedDict[tuple[str, str], bool] = OrderedDict()
+_user_cache: OrderedDict[str, list[dict[str, Any]]] = OrderedDict()
+_latest_cache: dict[int, list[dict[str, Any]]] = {}
+
+# 조회 캐시에 보관할 최대 항목 수 (가장 오래전에 저장한 항목부터 지웁니다)
+SUBMITTED_CACHE_LIMIT = 5000
+USER_CACHE_LIMIT = 500
+
+# 미뤄둔 회고 저장의 최대 시도 횟수 (데이터베이스 장애가 길어져도 1시간 가까이 다시 시도합니다)
+DEFERRED_SAVE_MAX_ATTEMPTS = 12
+
+# 유니크 인덱스 위반 오류 코드 (PostgreSQL unique_violation)
+UNIQUE_VIOLATION = "23505"
 
 
 async def create_retrospective(
@@ -32,8 +65,12 @@ async def create_retrospective(
         emotion_score: 감정 점수 (1-10)
         emotion_reason: 감정 점수 이유
 
+    Raises:
+        ConflictException: 같은 회차에 제출한 회고가 이미 있는 경우
+
     Returns:
-        저장된 회고 데이터
+        저장된 회고 데이터. 데이터베이스가 응답하지 않아 저장을 작업 큐에 맡긴 경우에는
+        deferred 가 True 이고 id, created_at 이 None 입니다. (아직 저장되지 않았습니다)
     """
     try:
         data = {
@@ -50,16 +87,36 @@ async def create_retrospective(
         }
 
         # Supabase에 데이터 삽입
-        result = await supabase.table("retrospectives").insert(data).execute()
+        try:
+            rows = await supabase_resilience.call(
+                "create_retrospective",
+                lambda: _execute(supabase.table("retrospectives").insert(data)),
+                timeout=WRITE_TIMEOUT_SECONDS,
+            )
+        except Exception as e:
+            if getattr(e, "code", None) == UNIQUE_VIOLATION:
+                # 다른 워커가 같은 회차의 회고를 먼저 저장했습니다. (database/schemas/submission.sql)
+                raise ConflictException(f"`{session_name}` 회고를 이미 제출했습니다.")
+            if not is_unavailable(e):
+                raise
+            # 데이터베이스가 응답하지 않으면 작업 큐에 맡겨 나중에 저장합니다. (outbox)
+            # 시간이 초과되었지만 실제로는 저장된 경우에도 같은 회차의 회고는 한 번만 저장됩니다.
+            await _defer_create_retrospective(data, e)
+            return {**data, "id": None, "created_at": None, "deferred": True}
 
         # 결과 확인 및 반환
-        if len(result.data) > 0:
+        if len(rows) > 0:
             logger.info(f"회고 저장 성공 - User: {user_id}")
-            return result.data[0]
+            await notify_change("insert", rows[0])
+            return rows[0]
         else:
             logger.error(f"회고 저장 실패 - User: {user_id}, 결과 없음")
             raise ValueError("회고 저장에 실패했습니다.")
 
+    except ConflictException as e:
+        logger.warning(f"회고 저장 충돌 - User: {user_id}, Error: {str(e)}")
+        raise
+
     except Exception as e:
         logger.error(f"회고 저장 실패 - User: {user_id}, Error: {str(e)}")
         raise ValueError(f"회고 저장 중 오류가 발생했습니다: {str(e)}")
@@ -76,15 +133,25 @@ async def get_retrospective_by_id(retrospective_id: int) -> dict[str, Any]:
         회고 데이터
     """
     try:
-        result = (
-            await supabase.table("retrospectives")
-            .select("*")
-            .eq("id", retrospective_id)
-            .execute()
+        if warm_store.is_ready() and (
+            cached := warm_store.get_by_id(retrospective_id)
+        ):
+            return cached
+
+        rows = await supabase_resilience.call(
+            "get_retrospective_by_id",
+            lambda: _execute(
+                supabase.table("retrospectives").select("*").eq("id", retrospective_id)
+            ),
+            hedge=True,
         )
 
-        if len(result.data) > 0:
-            return result.data[0]
+        if len(rows) > 0:
+            return rows[0]
+
+        # 보관된 기수의 회고인지 확인합니다.
+        if archived := await archive_store.get_retrospective_by_id(retrospective_id):
+            return archived
         else:
             raise ValueError(
                 f"ID {retrospective_id}에 해당하는 회고를 찾을 수 없습니다."
@@ -99,6 +166,8 @@ async def get_retrospectives_by_user_id(user_id: str) -> list[dict[str, Any]]:
     """
     사용자 ID로 회고 데이터를 조회합니다.
 
+    보관된 기수의 회고도 함께 최신순으로 반환합니다.
+
     Args:
         user_id: 사용자 ID
 
@@ -106,15 +175,45 @@ async def get_retrospectives_by_user_id(user_id: str) -> list[dict[str, Any]]:
         회고 데이터 목록
     """
     try:
-        result = (
-            await supabase.table("retrospectives")
-            .select("*")
-            .eq("user_id", user_id)
-            .order("created_at", desc=True)
-            .execute()
-        )
+        rows = _user_cache.get(user_id) if is_change_feed_active() else None
+        if rows is None and warm_store.is_ready():
+            # 현재 기수 회고는 메모리에서, 이전 기수 회고가 있을 때만 데이터베이스에서 조회합니다.
+            rows = warm_store.get_by_user(user_id)
+            if warm_store.has_history(user_id):
+                # 데이터베이스가 응답하지 않으면 현재 기수 회고만 반환합니다.
+                history = await supabase_resilience.call(
+                    "get_retrospectives_by_user_id",
+                    lambda: _execute(
+                        supabase.table("retrospectives")
+                        .select("*")
+                        .eq("user_id", user_id)
+                        .not_.in_("session_name", list(warm_store.session_names))
+                        .order("created_at", desc=True)
+                    ),
+                    hedge=True,
+                    fallback=lambda: _cached([]),
+                )
+                rows = sorted(
+                    rows + history, key=lambda row: row["created_at"], reverse=True
+                )
+        elif rows is None:
+            rows = await supabase_resilience.call(
+                "get_retrospectives_by_user_id",
+                lambda: _execute(
+                    supabase.table("retrospectives")
+                    .select("*")
+                    .eq("user_id", user_id)
+                    .order("created_at", desc=True)
+                ),
+                hedge=True,
+                fallback=lambda: _cached(_user_cache.get(user_id)),
+            )
+            _remember(_user_cache, user_id, rows, USER_CACHE_LIMIT)
 
-        return result.data
+        archived = await archive_store.get_retrospectives_by_user_id(user_id)
+        if not archived:
+            return list(rows)
+        return sorted(rows + archived, key=lambda row: row["created_at"], reverse=True)
 
     except Exception as e:
         logger.error(f"사용자 회고 조회 실패 - User: {user_id}, Error: {str(e)}")
@@ -133,17 +232,26 @@ async def check_user_submitted_this_session(user_id: str, session_name: str) ->
         제출 여부 (True/False)
     """
     try:
-        query = (
-            supabase.table("retrospectives")
-            .select("id")
-            .eq("user_id", user_id)
-            .eq("session_name", session_name)
+        if warm_store.covers_submissions(session_name):
+            return warm_store.has_submitted(user_id, session_name)
+
+        cache_key = (user_id, session_name)
+        if is_change_feed_active() and cache_key in _submitted_cache:
+            return _submitted_cache[cache_key]
+
+        submitted = await supabase_resilience.call(
+            "check_user_submitted_this_session",
+            lambda: _execute_exists(
+                supabase.table("retrospectives")
+                .select("id")
+                .eq("user_id", user_id)
+                .eq("session_name", session_name)
+            ),
+            hedge=True,
+            fallback=lambda: _cached(_submitted_cache.get(cache_key)),
         )
-
-        result = await query.execute()
-
-        # 결과가 있으면 제출한 것으로 판단
-        return len(result.data) > 0
+        _remember(_submitted_cache, cache_key, submitted, SUBMITTED_CACHE_LIMIT)
+        return submitted
 
     except Exception as e:
         logger.error(f"회고 제출 확인 실패 - User: {user_id}, Error: {str(e)}")
@@ -152,7 +260,9 @@ async def check_user_submitted_this_session(user_id: str, session_name: str) ->
 
 
 async def update_retrospective(
-    retrospective_id: int, data: dict[str, Any]
+    retrospective_id: int,
+    data: dict[str, Any],
+    expected_updated_at: str | None = None,
 ) -> dict[str, Any]:
     """
     회고 데이터를 업데이트합니다.
@@ -160,25 +270,49 @@ async def update_retrospective(
     Args:
         retrospective_id: 회고 ID
         data: 업데이트할 데이터
+        expected_updated_at: 수정 화면을 열 때의 updated_at (그 사이 다른 곳에서 수정했다면
+            덮어쓰지 않고 ConflictException 을 발생시킵니다)
 
     Returns:
         업데이트된 회고 데이터
     """
     try:
-        result = (
-            await supabase.table("retrospectives")
-            .update(data)
-            .eq("id", retrospective_id)
-            .execute()
+        query = (
+            supabase.table("retrospectives").update(data).eq("id", retrospective_id)
+        )
+        if expected_updated_at is not None:
+            query = query.eq("updated_at", expected_updated_at)
+        rows = await supabase_resilience.call(
+            "update_retrospective",
+            lambda: _execute(query),
+            timeout=WRITE_TIMEOUT_SECONDS,
         )
 
-        if len(result.data) > 0:
+        if len(rows) > 0:
             logger.info(f"회고 업데이트 성공 - ID: {retrospective_id}")
-            return result.data[0]
-        else:
-            raise ValueError(
-                f"ID {retrospective_id}에 해당하는 회고를 찾을 수 없습니다."
+            await notify_change("update", rows[0])
+            return rows[0]
+
+        if expected_updated_at is not None:
+            current = await supabase_resilience.call(
+                "update_retrospective",
+                lambda: _execute(
+                    supabase.table("retrospectives")
+                    .select("id,updated_at")
+                    .eq("id", retrospective_id)
+                ),
             )
+            if current:
+                raise ConflictException(
+                    f"ID {retrospective_id} 회고가 그 사이 수정되었습니다. "
+                    "다시 불러와서 수정해주세요."
+                )
+
+        raise ValueError(f"ID {retrospective_id}에 해당하는 회고를 찾을 수 없습니다.")
+
+    except ConflictException as e:
+        logger.warning(f"회고 업데이트 충돌 - ID: {retrospective_id}, Error: {str(e)}")
+        raise
 
     except Exception as e:
         logger.error(f"회고 업데이트 실패 - ID: {retrospective_id}, Error: {str(e)}")
@@ -196,15 +330,17 @@ async def delete_retrospective(retrospective_id: int) -> bool:
         삭제 성공 여부
     """
     try:
-        result = (
-            await supabase.table("retrospectives")
-            .delete()
-            .eq("id", retrospective_id)
-            .execute()
+        rows = await supabase_resilience.call(
+            "delete_retrospective",
+            lambda: _execute(
+                supabase.table("retrospectives").delete().eq("id", retrospective_id)
+            ),
+            timeout=WRITE_TIMEOUT_SECONDS,
         )
 
-        if len(result.data) > 0:
+        if len(rows) > 0:
             logger.info(f"회고 삭제 성공 - ID: {retrospective_id}")
+            await notify_change("delete", rows[0])
             return True
         else:
             logger.warning(f"삭제할 회고가 없음 - ID: {retrospective_id}")
@@ -226,16 +362,224 @@ async def get_latest_retrospectives(limit: int = 10) -> list[dict[str, Any]]:
         최근 회고 데이터 목록
     """
     try:
-        result = (
-            await supabase.table("retrospectives")
-            .select("*")
-            .order("created_at", desc=True)
-            .limit(limit)
-            .execute()
+        if warm_store.is_ready() and (latest := warm_store.get_latest(limit)):
+            return latest
+
+        if is_change_feed_active() and limit in _latest_cache:
+            return list(_latest_cache[limit])
+
+        rows = await supabase_resilience.call(
+            "get_latest_retrospectives",
+            lambda: _execute(
+                supabase.table("retrospectives")
+                .select("*")
+                .order("created_at", desc=True)
+                .limit(limit)
+            ),
+            hedge=True,
+            fallback=lambda: _cached(_latest_cache.get(limit)),
         )
 
-        return result.data
+        _latest_cache[limit] = rows
+        return list(rows)
 
     except Exception as e:
         logger.error(f"최근 회고 조회 실패 - Error: {str(e)}")
         raise ValueError(f"회고 조회 중 오류가 발생했습니다: {str(e)}")
+
+
+@on_change
+def _invalidate_caches(change_type: ChangeType, row: dict[str, Any]) -> None:
+    """회고 변경 시 영향을 받는 조회 캐시를 비웁니다."""
+    _latest_cache.clear()
+
+    user_id = row.get("user_id")
+    if user_id is None:
+        # 삭제 알림에는 기본 키만 담겨 올 수 있으므로 사용자를 알 수 없으면 모두 비웁니다.
+        _user_cache.clear()
+        _submitted_cache.clear()
+        return
+
+    _user_cache.pop(user_id, None)
+    for cache_key in [key for key in _submitted_cache if key[0] == user_id]:
+        del _submitted_cache[cache_key]
+
+
+@on_resync
+def _clear_caches() -> None:
+    """놓친 변경이 있을 수 있으므로 조회 캐시를 모두 비웁니다."""
+    _submitted_cache.clear()
+    _user_cache.clear()
+    _latest_cache.clear()
+
+
+async def upsert_retrospectives_from_slack(
+    rows: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """
+    Slack 메시지에서 복원한 회고를 한 번에 저장합니다.
+
+    같은 멤버가 같은 회차에 제출한 회고가 이미 있으면 건너뜁니다.
+    (database/schemas/submission.sql 의 유니크 인덱스 필요)
+
+    Args:
+        rows: 회고 데이터 목록
+
+    Returns:
+        새로 저장된 회고 데이터 목록
+    """
+    if not rows:
+        return []
+
+    try:
+        saved = await supabase_resilience.call(
+            "upsert_retrospectives_from_slack",
+            lambda: _execute(
+                supabase.table("retrospectives").upsert(
+                    rows, on_conflict="user_id,session_name", ignore_duplicates=True
+                )
+            ),
+            timeout=BULK_TIMEOUT_SECONDS,
+        )
+
+    except Exception as e:
+        logger.error(f"회고 일괄 저장 실패 - Rows: {len(rows)}, Error: {str(e)}")
+        raise ValueError(f"회고 저장 중 오류가 발생했습니다: {str(e)}")
+
+    for row in saved:
+        await notify_change("insert", row)
+    return saved
+
+
+async def get_submitted_user_ids(session_name: str) -> set[str]:
+    """
+    특정 회차에 회고를 제출한 사용자 ID 목록을 한 번에 조회합니다.
+
+    Args:
+        session_name: 회차 이름
+
+    Returns:
+        제출한 사용자 ID 집합
+    """
+    if warm_store.covers_submissions(session_name):
+        return warm_store.get_submitted_user_ids(session_name)
+
+    page_size = 1000
+    user_ids: set[str] = set()
+
+    try:
+        start = 0
+        while True:
+            rows = await supabase_resilience.call(
+                "get_submitted_user_ids",
+                lambda: _execute(
+                    supabase.table("retrospectives")
+                    .select("user_id")
+                    .eq("session_name", session_name)
+                    .order("id")
+                    .range(start, start + page_size - 1)
+                ),
+                timeout=BULK_TIMEOUT_SECONDS,
+            )
+            user_ids.update(row["user_id"] for row in rows)
+
+            if len(rows) < page_size:
+                return user_ids
+            start += page_size
+
+    except Exception as e:
+        logger.error(f"회차 제출자 조회 실패 - Session: {session_name}, Error: {str(e)}")
+        raise ValueError(f"회고 조회 중 오류가 발생했습니다: {str(e)}")
+
+
+async def iter_retrospectives(
+    columns: str = "*",
+    session_names: list[str] | None = None,
+    updated_after: str | None = None,
+    page_size: int = 1000,
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """
+    회고 데이터를 ID 순서대로 페이지 단위로 조회합니다.
+
+    OFFSET 대신 마지막으로 읽은 ID 이후부터 조회(keyset)하므로
+    테이블이 커져도 페이지마다 일정한 비용으로 읽을 수 있습니다.
+
+    Args:
+        columns: 조회할 컬럼 (id 컬럼은 반드시 포함되어야 합니다)
+        session_names: 조회할 회차 이름 목록 (기본값: 전체)
+        updated_after: 이 시각 이후에 수정된 회고만 조회 (ISO 8601 문자열)
+        page_size: 페이지 크기
+
+    Yields:
+        회고 데이터 목록
+    """
+    last_id = 0
+    while True:
+        try:
+            query = (
+                supabase.table("retrospectives")
+                .select(columns)
+                .gt("id", last_id)
+                .order("id")
+                .limit(page_size)
+            )
+            if session_names is not None:
+                query = query.in_("session_name", session_names)
+            if updated_after is not None:
+                query = query.gt("updated_at", updated_after)
+
+            rows = await supabase_resilience.call(
+                "iter_retrospectives",
+                lambda: _execute(query),
+                timeout=BULK_TIMEOUT_SECONDS,
+            )
+
+        except Exception as e:
+            logger.error(f"회고 목록 조회 실패 - After ID: {last_id}, Error: {str(e)}")
+            raise ValueError(f"회고 조회 중 오류가 발생했습니다: {str(e)}")
+
+        if rows:
+            yield rows
+            last_id = rows[-1]["id"]
+
+        if len(rows) < page_size:
+            return
+
+
+async def _execute(query: Any) -> list[dict[str, Any]]:
+    """쿼리를 실행하고 결과 행을 반환합니다. (여러 번 실행할 수 있습니다)"""
+    result = await query.execute()
+    return result.data
+
+
+async def _execute_exists(query: Any) -> bool:
+    """쿼리 결과가 있는지 반환합니다."""
+    return len(await _execute(query)) > 0
+
+
+def _remember(cache: OrderedDict, key: Hashable, value: Any, limit: int) -> None:
+    """조회 결과를 캐시에 저장하고, 최대 항목 수를 넘으면 가장 오래된 항목을 지웁니다."""
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > limit:
+        cache.popitem(last=False)
+
+
+async def _cached(value: Any) -> Any:
+    """데이터베이스가 응답하지 않을 때 대체 결과로 사용할 캐시 값을 반환합니다."""
+    return value
+
+
+async def _defer_create_retrospective(data: dict[str, Any], error: Exception) -> None:
+    """회고 저장을 작업 큐에 맡깁니다. (jobs/tasks.py 의 save_retrospective)"""
+    from jobs.queue import PRIORITY_HIGH, enqueue
+
+    logger.warning(
+        f"회고 저장 지연 - User: {data['user_id']}, Error: {type(error).__name__}: {error}"
+    )
+    await enqueue(
+        "save_retrospective",
+        data,
+        priority=PRIORITY_HIGH,
+        max_attempts=DEFERRED_SAVE_MAX_ATTEMPTS,
+    )
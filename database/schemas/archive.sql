@@ -0,0 +1,35 @@
+-- 보관된 기수 테이블 생성
+-- 보관된 기수의 회고는 retrospectives 테이블에서 삭제되고 Storage 의 archive 버킷으로 옮겨집니다.
+create table if not exists archived_cohorts (
+    cohort_name text primary key,
+    row_count integer not null,
+    archived_at timestamp with time zone not null
+);
+
+-- 보관 파일을 저장할 비공개 Storage 버킷 (ARCHIVE_BUCKET 과 같은 이름)
+insert into storage.buckets (id, name, public)
+values ('archive', 'archive', false)
+on conflict (id) do nothing;
+
+-- 보관으로 인한 삭제는 회고 통계에서 빼지 않도록 트리거 함수를 교체합니다.
+-- (retrospective_stats.sql 의 maintain_retrospective_stats 를 대체합니다)
+create or replace function maintain_retrospective_stats()
+returns trigger as $$
+begin
+    if tg_op = 'DELETE' and exists (
+        select 1
+        from archived_cohorts
+        where cohort_name = coalesce(substring(old.session_name from '^(\d+기) '), '2기')
+    ) then
+        return null;
+    end if;
+
+    if tg_op in ('UPDATE', 'DELETE') then
+        perform apply_retrospective_stats(old.session_name, old.emotion_score, -1);
+    end if;
+    if tg_op in ('INSERT', 'UPDATE') then
+        perform apply_retrospective_stats(new.session_name, new.emotion_score, 1);
+    end if;
+    return null;
+end;
+$$ language 'plpgsql';
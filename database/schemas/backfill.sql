@@ -0,0 +1,2 @@
+-- Slack 메시지 기준 중복 방지 유니크 인덱스 (Slack 채널 기록 백필 시 upsert 키)
+create unique index if not exists retrospectives_slack_channel_ts_idx on retrospectives (slack_channel, slack_ts);
@@ -0,0 +1,16 @@
+-- 증분 백업용 인덱스 (updated_at 워터마크 이후 변경분 조회)
+create index if not exists retrospectives_updated_at_id_idx on retrospectives (updated_at, id);
+
+-- 백업 복원 시 기존 회고 ID 를 그대로 넣을 수 있도록 identity 를 by default 로 변경합니다.
+alter table retrospectives alter column id set generated by default;
+
+-- 복원 후 다음 회고 ID 가 기존 ID 와 겹치지 않도록 시퀀스를 맞춥니다.
+create or replace function reset_retrospectives_id_sequence()
+returns void as $$
+begin
+    perform setval(
+        pg_get_serial_sequence('retrospectives', 'id'),
+        coalesce((select max(id) from retrospectives), 1)
+    );
+end;
+$$ language plpgsql;
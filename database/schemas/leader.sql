@@ -0,0 +1,40 @@
+-- 여러 서버에서 실행할 때 스케줄러 작업을 실행할 리더를 정하는 리스 테이블
+create table if not exists leader_leases (
+    name text primary key,
+    holder text not null,
+    expires_at timestamp with time zone not null
+);
+
+-- 리스가 비어 있거나 만료되었거나 이미 가진 경우 리스를 얻고(갱신하고) true 를 반환합니다.
+create or replace function try_acquire_leader_lease(
+    lease_name text,
+    lease_holder text,
+    ttl_seconds integer
+)
+returns boolean as $$
+declare
+    acquired boolean;
+begin
+    -- 같은 리스를 동시에 요청하는 경우 트랜잭션이 끝날 때까지 순서대로 처리합니다.
+    perform pg_advisory_xact_lock(hashtext('leader_lease:' || lease_name));
+
+    insert into leader_leases (name, holder, expires_at)
+    values (lease_name, lease_holder, now() + make_interval(secs => ttl_seconds))
+    on conflict (name) do update
+        set holder = excluded.holder,
+            expires_at = excluded.expires_at
+        where leader_leases.holder = excluded.holder
+            or leader_leases.expires_at < now()
+    returning true into acquired;
+
+    return coalesce(acquired, false);
+end;
+$$ language plpgsql;
+
+-- 종료하는 리더가 리스를 반납합니다.
+create or replace function release_leader_lease(lease_name text, lease_holder text)
+returns void as $$
+begin
+    delete from leader_leases where name = lease_name and holder = lease_holder;
+end;
+$$ language plpgsql;
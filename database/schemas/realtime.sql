@@ -0,0 +1,2 @@
+-- Realtime 변경 피드 구독을 위해 retrospectives 테이블을 publication 에 추가합니다. (REALTIME_ENABLED=true 인 경우)
+alter publication supabase_realtime add table retrospectives;
@@ -0,0 +1,95 @@
+-- 회차별 회고 통계 테이블 생성
+-- retrospectives 테이블의 트리거가 생성/수정/삭제 시 증분으로 갱신합니다.
+create table if not exists retrospective_stats (
+    session_name text primary key,
+    cohort_name text not null,
+    submission_count integer not null default 0,
+    emotion_score_count integer not null default 0,
+    emotion_score_sum integer not null default 0,
+    emotion_score_counts integer[] not null default array_fill(0, array[10]),
+    updated_at timestamp with time zone default timezone('utc'::text, now()) not null
+);
+
+create index if not exists retrospective_stats_cohort_name_idx on retrospective_stats (cohort_name);
+
+-- 회고 한 건을 통계에 더하거나(p_sign = 1) 뺍니다(p_sign = -1).
+-- "N기 " 접두어가 없는 회차는 2기로 분류합니다. (constants.DEFAULT_COHORT_NAME)
+create or replace function apply_retrospective_stats(
+    p_session_name text,
+    p_emotion_score integer,
+    p_sign integer
+)
+returns void as $$
+begin
+    insert into retrospective_stats (session_name, cohort_name)
+    values (
+        p_session_name,
+        coalesce(substring(p_session_name from '^(\d+기) '), '2기')
+    )
+    on conflict (session_name) do nothing;
+
+    update retrospective_stats
+    set submission_count = submission_count + p_sign,
+        updated_at = timezone('utc'::text, now())
+    where session_name = p_session_name;
+
+    if p_emotion_score is not null then
+        update retrospective_stats
+        set emotion_score_count = emotion_score_count + p_sign,
+            emotion_score_sum = emotion_score_sum + p_emotion_score * p_sign,
+            emotion_score_counts[p_emotion_score] = emotion_score_counts[p_emotion_score] + p_sign
+        where session_name = p_session_name;
+    end if;
+end;
+$$ language 'plpgsql';
+
+create or replace function maintain_retrospective_stats()
+returns trigger as $$
+begin
+    if tg_op in ('UPDATE', 'DELETE') then
+        perform apply_retrospective_stats(old.session_name, old.emotion_score, -1);
+    end if;
+    if tg_op in ('INSERT', 'UPDATE') then
+        perform apply_retrospective_stats(new.session_name, new.emotion_score, 1);
+    end if;
+    return null;
+end;
+$$ language 'plpgsql';
+
+-- 트리거 설정 (다시 실행해도 되도록 기존 트리거를 먼저 지웁니다)
+drop trigger if exists maintain_retrospective_stats on retrospectives;
+create trigger maintain_retrospective_stats
+after insert or update of session_name, emotion_score or delete on retrospectives
+for each row
+execute procedure maintain_retrospective_stats();
+
+-- 기존 회고 데이터로 통계 초기화 (최초 1회)
+insert into retrospective_stats (
+    session_name,
+    cohort_name,
+    submission_count,
+    emotion_score_count,
+    emotion_score_sum,
+    emotion_score_counts
+)
+select
+    session_name,
+    coalesce(substring(session_name from '^(\d+기) '), '2기'),
+    count(*),
+    count(emotion_score),
+    coalesce(sum(emotion_score), 0),
+    array[
+        count(*) filter (where emotion_score = 1),
+        count(*) filter (where emotion_score = 2),
+        count(*) filter (where emotion_score = 3),
+        count(*) filter (where emotion_score = 4),
+        count(*) filter (where emotion_score = 5),
+        count(*) filter (where emotion_score = 6),
+        count(*) filter (where emotion_score = 7),
+        count(*) filter (where emotion_score = 8),
+        count(*) filter (where emotion_score = 9),
+        count(*) filter (where emotion_score = 10)
+    ]::integer[]
+from retrospectives
+group by session_name
+on conflict (session_name) do nothing;
@@ -0,0 +1,5 @@
+-- 멤버별 회차당 회고 하나만 저장되도록 하는 유니크 인덱스
+-- (워커가 여러 개이면 제출 잠금이 워커 안에서만 순서를 보장하므로, 데이터베이스에서 중복을 막습니다)
+-- 인덱스를 만들기 전에 이미 중복된 회고가 있는지 확인하고 정리합니다.
+-- select user_id, session_name, count(*) from retrospectives group by 1, 2 having count(*) > 1;
+create unique index if not exists retrospectives_user_session_idx on retrospectives (user_id, session_name);
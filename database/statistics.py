@@ -0,0 +1,88 @@
+from typing import Any
+
+from loguru import logger
+
+from database.resilience import supabase_resilience
+from database.supabase import supabase
+
+
+async def _select_stats(column: str, value: str) -> list[dict[str, Any]]:
+    """retrospective_stats 에서 조건에 맞는 행을 조회합니다. (여러 번 실행할 수 있습니다)"""
+    result = (
+        await supabase.table("retrospective_stats").select("*").eq(column, value).execute()
+    )
+    return result.data
+
+
+async def get_session_stats(session_name: str) -> dict[str, Any] | None:
+    """
+    회차별 회고 통계를 조회합니다.
+
+    Args:
+        session_name: 회차 이름
+
+    Returns:
+        회차 통계 데이터 (제출 기록이 없으면 None)
+    """
+    try:
+        rows = await supabase_resilience.call(
+            "get_session_stats",
+            lambda: _select_stats("session_name", session_name),
+            hedge=True,
+        )
+
+        return rows[0] if rows else None
+
+    except Exception as e:
+        logger.error(f"회차 통계 조회 실패 - Session: {session_name}, Error: {str(e)}")
+        raise ValueError(f"통계 조회 중 오류가 발생했습니다: {str(e)}")
+
+
+async def get_cohort_stats(cohort_name: str) -> list[dict[str, Any]]:
+    """
+    기수에 속한 회차별 회고 통계 목록을 조회합니다.
+
+    Args:
+        cohort_name: 기수 이름 (예: "3기")
+
+    Returns:
+        회차 통계 데이터 목록
+    """
+    try:
+        return await supabase_resilience.call(
+            "get_cohort_stats",
+            lambda: _select_stats("cohort_name", cohort_name),
+            hedge=True,
+        )
+
+    except Exception as e:
+        logger.error(f"기수 통계 조회 실패 - Cohort: {cohort_name}, Error: {str(e)}")
+        raise ValueError(f"통계 조회 중 오류가 발생했습니다: {str(e)}")
+
+
+def summarize_stats(rows: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    회차 통계 행들을 합산합니다.
+
+    Args:
+        rows: 회차 통계 데이터 목록
+
+    Returns:
+        제출 수, 감정 점수 평균과 분포
+    """
+    submission_count = sum(row["submission_count"] for row in rows)
+    emotion_score_count = sum(row["emotion_score_count"] for row in rows)
+    emotion_score_sum = sum(row["emotion_score_sum"] for row in rows)
+    emotion_score_counts = [
+        sum(counts) for counts in zip(*(row["emotion_score_counts"] for row in rows))
+    ] or [0] * 10
+
+    return {
+        "session_count": len(rows),
+        "submission_count": submission_count,
+        "emotion_score_count": emotion_score_count,
+        "emotion_score_mean": (
+            emotion_score_sum / emotion_score_count if emotion_score_count else None
+        ),
+        "emotion_score_counts": emotion_score_counts,
+    }
@@ -1,20 +1,205 @@
-from supabase.client import AsyncClient
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
 
 from config import settings
 
+if TYPE_CHECKING:
+    import httpx
+    from supabase.client import AsyncClient
+
+
+class PoolMetrics:
+    """연결 풀 HTTP 클라이언트가 보낸 요청과 새로 맺은 연결 수를 직접 셉니다."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.errors = 0
+        self.connections_opened = 0
+        self.connect_failures = 0
+        self.http2_responses = 0
+        self._total_seconds = 0.0
+
+    async def trace(self, event: str, info: dict[str, Any]) -> None:
+        """httpx 의 trace 확장으로 연결 수립 이벤트를 받습니다."""
+        if event == "connection.connect_tcp.complete":
+            self.connections_opened += 1
+        elif event == "connection.connect_tcp.failed":
+            self.connect_failures += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        completed = self.requests - self.in_flight
+        return {
+            "requests": self.requests,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "errors": self.errors,
+            "connections_opened": self.connections_opened,
+            "connect_failures": self.connect_failures,
+            # 새 연결을 맺지 않고 기존 연결로 보낸 요청 수
+            "reused_requests": max(0, completed - self.connections_opened),
+            "http2_responses": self.http2_responses,
+            "avg_response_ms": round(self._total_seconds / completed * 1000, 1)
+            if completed
+            else None,
+        }
+
+
+def _metered_transport(transport: "httpx.AsyncBaseTransport", metrics: PoolMetrics):
+    """요청마다 PoolMetrics 를 갱신하는 전송 계층을 만듭니다."""
+    import httpx
+
+    class MeteredTransport(httpx.AsyncBaseTransport):
+        async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+            request.extensions["trace"] = metrics.trace
+            metrics.requests += 1
+            metrics.in_flight += 1
+            metrics.max_in_flight = max(metrics.max_in_flight, metrics.in_flight)
+            started_at = time.perf_counter()
+            try:
+                response = await transport.handle_async_request(request)
+            except Exception:
+                metrics.errors += 1
+                raise
+            finally:
+                metrics.in_flight -= 1
+                metrics._total_seconds += time.perf_counter() - started_at
+            if response.extensions.get("http_version") == b"HTTP/2":
+                metrics.http2_responses += 1
+            return response
+
+        async def aclose(self) -> None:
+            await transport.aclose()
+
+    return MeteredTransport()
+
+
+def create_http_client(
+    http2: bool | None = None, metrics: PoolMetrics | None = None
+) -> "httpx.AsyncClient":
+    """
+    연결 풀 설정을 적용한 PostgREST 용 HTTP 클라이언트를 만듭니다.
+
+    Args:
+        http2: HTTP/2 사용 여부 (기본값: settings.SUPABASE_HTTP2)
+        metrics: 요청, 연결 수를 기록할 PoolMetrics (없으면 기록하지 않습니다)
+    """
+    import httpx
+
+    if http2 is None:
+        http2 = settings.SUPABASE_HTTP2
+    if http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            logger.warning("h2 패키지가 없어 HTTP/1.1 로 연결합니다.")
+            http2 = False
+
+    transport = httpx.AsyncHTTPTransport(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=settings.SUPABASE_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.SUPABASE_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.SUPABASE_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+    )
+    return httpx.AsyncClient(
+        transport=transport if metrics is None else _metered_transport(transport, metrics),
+        timeout=httpx.Timeout(
+            settings.SUPABASE_TIMEOUT_SECONDS,
+            connect=settings.SUPABASE_CONNECT_TIMEOUT_SECONDS,
+        ),
+    )
+
+
+def _create_client(http_client: "httpx.AsyncClient") -> "AsyncClient":
+    """PostgREST 요청에만 연결 풀 HTTP 클라이언트를 사용하는 Supabase 클라이언트를 만듭니다."""
+    # supabase 패키지는 가져오는 데 오래 걸리므로 처음 사용할 때 가져옵니다.
+    from supabase.client import AsyncClient
+
+    class PooledAsyncClient(AsyncClient):
+        # PostgREST 클라이언트는 받은 HTTP 클라이언트의 base_url, headers 를 바꾸므로
+        # auth, storage, functions 는 각자 HTTP 클라이언트를 만들도록 연결 풀은 PostgREST 에만 넘깁니다.
+        # 인증 상태가 바뀌어 PostgREST 클라이언트를 다시 만들 때도 같은 연결 풀을 사용합니다.
+        @property
+        def postgrest(self):
+            if self._postgrest is None:
+                self._postgrest = self._init_postgrest_client(
+                    rest_url=self.rest_url,
+                    headers=self.options.headers,
+                    schema=self.options.schema,
+                    http_client=http_client,
+                )
+            return self._postgrest
+
+    return PooledAsyncClient(
+        supabase_url=settings.SUPABASE_URL, supabase_key=settings.SUPABASE_KEY
+    )
+
 
 class SupabaseClient:
     _instance = None
+    _http_client: "httpx.AsyncClient | None" = None
+    _metrics: PoolMetrics | None = None
 
     @classmethod
-    def get_instance(cls) -> AsyncClient:
+    def get_instance(cls) -> "AsyncClient":
         """싱글톤 패턴으로 Supabase 클라이언트 인스턴스를 반환합니다."""
         if cls._instance is None:
-            cls._instance = AsyncClient(
-                supabase_url=settings.SUPABASE_URL,
-                supabase_key=settings.SUPABASE_KEY,
-            )
+            # 요청마다 연결을 새로 맺지 않도록 PostgREST 요청은 연결 풀을 설정한 HTTP 클라이언트로 보냅니다.
+            cls._metrics = PoolMetrics()
+            cls._http_client = create_http_client(metrics=cls._metrics)
+            cls._instance = _create_client(cls._http_client)
         return cls._instance
 
+    @classmethod
+    async def warm_up(cls) -> None:
+        """
+        시작할 때 PostgREST 연결을 미리 맺어 첫 요청이 연결 수립 시간을 기다리지 않도록 합니다.
+
+        응답 상태와 관계없이 연결만 맺으면 되므로 본문이 없는 HEAD 요청을 보냅니다.
+        """
+        session = cls.get_instance().postgrest.session
+        results = await asyncio.gather(
+            *(
+                session.request("HEAD", "/")
+                for _ in range(max(1, settings.SUPABASE_WARMUP_CONNECTIONS))
+            ),
+            return_exceptions=True,
+        )
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors:
+            logger.warning(f"Supabase 연결 준비 실패 - Error: {errors[0]!r}")
+        logger.info(f"Supabase 연결 준비 완료 - {cls.metrics()}")
+
+    @classmethod
+    def metrics(cls) -> dict[str, Any] | None:
+        """PostgREST 연결 풀 사용 현황을 반환합니다. (클라이언트를 만들기 전에는 None)"""
+        if cls._metrics is None:
+            return None
+        return {
+            **cls._metrics.to_dict(),
+            "http2_enabled": settings.SUPABASE_HTTP2,
+            "max_connections": settings.SUPABASE_MAX_CONNECTIONS,
+            "max_keepalive_connections": settings.SUPABASE_MAX_KEEPALIVE_CONNECTIONS,
+        }
+
+    @classmethod
+    async def close(cls) -> None:
+        """연결 풀을 닫습니다."""
+        if cls._http_client is not None:
+            await cls._http_client.aclose()
+
+
+class _LazySupabaseClient:
+    """처음 사용할 때 Supabase 클라이언트를 생성하는 프록시"""
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(SupabaseClient.get_instance(), name)
+
 
-supabase = SupabaseClient.get_instance()
+supabase: "AsyncClient" = _LazySupabaseClient()  # type: ignore[assignment]
@@ -0,0 +1,285 @@
+import asyncio
+import sys
+import time
+from typing import Any
+
+from loguru import logger
+
+from config import settings
+from database.changes import ChangeType, is_change_feed_active, on_change, on_resync
+from database.resilience import BULK_TIMEOUT_SECONDS, supabase_resilience
+from database.supabase import supabase
+from utils import get_cohort_name, get_cohort_session_names, get_current_session_info
+
+# 메모리 추정 시 레코드 객체와 별도로 크기를 더할 필드 (공유되는 문자열, 정수 제외)
+_OWNED_FIELDS = (
+    "slack_ts",
+    "good_points",
+    "improvements",
+    "learnings",
+    "action_item",
+    "emotion_reason",
+    "created_at",
+    "updated_at",
+)
+
+RECORD_FIELDS = (
+    "id",
+    "user_id",
+    "session_name",
+    "slack_channel",
+    "slack_ts",
+    "good_points",
+    "improvements",
+    "learnings",
+    "action_item",
+    "emotion_score",
+    "emotion_reason",
+    "created_at",
+    "updated_at",
+)
+
+
+class RetrospectiveRecord:
+    """메모리에 보관하는 회고 한 건 (__slots__ 로 인스턴스 딕셔너리를 만들지 않습니다)"""
+
+    __slots__ = RECORD_FIELDS
+
+    def __init__(self, row: dict[str, Any]) -> None:
+        for field in RECORD_FIELDS:
+            value = row.get(field)
+            # 반복되는 짧은 문자열은 하나의 객체를 공유합니다.
+            if field in ("user_id", "session_name", "slack_channel") and value:
+                value = sys.intern(value)
+            setattr(self, field, value)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {field: getattr(self, field) for field in RECORD_FIELDS}
+
+
+class WarmStore:
+    """
+    현재 기수의 회고를 메모리에 보관하고 사용자별, 회차별 인덱스로 조회합니다.
+
+    저장/수정/삭제는 데이터베이스에 먼저 반영한 뒤 변경 알림으로 메모리에 반영합니다.
+    대시보드에서 직접 수정한 내용까지 반영하려면 변경 피드(REALTIME_ENABLED)를 함께 사용하세요.
+    """
+
+    def __init__(self) -> None:
+        self._cohort_name: str | None = None
+        self._session_names: frozenset[str] = frozenset()
+        self._records: dict[int, RetrospectiveRecord] = {}
+        self._by_user: dict[str, set[int]] = {}
+        self._by_session: dict[str, set[int]] = {}
+        # 현재 기수 밖에도 회고가 있는 사용자 (이 사용자의 목록은 데이터베이스도 조회합니다)
+        self._users_with_history: set[str] = set()
+        self._ready = False
+        self._load_task: asyncio.Task | None = None
+
+    def is_ready(self) -> bool:
+        """
+        메모리에서 조회할 수 있는지 확인합니다.
+
+        현재 기수가 바뀌었거나 마지막 불러오기가 실패했으면 다시 불러오고, 그동안은 데이터베이스에서
+        조회합니다.
+        """
+        if not self._ready:
+            task = self._load_task
+            if task is not None and task.done() and not task.cancelled() and task.exception():
+                logger.error(f"현재 기수 회고 메모리 로드 실패, 다시 시도 - Error: {task.exception()!r}")
+                self.reload()
+            return False
+        if self._cohort_name != _get_active_cohort_name():
+            self.reload()
+            return False
+        return True
+
+    def covers(self, session_name: str) -> bool:
+        """회차가 메모리에 보관 중인 기수에 속하는지 확인합니다."""
+        return self.is_ready() and session_name in self._session_names
+
+    def covers_submissions(self, session_name: str) -> bool:
+        """
+        회차의 제출 여부를 메모리에서 확인할 수 있는지 반환합니다.
+
+        다른 워커가 저장한 회고는 변경 피드로만 전달되므로, 워커가 여러 개이면
+        변경 피드를 구독 중일 때만 메모리에서 확인합니다.
+        """
+        return self.covers(session_name) and (
+            settings.WORKERS <= 1 or is_change_feed_active()
+        )
+
+    def reload(self) -> asyncio.Task:
+        """다시 불러오기를 시작하고, 이미 진행 중이면 해당 태스크를 반환합니다."""
+        if self._load_task is None or self._load_task.done():
+            self._load_task = asyncio.create_task(self.load())
+        return self._load_task
+
+    def apply_change(self, change_type: ChangeType, row: dict[str, Any]) -> None:
+        """회고 변경 사항을 메모리에 반영합니다. (불러오는 중에도 반영합니다)"""
+        if self._cohort_name is None:
+            return
+        if change_type == "delete":
+            self._remove(row["id"])
+        elif row["session_name"] in self._session_names:
+            self._add(row)
+        else:
+            # 현재 기수 밖으로 회차가 바뀐 경우
+            self._remove(row["id"])
+            self._users_with_history.add(row["user_id"])
+
+    def _add(self, row: dict[str, Any]) -> None:
+        self._remove(row["id"])
+        record = RetrospectiveRecord(row)
+        self._records[record.id] = record
+        self._by_user.setdefault(record.user_id, set()).add(record.id)
+        self._by_session.setdefault(record.session_name, set()).add(record.id)
+
+    def _remove(self, retrospective_id: int) -> None:
+        record = self._records.pop(retrospective_id, None)
+        if record is None:
+            return
+        self._by_user[record.user_id].discard(retrospective_id)
+        self._by_session[record.session_name].discard(retrospective_id)
+
+    async def load(self) -> None:
+        """현재 기수의 회고와 이전 기수에 회고가 있는 사용자 목록을 불러옵니다."""
+        # database.retrospective 가 이 모듈을 가져오므로 함수 안에서 가져옵니다.
+        from database.retrospective import iter_retrospectives
+
+        started_at = time.perf_counter()
+        cohort_name = _get_active_cohort_name()
+        session_names = get_cohort_session_names(cohort_name)
+
+        self._ready = False
+        self._records.clear()
+        self._by_user.clear()
+        self._by_session.clear()
+        self._cohort_name = cohort_name
+        self._session_names = frozenset(session_names)
+
+        async for page in iter_retrospectives(session_names=session_names):
+            for row in page:
+                self._add(row)
+
+        self._users_with_history = await _get_users_outside(session_names)
+        self._ready = True
+
+        footprint = self.memory_footprint()
+        logger.info(
+            f"현재 기수 회고 메모리 로드 완료 - Cohort: {cohort_name}, "
+            f"Rows: {footprint['rows']}, "
+            f"Memory: {footprint['total_bytes'] / 1024:.0f}KB "
+            f"({footprint['bytes_per_1000_rows'] / 1024:.0f}KB/1000건), "
+            f"Elapsed: {time.perf_counter() - started_at:.2f}s"
+        )
+
+    def get_by_id(self, retrospective_id: int) -> dict[str, Any] | None:
+        record = self._records.get(retrospective_id)
+        return record.to_dict() if record else None
+
+    def get_by_user(self, user_id: str) -> list[dict[str, Any]]:
+        """사용자의 현재 기수 회고를 최신순으로 반환합니다."""
+        records = [self._records[i] for i in self._by_user.get(user_id, ())]
+        records.sort(key=lambda record: record.created_at, reverse=True)
+        return [record.to_dict() for record in records]
+
+    def has_history(self, user_id: str) -> bool:
+        """사용자가 현재 기수 밖에도 회고를 작성했는지 확인합니다."""
+        return user_id in self._users_with_history
+
+    def has_submitted(self, user_id: str, session_name: str) -> bool:
+        return bool(
+            self._by_user.get(user_id, set()) & self._by_session.get(session_name, set())
+        )
+
+    def get_submitted_user_ids(self, session_name: str) -> set[str]:
+        return {
+            self._records[i].user_id for i in self._by_session.get(session_name, ())
+        }
+
+    def get_latest(self, limit: int) -> list[dict[str, Any]] | None:
+        """최근 회고를 반환합니다. 보관 중인 회고가 부족하면 None 을 반환합니다."""
+        if len(self._records) < limit:
+            return None
+        records = sorted(
+            self._records.values(), key=lambda record: record.created_at, reverse=True
+        )
+        return [record.to_dict() for record in records[:limit]]
+
+    def memory_footprint(self) -> dict[str, Any]:
+        """회고 데이터와 인덱스가 차지하는 메모리를 추정합니다."""
+        record_bytes = sum(
+            sys.getsizeof(record)
+            + sum(sys.getsizeof(getattr(record, field)) for field in _OWNED_FIELDS)
+            for record in self._records.values()
+        )
+        index_bytes = (
+            sys.getsizeof(self._records)
+            + sum(sys.getsizeof(ids) for ids in self._by_user.values())
+            + sum(sys.getsizeof(ids) for ids in self._by_session.values())
+            + sys.getsizeof(self._by_user)
+            + sys.getsizeof(self._by_session)
+        )
+        rows = len(self._records)
+        total_bytes = record_bytes + index_bytes
+        return {
+            "rows": rows,
+            "record_bytes": record_bytes,
+            "index_bytes": index_bytes,
+            "total_bytes": total_bytes,
+            "bytes_per_1000_rows": total_bytes / rows * 1000 if rows else 0,
+        }
+
+
+def _get_active_cohort_name() -> str:
+    return get_cohort_name(get_current_session_info()[1])
+
+
+async def _get_users_outside(session_names: list[str]) -> set[str]:
+    """기수 밖의 회차에 회고를 작성한 사용자 ID 목록을 조회합니다."""
+    page_size = 1000
+    user_ids: set[str] = set()
+    last_id = 0
+
+    async def fetch_page() -> list[dict[str, Any]]:
+        result = (
+            await supabase.table("retrospectives")
+            .select("id,user_id")
+            .not_.in_("session_name", session_names)
+            .gt("id", last_id)
+            .order("id")
+            .limit(page_size)
+            .execute()
+        )
+        return result.data
+
+    try:
+        while True:
+            rows = await supabase_resilience.call(
+                "get_users_outside", fetch_page, timeout=BULK_TIMEOUT_SECONDS
+            )
+            user_ids.update(row["user_id"] for row in rows)
+            if len(rows) < page_size:
+                return user_ids
+            last_id = rows[-1]["id"]
+
+    except Exception as e:
+        logger.error(f"이전 기수 작성자 조회 실패 - Error: {str(e)}")
+        raise ValueError(f"회고 조회 중 오류가 발생했습니다: {str(e)}")
+
+
+warm_store = WarmStore()
+
+
+@on_change
+def _apply_change(change_type: ChangeType, row: dict[str, Any]) -> None:
+    """회고 변경 사항을 메모리에 반영합니다."""
+    warm_store.apply_change(change_type, row)
+
+
+@on_resync
+def _resync() -> None:
+    """놓친 변경 사항이 있을 수 있으므로 다시 불러옵니다."""
+    if warm_store._ready:
+        warm_store.reload()
@@ -0,0 +1,113 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from config import settings
+
+T = TypeVar("T")
+
+
+class FileIOExecutor:
+    """
+    블로킹 파일 I/O를 이벤트 루프 밖의 전용 스레드 풀에서 실행합니다.
+
+    실행 중이거나 스레드를 기다리는 작업 수를 max_in_flight 로 제한하고, 자리가 나기를
+    wait_timeout 초 넘게 기다린 작업은 실패시켜 디스크가 느려져도 작업이 무한히 쌓이지 않도록 합니다.
+    """
+
+    _instance = None
+
+    def __init__(
+        self, max_workers: int, max_in_flight: int, wait_timeout: float
+    ) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="file-io"
+        )
+        self._max_workers = max_workers
+        self._max_in_flight = max_in_flight
+        self._wait_timeout = wait_timeout
+        self._semaphore: asyncio.Semaphore | None = None
+        self._metrics = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "in_flight": 0,
+            "waiting": 0,
+            "wait_timeouts": 0,
+            "total_seconds": 0.0,
+            "max_seconds": 0.0,
+        }
+
+    @classmethod
+    def get_instance(cls) -> "FileIOExecutor":
+        """싱글톤 패턴으로 파일 I/O 실행기 인스턴스를 반환합니다."""
+        if cls._instance is None:
+            cls._instance = cls(
+                max_workers=settings.FILE_IO_MAX_WORKERS,
+                max_in_flight=settings.FILE_IO_MAX_IN_FLIGHT,
+                wait_timeout=settings.FILE_IO_WAIT_TIMEOUT_SECONDS,
+            )
+        return cls._instance
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        함수를 파일 I/O 스레드 풀에서 실행하고 결과를 반환합니다.
+
+        Raises:
+            asyncio.TimeoutError: 실행할 자리를 wait_timeout 초 안에 얻지 못한 경우
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_in_flight)
+
+        self._metrics["waiting"] += 1
+        try:
+            async with asyncio.timeout(self._wait_timeout):
+                await self._semaphore.acquire()
+        except asyncio.TimeoutError:
+            self._metrics["wait_timeouts"] += 1
+            raise
+        finally:
+            self._metrics["waiting"] -= 1
+
+        self._metrics["submitted"] += 1
+        self._metrics["in_flight"] += 1
+        started_at = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(
+                self._executor, lambda: func(*args, **kwargs)
+            )
+            self._metrics["completed"] += 1
+            return result
+        except Exception:
+            self._metrics["failed"] += 1
+            raise
+        finally:
+            self._semaphore.release()
+            elapsed = time.perf_counter() - started_at
+            self._metrics["in_flight"] -= 1
+            self._metrics["total_seconds"] += elapsed
+            self._metrics["max_seconds"] = max(self._metrics["max_seconds"], elapsed)
+
+    def metrics(self) -> dict[str, Any]:
+        """파일 I/O 실행 지표를 반환합니다."""
+        finished = self._metrics["completed"] + self._metrics["failed"]
+        return {
+            **self._metrics,
+            "max_workers": self._max_workers,
+            "max_in_flight": self._max_in_flight,
+            "avg_seconds": self._metrics["total_seconds"] / finished if finished else 0.0,
+        }
+
+    def shutdown(self) -> None:
+        """스레드 풀을 종료합니다."""
+        self._executor.shutdown(wait=True)
+
+
+file_io = FileIOExecutor.get_instance()
+
+
+async def run_file_io(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """블로킹 파일 I/O 함수를 전용 스레드 풀에서 실행합니다."""
+    return await file_io.run(func, *args, **kwargs)
@@ -0,0 +1 @@
+# jobs 패키지 모듈 초기화
@@ -0,0 +1,117 @@
+import argparse
+import asyncio
+from typing import Any
+
+from loguru import logger
+
+from constants import DUE_DATES, SESSION_NAMES
+from database import iter_retrospectives
+from database.archive import archive_store, build_archive, upload_archive
+from database.changes import notify_change
+from database.supabase import supabase
+from utils import get_cohort_session_names, tz_now
+
+# 데이터베이스에서 한 번에 삭제할 회고 수
+DELETE_BATCH_SIZE = 500
+
+
+def is_cohort_closed(cohort_name: str) -> bool:
+    """기수의 마지막 회차 마감일이 지났는지 확인합니다."""
+    session_names = get_cohort_session_names(cohort_name)
+    if not session_names:
+        raise ValueError(f"`{cohort_name}` 기수를 찾을 수 없습니다.")
+
+    last_due_date = max(
+        due_date
+        for session_name, due_date in zip(SESSION_NAMES, DUE_DATES)
+        if session_name in session_names
+    )
+    return last_due_date < tz_now()
+
+
+async def archive_cohort(cohort_name: str, force: bool = False) -> int:
+    """
+    종료된 기수의 회고를 Storage 의 보관 파일로 옮기고 데이터베이스에서 삭제합니다.
+
+    보관 파일을 올린 뒤 다시 내려받아 확인하고 archived_cohorts 에 기록한 다음에야
+    삭제하므로, 중간에 실패해도 회고가 사라지지 않습니다. 삭제한 회고는 변경 알림으로
+    캐시와 검색 색인에 반영합니다. 다시 실행하면 남아 있는 회고를 기존 보관 파일에 합칩니다.
+    (database/schemas/archive.sql 적용 필요)
+
+    Args:
+        cohort_name: 기수 이름 (예: 2기)
+        force: 마감일이 지나지 않은 기수도 보관할지 여부
+
+    Returns:
+        데이터베이스에서 옮긴 회고 수
+    """
+    if not force and not is_cohort_closed(cohort_name):
+        raise ValueError(f"`{cohort_name}` 기수는 아직 종료되지 않았습니다.")
+
+    session_names = get_cohort_session_names(cohort_name)
+    rows: dict[int, dict[str, Any]] = {}
+    async for page in archive_store.iter_retrospectives(cohort_names=[cohort_name]):
+        rows.update((row["id"], row) for row in page)
+
+    hot_ids: list[int] = []
+    async for page in iter_retrospectives(session_names=session_names):
+        rows.update((row["id"], row) for row in page)
+        hot_ids.extend(row["id"] for row in page)
+
+    if not hot_ids:
+        logger.info(f"보관할 회고가 없습니다. - Cohort: {cohort_name}")
+        return 0
+
+    data, index = await asyncio.to_thread(build_archive, cohort_name, list(rows.values()))
+    await upload_archive(data, index)
+
+    try:
+        # 통계 트리거가 보관으로 인한 삭제를 통계에서 빼지 않도록 먼저 기록합니다.
+        await (
+            supabase.table("archived_cohorts")
+            .upsert(
+                {
+                    "cohort_name": cohort_name,
+                    "row_count": index["row_count"],
+                    "archived_at": index["archived_at"],
+                },
+                on_conflict="cohort_name",
+            )
+            .execute()
+        )
+
+        # 삭제 알림을 받은 리스너가 보관된 회고인지 알 수 있도록 새 인덱스를 먼저 불러옵니다.
+        archive_store.reload()
+        await archive_store.get_cohort_names()
+
+        for start in range(0, len(hot_ids), DELETE_BATCH_SIZE):
+            batch = hot_ids[start : start + DELETE_BATCH_SIZE]
+            await supabase.table("retrospectives").delete().in_("id", batch).execute()
+            for retrospective_id in batch:
+                await notify_change("delete", {**rows[retrospective_id], "_archived": True})
+
+    except Exception as e:
+        logger.error(f"기수 보관 실패 - Cohort: {cohort_name}, Error: {str(e)}")
+        raise ValueError(f"기수 보관 중 오류가 발생했습니다: {str(e)}")
+
+    logger.info(
+        f"기수 보관 완료 - Cohort: {cohort_name}, Moved: {len(hot_ids)}, "
+        f"Total: {index['row_count']}"
+    )
+    return len(hot_ids)
+
+
+async def _main() -> None:
+    parser = argparse.ArgumentParser(description="종료된 기수의 회고를 Storage 보관 파일로 옮깁니다.")
+    parser.add_argument("cohort", help="기수 이름 (예: 2기)")
+    parser.add_argument(
+        "--force", action="store_true", help="마감일이 지나지 않은 기수도 보관합니다."
+    )
+    args = parser.parse_args()
+
+    moved = await archive_cohort(args.cohort, force=args.force)
+    print(f"`{args.cohort}` 기수 회고 {moved}건을 보관했습니다.")
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
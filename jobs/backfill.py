@@ -0,0 +1,227 @@
+import argparse
+import asyncio
+import datetime
+import os
+from pathlib import Path
+from typing import Any, Iterator
+
+import orjson
+import regex as re
+from loguru import logger
+from slack_sdk.web.async_client import AsyncWebClient
+
+from config import settings
+from database import upsert_retrospectives_from_slack
+from file_io import run_file_io
+from slack.rate_limiter import AsyncRateLimiter
+
+# 채널별 진행 상황을 저장할 경로
+CHECKPOINT_PATH = Path("store/backfill_checkpoint.json")
+
+# conversations_history 한 번에 가져올 메시지 수
+HISTORY_PAGE_SIZE = 200
+
+# conversations_history 는 Tier 3 (분당 50회 이상) 이므로 여유 있게 제한합니다.
+HISTORY_RATE_PER_SECOND = 0.8
+
+# 회고 공유 메시지 제목 (view_retrospective_submit 의 메시지 형식)
+_TITLE_PATTERN = re.compile(r"^\*<@(\w+)>님이 `(.+)` 회고를 공유했어요! 🤗\*$")
+_EMOTION_PATTERN = re.compile(r"^\*오늘의 감정점수\* :bar_chart: (\d+)/10$")
+
+# 섹션 제목 -> 필드 이름
+_FIELD_TITLES = {
+    "*잘했고 좋았던 점* 🌟": "good_points",
+    "*아쉽고 개선하고 싶은 점* 🔧": "improvements",
+    "*새롭게 배운 점* 💡": "learnings",
+    "*해볼만한 액션 아이템* 🚀": "action_item",
+}
+
+
+def _iter_block_texts(blocks: list[dict[str, Any]]) -> Iterator[tuple[str, str]]:
+    """블록을 (블록 종류, 텍스트) 순서로 반환합니다."""
+    for block in blocks:
+        if block["type"] == "section":
+            yield "section", block.get("text", {}).get("text", "")
+        elif block["type"] == "context":
+            elements = block.get("elements", [])
+            yield "context", elements[0].get("text", "") if elements else ""
+        else:
+            yield block["type"], ""
+
+
+def parse_retrospective_message(
+    channel_id: str, message: dict[str, Any]
+) -> dict[str, Any] | None:
+    """
+    회고 공유 메시지의 블록을 순서대로 한 번 훑으며 회고 데이터로 변환합니다.
+
+    제목 -> (섹션 제목, 내용) x 4 -> 감정 점수 -> 감정 이유 -> 안내 문구 순서이며,
+    형식이 맞지 않으면 None 을 반환합니다.
+    """
+    blocks = _iter_block_texts(message.get("blocks") or [])
+    block_type, text = next(blocks, ("", ""))
+    title = _TITLE_PATTERN.match(text) if block_type == "section" else None
+    if title is None:
+        return None
+
+    created_at = datetime.datetime.fromtimestamp(
+        float(message["ts"]), tz=datetime.timezone.utc
+    ).isoformat()
+    row: dict[str, Any] = {
+        "user_id": title.group(1),
+        "session_name": title.group(2),
+        "slack_channel": channel_id,
+        "slack_ts": message["ts"],
+        "emotion_score": None,
+        "emotion_reason": None,
+        "created_at": created_at,
+        "updated_at": created_at,
+    }
+
+    field = None
+    for block_type, text in blocks:
+        if block_type == "context":
+            # 섹션 제목이 아닌 context 는 마지막 안내 문구입니다.
+            field = _FIELD_TITLES.get(text)
+            if field is None:
+                break
+        elif block_type == "section":
+            if emotion := _EMOTION_PATTERN.match(text):
+                row["emotion_score"] = int(emotion.group(1))
+                field = "emotion_reason"
+            elif field is not None:
+                row[field] = text
+                field = None
+
+    if any(field not in row for field in _FIELD_TITLES.values()):
+        return None
+    return row
+
+
+def _read_checkpoint(path: Path) -> dict[str, Any]:
+    if not path.exists():
+        return {}
+    return orjson.loads(path.read_bytes())
+
+
+def _write_checkpoint(path: Path, checkpoint: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(".tmp")
+    temp_path.write_bytes(orjson.dumps(checkpoint))
+    os.replace(temp_path, path)
+
+
+async def _get_bot_channel_ids(
+    client: AsyncWebClient, limiter: AsyncRateLimiter
+) -> list[str]:
+    """봇이 참여 중인 채널 ID 목록을 반환합니다."""
+    channel_ids = []
+    cursor = None
+    while True:
+        response = await limiter.call(
+            client.users_conversations,
+            types="public_channel,private_channel",
+            exclude_archived=True,
+            limit=200,
+            cursor=cursor,
+        )
+        channel_ids.extend(channel["id"] for channel in response["channels"])
+        cursor = response.get("response_metadata", {}).get("next_cursor")
+        if not cursor:
+            return channel_ids
+
+
+async def backfill_channel(
+    client: AsyncWebClient,
+    channel_id: str,
+    bot_user_id: str,
+    checkpoint: dict[str, Any],
+    limiter: AsyncRateLimiter,
+) -> int:
+    """
+    채널 기록을 처음부터 끝까지 읽으며 회고 메시지를 데이터베이스에 저장합니다.
+
+    페이지마다 저장 후 커서를 체크포인트에 기록하므로 중단되어도 이어서 진행합니다.
+
+    Returns:
+        새로 저장된 회고 수
+    """
+    state = checkpoint.setdefault(
+        channel_id, {"cursor": None, "done": False, "parsed": 0, "inserted": 0}
+    )
+    if state["done"]:
+        return 0
+
+    inserted_count = 0
+    while True:
+        response = await limiter.call(
+            client.conversations_history,
+            channel=channel_id,
+            limit=HISTORY_PAGE_SIZE,
+            cursor=state["cursor"],
+        )
+
+        rows = [
+            row
+            for message in response["messages"]
+            if message.get("user") == bot_user_id
+            and (row := parse_retrospective_message(channel_id, message))
+        ]
+        inserted = await upsert_retrospectives_from_slack(rows)
+
+        inserted_count += len(inserted)
+        state["parsed"] += len(rows)
+        state["inserted"] += len(inserted)
+        state["cursor"] = response.get("response_metadata", {}).get("next_cursor") or None
+        state["done"] = state["cursor"] is None
+        await run_file_io(_write_checkpoint, CHECKPOINT_PATH, checkpoint)
+
+        if state["done"]:
+            logger.info(
+                f"채널 백필 완료 - Channel: {channel_id}, Parsed: {state['parsed']}, "
+                f"Inserted: {state['inserted']}"
+            )
+            return inserted_count
+
+
+async def backfill(
+    client: AsyncWebClient, channel_ids: list[str] | None = None, reset: bool = False
+) -> int:
+    """
+    Slack 채널 기록에서 데이터베이스에 없는 회고를 복원합니다.
+
+    Args:
+        client: Slack 클라이언트
+        channel_ids: 읽을 채널 ID 목록 (기본값: 봇이 참여 중인 모든 채널)
+        reset: 체크포인트를 무시하고 처음부터 다시 읽을지 여부
+
+    Returns:
+        새로 저장된 회고 수
+    """
+    limiter = AsyncRateLimiter(HISTORY_RATE_PER_SECOND)
+    checkpoint = {} if reset else await run_file_io(_read_checkpoint, CHECKPOINT_PATH)
+    bot_user_id = (await client.auth_test())["user_id"]
+    if channel_ids is None:
+        channel_ids = await _get_bot_channel_ids(client, limiter)
+
+    inserted_count = 0
+    for channel_id in channel_ids:
+        inserted_count += await backfill_channel(
+            client, channel_id, bot_user_id, checkpoint, limiter
+        )
+    return inserted_count
+
+
+async def _main() -> None:
+    parser = argparse.ArgumentParser(description="Slack 채널 기록에서 회고를 복원합니다.")
+    parser.add_argument("--channel", action="append", help="채널 ID (여러 번 지정 가능)")
+    parser.add_argument("--reset", action="store_true", help="체크포인트를 무시합니다.")
+    args = parser.parse_args()
+
+    client = AsyncWebClient(token=settings.SLACK_BOT_TOKEN)
+    inserted_count = await backfill(client, args.channel, reset=args.reset)
+    print(f"회고 {inserted_count}건을 복원했습니다.")
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -0,0 +1,319 @@
+import argparse
+import asyncio
+import datetime
+import gzip
+import os
+import sqlite3
+from pathlib import Path
+from typing import Any
+from zoneinfo import ZoneInfo
+
+import orjson
+from loguru import logger
+
+from config import settings
+from database import iter_retrospectives
+from database.archive import archive_store
+from database.supabase import supabase
+from file_io import run_file_io
+from utils import tz_now
+
+# 백업 파일을 저장할 경로
+BACKUP_DIR = Path("store/backups")
+INDEX_PATH = BACKUP_DIR / "index.json"
+LIVE_IDS_PATH = BACKUP_DIR / "live_ids.json"
+
+# 조회 도중 수정된 회고를 놓치지 않도록 워터마크를 이만큼 앞당깁니다.
+WATERMARK_SAFETY_MARGIN = datetime.timedelta(minutes=5)
+
+# Supabase 복원 시 한 번에 보낼 행 수
+RESTORE_BATCH_SIZE = 500
+
+RESTORE_TARGETS = ("supabase", "sqlite")
+
+RETROSPECTIVE_COLUMNS = (
+    "id",
+    "user_id",
+    "session_name",
+    "slack_channel",
+    "slack_ts",
+    "good_points",
+    "improvements",
+    "learnings",
+    "action_item",
+    "emotion_score",
+    "emotion_reason",
+    "created_at",
+    "updated_at",
+)
+
+
+def _read_json(path: Path, default: Any) -> Any:
+    if not path.exists():
+        return default
+    return orjson.loads(path.read_bytes())
+
+
+def _write_json(path: Path, data: Any) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(".tmp")
+    temp_path.write_bytes(orjson.dumps(data))
+    os.replace(temp_path, path)
+
+
+class _SegmentWriter:
+    """변경된 회고를 한 줄씩 gzip NDJSON 세그먼트 파일에 이어 씁니다."""
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = gzip.open(path, "wb")
+
+    def write(self, records: list[dict[str, Any]]) -> None:
+        self._file.write(b"".join(orjson.dumps(record) + b"\n" for record in records))
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def _read_segment(path: Path) -> list[dict[str, Any]]:
+    with gzip.open(path, "rb") as file:
+        return [orjson.loads(line) for line in file if line.strip()]
+
+
+async def run_backup() -> dict[str, Any] | None:
+    """
+    마지막 백업 이후 변경된 회고만 새 세그먼트 파일로 저장합니다.
+
+    updated_at 이 워터마크 이후인 회고만 조회하므로 백업 비용은 테이블 크기가 아닌
+    변경량에 비례합니다. 삭제는 updated_at 으로 알 수 없으므로 회고 ID 목록만
+    가볍게 조회해 이전 백업과 비교한 뒤 삭제 표시(tombstone)로 기록합니다.
+    보관된 기수로 옮겨진 회고는 삭제가 아니라 보관 표시로 기록합니다.
+
+    Returns:
+        새로 추가된 세그먼트 정보 (변경 사항이 없으면 None)
+    """
+    index = await run_file_io(_read_json, INDEX_PATH, {"watermark": None, "segments": []})
+    previous_ids = set(await run_file_io(_read_json, LIVE_IDS_PATH, []))
+    watermark = index["watermark"]
+    started_at = tz_now()
+
+    segment_name = f"segment_{started_at.strftime('%Y%m%d_%H%M%S')}.ndjson.gz"
+    segment_path = BACKUP_DIR / segment_name
+    writer = await run_file_io(_SegmentWriter, segment_path)
+
+    row_count = 0
+    max_updated_at = watermark
+    try:
+        async for page in iter_retrospectives(updated_after=watermark):
+            await run_file_io(writer.write, page)
+            row_count += len(page)
+            for row in page:
+                if row["updated_at"] and (
+                    max_updated_at is None or row["updated_at"] > max_updated_at
+                ):
+                    max_updated_at = row["updated_at"]
+
+        live_ids: set[int] = set()
+        async for page in iter_retrospectives(columns="id", page_size=10000):
+            live_ids.update(row["id"] for row in page)
+
+        removed_ids = previous_ids - live_ids
+        archived_ids = removed_ids & await archive_store.get_archived_ids()
+        deleted_ids = sorted(removed_ids - archived_ids)
+        await run_file_io(
+            writer.write,
+            [{"id": i, "_deleted": True} for i in deleted_ids]
+            + [{"id": i, "_archived": True} for i in sorted(archived_ids)],
+        )
+    finally:
+        await run_file_io(writer.close)
+
+    if not row_count and not deleted_ids and not archived_ids:
+        await run_file_io(segment_path.unlink)
+        logger.info("백업할 변경 사항이 없습니다.")
+        return None
+
+    # 조회 도중 앞쪽 ID 의 회고가 수정되었을 수 있으므로 시작 시각보다 늦게 잡지 않습니다.
+    # (다음 백업에서 다시 저장될 수 있지만 복원 시 ID 기준으로 합쳐집니다.)
+    safe_watermark = (
+        (started_at - WATERMARK_SAFETY_MARGIN).astimezone(datetime.timezone.utc).isoformat()
+    )
+    if max_updated_at is not None:
+        max_updated_at = min(max_updated_at, safe_watermark)
+
+    segment = {
+        "file": segment_name,
+        "created_at": started_at.isoformat(),
+        "rows": row_count,
+        "deleted": len(deleted_ids),
+        "archived": len(archived_ids),
+        "watermark": max_updated_at,
+    }
+    index["segments"].append(segment)
+    index["watermark"] = max_updated_at
+    await run_file_io(_write_json, LIVE_IDS_PATH, sorted(live_ids))
+    await run_file_io(_write_json, INDEX_PATH, index)
+
+    logger.info(
+        f"회고 백업 완료 - Segment: {segment_name}, Rows: {row_count}, "
+        f"Deleted: {len(deleted_ids)}, Archived: {len(archived_ids)}"
+    )
+    return segment
+
+
+async def load_snapshot(until: datetime.datetime | None = None) -> dict[int, dict[str, Any]]:
+    """
+    지정한 시각까지의 세그먼트를 순서대로 합쳐 그 시점의 회고 데이터를 만듭니다.
+
+    Args:
+        until: 복원할 시점 (기본값: 마지막 백업)
+
+    Returns:
+        회고 ID -> 회고 데이터 (보관된 기수로 옮겨진 회고는 `_archived` 가 True 입니다)
+    """
+    index = await run_file_io(_read_json, INDEX_PATH, {"watermark": None, "segments": []})
+    if until is not None and until.tzinfo is None:
+        until = until.replace(tzinfo=ZoneInfo("Asia/Seoul"))
+
+    rows: dict[int, dict[str, Any]] = {}
+    for segment in index["segments"]:
+        if until is not None and datetime.datetime.fromisoformat(
+            segment["created_at"]
+        ) > until:
+            break
+
+        for record in await run_file_io(_read_segment, BACKUP_DIR / segment["file"]):
+            if record.get("_deleted"):
+                rows.pop(record["id"], None)
+            elif record.get("_archived"):
+                if record["id"] in rows:
+                    rows[record["id"]] = {**rows[record["id"]], "_archived": True}
+            else:
+                rows[record["id"]] = record
+
+    return rows
+
+
+async def restore_to_supabase(rows: dict[int, dict[str, Any]]) -> None:
+    """
+    백업한 회고를 Supabase 에 덮어씁니다.
+
+    백업 시점에 없던 회고는 그대로 두므로, 정확한 시점 복원이 필요하면
+    빈 테이블에 복원하세요. 보관된 기수로 옮겨진 회고는 보관 파일에 있으므로
+    복원하지 않습니다. (database/schemas/backup.sql 적용 필요)
+    """
+    records = [row for row in rows.values() if not row.get("_archived")]
+    try:
+        for start in range(0, len(records), RESTORE_BATCH_SIZE):
+            await (
+                supabase.table("retrospectives")
+                .upsert(records[start : start + RESTORE_BATCH_SIZE], on_conflict="id")
+                .execute()
+            )
+        await supabase.rpc("reset_retrospectives_id_sequence").execute()
+
+    except Exception as e:
+        logger.error(f"회고 복원 실패 - Error: {str(e)}")
+        raise ValueError(f"회고 복원 중 오류가 발생했습니다: {str(e)}")
+
+
+def restore_to_sqlite(rows: dict[int, dict[str, Any]], path: Path) -> None:
+    """백업한 회고로 로컬 SQLite 데이터베이스를 만듭니다. (기존 파일은 덮어씁니다)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.unlink(missing_ok=True)
+
+    placeholders = ", ".join("?" for _ in RETROSPECTIVE_COLUMNS)
+    with sqlite3.connect(path) as connection:
+        connection.execute(
+            "create table retrospectives ("
+            "id integer primary key, "
+            + ", ".join(
+                f"{column} {'integer' if column == 'emotion_score' else 'text'}"
+                for column in RETROSPECTIVE_COLUMNS[1:]
+            )
+            + ")"
+        )
+        connection.executemany(
+            f"insert into retrospectives ({', '.join(RETROSPECTIVE_COLUMNS)}) "
+            f"values ({placeholders})",
+            (
+                tuple(row.get(column) for column in RETROSPECTIVE_COLUMNS)
+                for row in rows.values()
+            ),
+        )
+    connection.close()
+
+
+async def restore(
+    target: str,
+    until: datetime.datetime | None = None,
+    sqlite_path: Path = BACKUP_DIR / "restore.sqlite3",
+) -> int:
+    """
+    백업을 지정한 시점 기준으로 복원합니다.
+
+    Args:
+        target: 복원 대상 (supabase, sqlite)
+        until: 복원할 시점 (기본값: 마지막 백업)
+        sqlite_path: sqlite 로 복원할 때 저장할 파일 경로
+
+    Returns:
+        복원한 회고 수
+    """
+    if target not in RESTORE_TARGETS:
+        raise ValueError(f"지원하지 않는 복원 대상입니다: {target}")
+
+    rows = await load_snapshot(until)
+    if target == "supabase":
+        await restore_to_supabase(rows)
+    else:
+        await run_file_io(restore_to_sqlite, rows, sqlite_path)
+
+    logger.info(f"회고 복원 완료 - Target: {target}, Until: {until}, Rows: {len(rows)}")
+    return len(rows)
+
+
+async def backup_loop() -> None:
+    """매일 설정된 시각(한국 시간)에 증분 백업을 실행합니다."""
+    if not settings.BACKUP_ENABLED:
+        return
+
+    while True:
+        now = tz_now()
+        next_run = now.replace(hour=settings.BACKUP_HOUR, minute=0, second=0, microsecond=0)
+        if next_run <= now:
+            next_run += datetime.timedelta(days=1)
+        await asyncio.sleep((next_run - now).total_seconds())
+
+        try:
+            await run_backup()
+        except Exception as e:
+            logger.error(f"회고 백업 실패 - Error: {str(e)}")
+
+
+async def _main() -> None:
+    parser = argparse.ArgumentParser(description="회고 데이터를 증분 백업하거나 복원합니다.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("run", help="마지막 백업 이후 변경 사항을 백업합니다.")
+    restore_parser = subparsers.add_parser("restore", help="백업을 복원합니다.")
+    restore_parser.add_argument("--target", choices=RESTORE_TARGETS, default="sqlite")
+    restore_parser.add_argument(
+        "--until",
+        type=datetime.datetime.fromisoformat,
+        help="복원할 시점 (예: 2025-05-01T04:00:00, 기본 한국 시간)",
+    )
+    restore_parser.add_argument(
+        "--sqlite-path", type=Path, default=BACKUP_DIR / "restore.sqlite3"
+    )
+    args = parser.parse_args()
+
+    if args.command == "run":
+        segment = await run_backup()
+        print(segment or "백업할 변경 사항이 없습니다.")
+    else:
+        count = await restore(args.target, args.until, args.sqlite_path)
+        print(f"{count}건을 복원했습니다.")
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
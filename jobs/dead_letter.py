@@ -0,0 +1,305 @@
+import asyncio
+import hashlib
+import os
+import sqlite3
+import time
+import traceback
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+import orjson
+from loguru import logger
+from slack_bolt.async_app import AsyncApp
+from slack_bolt.request.async_request import AsyncBoltRequest
+
+from file_io import run_file_io
+from slack.lazy import COMPLETION_KEY
+
+# 처리에 실패한 이벤트를 저장할 SQLite 파일
+DEAD_LETTER_PATH = Path("store/dead_letters.sqlite3")
+
+# 재처리할 때 동시에 실행할 이벤트 수
+REPLAY_CONCURRENCY = 4
+
+# 이벤트 하나를 재처리할 때 핸들러가 끝나기를 기다리는 최대 시간(초)
+REPLAY_TIMEOUT_SECONDS = 60
+
+# 한 번의 재처리 작업에서 처리할 최대 이벤트 수 (작업 시간 제한을 넘지 않도록)
+REPLAY_BATCH_SIZE = 20
+
+# 이 횟수만큼 재처리에 실패한 이벤트는 더 이상 재처리하지 않습니다.
+MAX_REPLAY_ATTEMPTS = 5
+
+# 재처리 중 프로세스가 종료되어 replaying 상태로 남은 이벤트를 다시 가져갈 때까지의 시간(초)
+STALE_REPLAY_SECONDS = 600
+
+# 재처리 중인 요청의 context 에 원래 실패 정보를 담는 키
+DEAD_LETTER_KEY = "dead_letter"
+
+_SCHEMA = (
+    "create table if not exists dead_letters ("
+    "id integer primary key autoincrement, "
+    "fingerprint text not null, "
+    "listener text not null, "
+    "error text not null, "
+    "body text not null, "
+    "state text not null, "
+    "status text not null, "
+    "replay_attempts integer not null default 0, "
+    "last_error text, "
+    "created_at real not null, "
+    "updated_at real not null)",
+    "create index if not exists dead_letters_status_idx on dead_letters (status, id)",
+)
+
+
+def describe_listener(body: dict[str, Any]) -> str:
+    """요청 본문으로 어떤 리스너가 처리했는지 나타내는 이름을 만듭니다."""
+    body_type = body.get("type") or ("slash_command" if "command" in body else "")
+    if body_type == "event_callback":
+        return f"event:{body.get('event', {}).get('type')}"
+    if body_type == "slash_command":
+        return f"command:{body.get('command')}"
+    if body_type in ("view_submission", "view_closed"):
+        return f"{body_type}:{body.get('view', {}).get('callback_id')}"
+    if body_type == "block_actions":
+        actions = body.get("actions") or [{}]
+        return f"action:{actions[0].get('action_id')}"
+    if body_type == "block_suggestion":
+        return f"options:{body.get('action_id')}"
+    return body_type or "unknown"
+
+
+def fingerprint(listener: str, error: BaseException) -> str:
+    """
+    같은 원인으로 실패한 이벤트를 묶을 수 있도록 오류의 지문을 만듭니다.
+
+    오류 메시지에는 ID 등 요청마다 다른 값이 들어가므로, 리스너와 예외 종류,
+    예외가 발생한 코드 위치(파일과 함수 이름)만 사용합니다.
+    """
+    frames = [
+        f"{os.path.basename(frame.filename)}:{frame.name}"
+        for frame in traceback.extract_tb(error.__traceback__)
+    ]
+    source = "|".join([listener, type(error).__name__, *frames])
+    return hashlib.sha1(source.encode()).hexdigest()[:12]
+
+
+class DeadLetterStore:
+    """처리에 실패한 이벤트 본문을 SQLite 에 보관합니다."""
+
+    def __init__(self, path: Path = DEAD_LETTER_PATH) -> None:
+        self._path = path
+        self._initialized = False
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        if not self._initialized:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self._path, timeout=30, isolation_level=None)
+        connection.row_factory = sqlite3.Row
+        try:
+            if not self._initialized:
+                connection.execute("pragma journal_mode=wal")
+                for statement in _SCHEMA:
+                    connection.execute(statement)
+                self._initialized = True
+            yield connection
+        finally:
+            connection.close()
+
+    def add(
+        self,
+        fingerprint: str,
+        listener: str,
+        error: str,
+        body: dict[str, Any],
+        state: dict[str, Any],
+    ) -> int:
+        now = time.time()
+        with self._connect() as connection:
+            cursor = connection.execute(
+                "insert into dead_letters (fingerprint, listener, error, body, state, "
+                "status, created_at, updated_at) values (?, ?, ?, ?, ?, 'pending', ?, ?)",
+                (
+                    fingerprint,
+                    listener,
+                    error,
+                    orjson.dumps(body, default=str).decode(),
+                    orjson.dumps(state, default=str).decode(),
+                    now,
+                    now,
+                ),
+            )
+            return cursor.lastrowid
+
+    def claim_pending(self, limit: int, before: float) -> list[dict[str, Any]]:
+        """
+        재처리할 이벤트를 가져가며, 동시에 다른 곳에서 재처리하지 않도록 표시합니다.
+
+        before 이후에 상태가 바뀐 이벤트(이번 재처리에서 이미 실패한 이벤트)는 가져가지 않습니다.
+        """
+        now = time.time()
+        with self._connect() as connection:
+            connection.execute("begin immediate")
+            try:
+                rows = connection.execute(
+                    "select * from dead_letters where updated_at < ? and "
+                    "(status = 'pending' or (status = 'replaying' and updated_at < ?)) "
+                    "order by id limit ?",
+                    (before, now - STALE_REPLAY_SECONDS, limit),
+                ).fetchall()
+                connection.executemany(
+                    "update dead_letters set status = 'replaying', updated_at = ? "
+                    "where id = ?",
+                    [(now, row["id"]) for row in rows],
+                )
+                connection.execute("commit")
+            except Exception:
+                connection.execute("rollback")
+                raise
+
+        letters = []
+        for row in rows:
+            letter = dict(row)
+            letter["body"] = orjson.loads(letter["body"])
+            letter["state"] = orjson.loads(letter["state"])
+            letters.append(letter)
+        return letters
+
+    def mark_replayed(self, letter_id: int) -> None:
+        with self._connect() as connection:
+            connection.execute(
+                "update dead_letters set status = 'replayed', "
+                "replay_attempts = replay_attempts + 1, updated_at = ? where id = ?",
+                (time.time(), letter_id),
+            )
+
+    def mark_failed(self, letter_id: int, error: str) -> None:
+        """재처리 실패를 기록합니다. 최대 횟수를 넘기면 abandoned 로 남깁니다."""
+        with self._connect() as connection:
+            connection.execute(
+                "update dead_letters set "
+                "status = case when replay_attempts + 1 >= ? "
+                "then 'abandoned' else 'pending' end, "
+                "replay_attempts = replay_attempts + 1, last_error = ?, updated_at = ? "
+                "where id = ?",
+                (MAX_REPLAY_ATTEMPTS, error, time.time(), letter_id),
+            )
+
+    def summary(self) -> list[dict[str, Any]]:
+        """재처리를 기다리는 이벤트를 오류 지문별로 묶어 반환합니다."""
+        with self._connect() as connection:
+            rows = connection.execute(
+                "select fingerprint, listener, count(*) as count, "
+                "max(error) as error, max(created_at) as last_seen_at "
+                "from dead_letters where status = 'pending' "
+                "group by fingerprint, listener order by count desc"
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+
+dead_letter_store = DeadLetterStore()
+
+
+def get_dead_letter_state(context: dict[str, Any] | None) -> dict[str, Any] | None:
+    """재처리 중인 요청이면 처음 실패할 때 저장한 상태를 반환합니다."""
+    dead_letter = (context or {}).get(DEAD_LETTER_KEY)
+    return dead_letter["state"] if dead_letter else None
+
+
+async def capture(
+    body: dict[str, Any],
+    error: BaseException,
+    context: dict[str, Any] | None = None,
+    state: dict[str, Any] | None = None,
+) -> None:
+    """
+    처리에 실패한 이벤트를 재처리할 수 있도록 보관합니다.
+
+    재처리 중에 다시 실패한 경우에는 새로 보관하지 않고 재처리 결과로 기록합니다.
+
+    Args:
+        body: 요청 본문
+        error: 발생한 예외
+        context: Bolt 요청 context
+        state: 재처리할 때 핸들러가 이어서 처리하는 데 필요한 값 (이미 보낸 메시지의 ts 등)
+    """
+    completion: asyncio.Future | None = (context or {}).get(COMPLETION_KEY)
+    if (context or {}).get(DEAD_LETTER_KEY) is not None:
+        if completion is not None and not completion.done():
+            completion.set_exception(error)
+        return
+
+    listener = describe_listener(body)
+    try:
+        letter_id = await run_file_io(
+            dead_letter_store.add,
+            fingerprint(listener, error),
+            listener,
+            f"{type(error).__name__}: {error}",
+            body,
+            state or {},
+        )
+        logger.info(f"실패한 이벤트 보관 - ID: {letter_id}, Listener: {listener}")
+    except Exception as e:
+        logger.error(f"실패한 이벤트 보관 실패 - Listener: {listener}, Error: {str(e)}")
+
+
+async def _replay_one(app: AsyncApp, letter: dict[str, Any]) -> bool:
+    completion = asyncio.get_running_loop().create_future()
+    request = AsyncBoltRequest(
+        body=letter["body"],
+        mode="socket_mode",
+        context={
+            DEAD_LETTER_KEY: {"id": letter["id"], "state": letter["state"]},
+            COMPLETION_KEY: completion,
+        },
+    )
+    try:
+        response = await app.async_dispatch(request)
+        # ack 이후 핸들러가 실패해도 404 로 응답하므로, 핸들러가 실행되지 않은 경우만 구분합니다.
+        if response.status == 404 and not completion.done():
+            raise ValueError("이벤트를 처리할 리스너가 없습니다.")
+        # ack 이후에도 핸들러가 계속 실행되므로 끝날 때까지 기다립니다.
+        await asyncio.wait_for(completion, timeout=REPLAY_TIMEOUT_SECONDS)
+    except Exception as e:
+        await run_file_io(
+            dead_letter_store.mark_failed, letter["id"], f"{type(e).__name__}: {e}"
+        )
+        logger.warning(f"이벤트 재처리 실패 - ID: {letter['id']}, Error: {str(e)}")
+        return False
+
+    await run_file_io(dead_letter_store.mark_replayed, letter["id"])
+    logger.info(f"이벤트 재처리 완료 - ID: {letter['id']}")
+    return True
+
+
+async def replay_dead_letters(
+    app: AsyncApp, before: float, limit: int = REPLAY_BATCH_SIZE
+) -> tuple[int, int, bool]:
+    """
+    보관된 이벤트를 핸들러로 다시 처리합니다.
+
+    여러 번 실행되어도 같은 이벤트를 동시에 재처리하지 않으며, 성공한 이벤트는 다시
+    재처리하지 않습니다.
+
+    Args:
+        app: 이벤트를 처리할 Bolt 앱
+        before: 이 시각 이전에 보관되거나 실패한 이벤트만 재처리합니다.
+        limit: 한 번에 재처리할 최대 이벤트 수
+
+    Returns:
+        (성공한 수, 실패한 수, 남은 이벤트가 더 있을 수 있는지 여부)
+    """
+    letters = await run_file_io(dead_letter_store.claim_pending, limit, before)
+    semaphore = asyncio.Semaphore(REPLAY_CONCURRENCY)
+
+    async def replay(letter: dict[str, Any]) -> bool:
+        async with semaphore:
+            return await _replay_one(app, letter)
+
+    results = await asyncio.gather(*(replay(letter) for letter in letters))
+    succeeded = sum(results)
+    return succeeded, len(results) - succeeded, len(letters) == limit
@@ -0,0 +1,180 @@
+import argparse
+import asyncio
+import csv
+from pathlib import Path
+from typing import Any
+
+import orjson
+from loguru import logger
+
+from database import iter_retrospectives
+from database.archive import archive_store
+from file_io import run_file_io
+from utils import get_cohort_session_names, slack_link_to_markdown, tz_now
+
+EXPORT_FORMATS = ("ndjson", "csv", "parquet")
+
+# 내보낸 파일을 저장할 경로
+EXPORT_DIR = Path("store/exports")
+
+# 내보낼 컬럼 (순서 유지)
+EXPORT_COLUMNS = (
+    "id",
+    "user_id",
+    "session_name",
+    "slack_channel",
+    "slack_ts",
+    "good_points",
+    "improvements",
+    "learnings",
+    "action_item",
+    "emotion_score",
+    "emotion_reason",
+    "created_at",
+    "updated_at",
+)
+
+# Slack 링크 문법을 마크다운으로 변환할 컬럼
+TEXT_COLUMNS = (
+    "good_points",
+    "improvements",
+    "learnings",
+    "action_item",
+    "emotion_reason",
+)
+
+
+class _NdjsonWriter:
+    def __init__(self, path: Path) -> None:
+        self._file = open(path, "wb")
+
+    def write(self, rows: list[dict[str, Any]]) -> None:
+        self._file.write(b"".join(orjson.dumps(row) + b"\n" for row in rows))
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _CsvWriter:
+    def __init__(self, path: Path) -> None:
+        # 엑셀에서 한글이 깨지지 않도록 BOM 을 포함합니다.
+        self._file = open(path, "w", newline="", encoding="utf-8-sig")
+        self._writer = csv.DictWriter(self._file, fieldnames=EXPORT_COLUMNS)
+        self._writer.writeheader()
+
+    def write(self, rows: list[dict[str, Any]]) -> None:
+        self._writer.writerows(rows)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ParquetWriter:
+    def __init__(self, path: Path) -> None:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ValueError(
+                "parquet 형식으로 내보내려면 pyarrow 패키지를 설치해야 합니다."
+            )
+
+        self._pa = pa
+        self._schema = pa.schema(
+            [
+                (column, pa.int64() if column == "id" else pa.string())
+                for column in EXPORT_COLUMNS
+                if column != "emotion_score"
+            ]
+            + [("emotion_score", pa.int32())]
+        )
+        self._writer = pq.ParquetWriter(path, self._schema, compression="zstd")
+
+    def write(self, rows: list[dict[str, Any]]) -> None:
+        # 페이지마다 row group 하나로 기록하므로 전체를 메모리에 올리지 않습니다.
+        table = self._pa.Table.from_pylist(rows, schema=self._schema)
+        self._writer.write_table(table)
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+_WRITERS = {
+    "ndjson": _NdjsonWriter,
+    "csv": _CsvWriter,
+    "parquet": _ParquetWriter,
+}
+
+
+def _convert_row(row: dict[str, Any]) -> dict[str, Any]:
+    """내보낼 컬럼만 남기고 Slack 링크를 마크다운 링크로 변환합니다."""
+    converted = {column: row.get(column) for column in EXPORT_COLUMNS}
+    for column in TEXT_COLUMNS:
+        if converted[column]:
+            converted[column] = slack_link_to_markdown(converted[column])
+    return converted
+
+
+async def export_retrospectives(
+    export_format: str,
+    session_names: list[str] | None = None,
+    path: Path | None = None,
+) -> tuple[Path, int]:
+    """
+    회고 데이터를 페이지 단위로 읽으며 파일에 이어 씁니다.
+
+    Args:
+        export_format: 파일 형식 (ndjson, csv, parquet)
+        session_names: 내보낼 회차 이름 목록 (기본값: 전체)
+        path: 저장할 파일 경로 (기본값: store/exports/retrospectives_시각.형식)
+
+    Returns:
+        (저장된 파일 경로, 내보낸 회고 수)
+    """
+    if export_format not in _WRITERS:
+        raise ValueError(f"지원하지 않는 형식입니다: {export_format}")
+
+    if path is None:
+        timestamp = tz_now().strftime("%Y%m%d_%H%M%S")
+        path = EXPORT_DIR / f"retrospectives_{timestamp}.{export_format}"
+    await run_file_io(path.parent.mkdir, parents=True, exist_ok=True)
+
+    writer = await run_file_io(_WRITERS[export_format], path)
+    row_count = 0
+    try:
+        # 데이터베이스의 회고를 먼저 쓰고, 보관된 기수의 회고를 이어서 씁니다.
+        for pages in (
+            iter_retrospectives(session_names=session_names),
+            archive_store.iter_retrospectives(session_names=session_names),
+        ):
+            async for page in pages:
+                rows = [_convert_row(row) for row in page]
+                await run_file_io(writer.write, rows)
+                row_count += len(rows)
+    finally:
+        await run_file_io(writer.close)
+
+    logger.info(f"회고 내보내기 완료 - Path: {path}, Rows: {row_count}")
+    return path, row_count
+
+
+async def _main() -> None:
+    parser = argparse.ArgumentParser(description="회고 데이터를 파일로 내보냅니다.")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="ndjson")
+    parser.add_argument("--session", action="append", help="회차 이름 (여러 번 지정 가능)")
+    parser.add_argument("--cohort", help="기수 이름 (예: 3기)")
+    parser.add_argument("--output", type=Path, help="저장할 파일 경로")
+    args = parser.parse_args()
+
+    session_names = args.session
+    if args.cohort:
+        session_names = (session_names or []) + get_cohort_session_names(args.cohort)
+
+    path, row_count = await export_retrospectives(
+        args.format, session_names=session_names, path=args.output
+    )
+    print(f"{row_count}건을 {path} 에 저장했습니다.")
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -0,0 +1,382 @@
+import asyncio
+import random
+import sqlite3
+import time
+import traceback
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Iterator
+
+import orjson
+from loguru import logger
+from slack_sdk.web.async_client import AsyncWebClient
+
+from config import settings
+from file_io import run_file_io
+
+# 작업을 저장할 SQLite 파일 (같은 서버의 워커들이 함께 사용합니다)
+# 서버 디스크에 있으므로 다시 배포하면 남은 작업이 사라집니다. 사라져도 되는 작업이거나,
+# 완료를 멤버에게 따로 알려 알림이 없으면 다시 시도할 수 있는 작업만 맡깁니다.
+QUEUE_PATH = Path("store/jobs.sqlite3")
+
+# 우선순위 (숫자가 작을수록 먼저 실행합니다)
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 5
+PRIORITY_LOW = 9
+
+# 작업 하나의 최대 실행 시간(초)
+JOB_TIMEOUT_SECONDS = 240
+
+# 작업을 가져간 워커가 이 시간 안에 끝내지 못하면 (워커가 죽은 경우 등) 다른 워커가 다시 가져갑니다.
+VISIBILITY_TIMEOUT_SECONDS = 300
+
+# 재시도 대기 시간(초)
+RETRY_BASE_SECONDS = 5
+RETRY_MAX_SECONDS = 600
+
+# 새 작업이 없을 때 다시 확인하는 간격(초)
+POLL_INTERVAL_SECONDS = 1
+
+# 완료된 작업을 보관하는 기간(초)
+DONE_RETENTION_SECONDS = 7 * 24 * 60 * 60
+
+JobHandler = Callable[[AsyncWebClient, dict[str, Any]], Awaitable[None]]
+
+_handlers: dict[str, JobHandler] = {}
+
+
+def job_handler(kind: str) -> Callable[[JobHandler], JobHandler]:
+    """작업 종류를 처리할 함수를 등록합니다."""
+
+    def decorator(func: JobHandler) -> JobHandler:
+        _handlers[kind] = func
+        return func
+
+    return decorator
+
+
+_SCHEMA = (
+    "create table if not exists jobs ("
+    "id integer primary key autoincrement, "
+    "kind text not null, "
+    "payload text not null, "
+    "priority integer not null, "
+    "status text not null, "
+    "attempts integer not null default 0, "
+    "max_attempts integer not null, "
+    "available_at real not null, "
+    "locked_until real, "
+    "last_error text, "
+    "created_at real not null, "
+    "updated_at real not null)",
+    "create index if not exists jobs_ready_idx "
+    "on jobs (status, priority, available_at)",
+)
+
+
+def _row_to_job(row: sqlite3.Row) -> dict[str, Any]:
+    job = dict(row)
+    job["payload"] = orjson.loads(job["payload"])
+    return job
+
+
+class JobStore:
+    """SQLite 에 작업을 저장하고, 워커가 가져갈 작업을 원자적으로 선점합니다."""
+
+    def __init__(self, path: Path = QUEUE_PATH) -> None:
+        self._path = path
+        self._initialized = False
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        if not self._initialized:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+        # 트랜잭션은 직접 제어하고(isolation_level=None), 다른 워커가 쓰는 중이면 기다립니다.
+        connection = sqlite3.connect(self._path, timeout=30, isolation_level=None)
+        connection.row_factory = sqlite3.Row
+        try:
+            if not self._initialized:
+                connection.execute("pragma journal_mode=wal")
+                for statement in _SCHEMA:
+                    connection.execute(statement)
+                self._initialized = True
+            yield connection
+        finally:
+            connection.close()
+
+    def insert(
+        self,
+        kind: str,
+        payload: dict[str, Any],
+        priority: int,
+        delay_seconds: float,
+        max_attempts: int,
+    ) -> int:
+        now = time.time()
+        with self._connect() as connection:
+            cursor = connection.execute(
+                "insert into jobs (kind, payload, priority, status, max_attempts, "
+                "available_at, created_at, updated_at) "
+                "values (?, ?, ?, 'pending', ?, ?, ?, ?)",
+                (
+                    kind,
+                    orjson.dumps(payload).decode(),
+                    priority,
+                    max_attempts,
+                    now + delay_seconds,
+                    now,
+                    now,
+                ),
+            )
+            return cursor.lastrowid
+
+    def claim(
+        self, visibility_timeout: float, max_priority: int = PRIORITY_LOW
+    ) -> dict[str, Any] | None:
+        """
+        실행할 작업 하나를 선점합니다.
+
+        대기 중인 작업과, 다른 워커가 가져간 뒤 제한 시간 안에 끝내지 못한 작업을
+        우선순위, 실행 가능 시각 순으로 가져옵니다. max_priority 보다 우선순위가 낮은
+        작업은 가져가지 않습니다.
+        """
+        now = time.time()
+        with self._connect() as connection:
+            # 다른 워커 프로세스와 같은 작업을 가져가지 않도록 쓰기 잠금을 먼저 잡습니다.
+            connection.execute("begin immediate")
+            try:
+                row = connection.execute(
+                    "select * from jobs "
+                    "where ((status = 'pending' and available_at <= ?) "
+                    "or (status = 'running' and locked_until < ?)) and priority <= ? "
+                    "order by priority, available_at limit 1",
+                    (now, now, max_priority),
+                ).fetchone()
+                if row is not None:
+                    connection.execute(
+                        "update jobs set status = 'running', attempts = attempts + 1, "
+                        "locked_until = ?, updated_at = ? where id = ?",
+                        (now + visibility_timeout, now, row["id"]),
+                    )
+                connection.execute("commit")
+            except Exception:
+                connection.execute("rollback")
+                raise
+
+        if row is None:
+            return None
+        job = _row_to_job(row)
+        job["attempts"] += 1
+        return job
+
+    def complete(self, job_id: int) -> None:
+        with self._connect() as connection:
+            connection.execute(
+                "update jobs set status = 'done', locked_until = null, updated_at = ? "
+                "where id = ?",
+                (time.time(), job_id),
+            )
+
+    def fail(self, job_id: int, error: str, retry_at: float | None) -> None:
+        """실패를 기록합니다. retry_at 이 없으면 더 이상 재시도하지 않습니다."""
+        with self._connect() as connection:
+            if retry_at is None:
+                connection.execute(
+                    "update jobs set status = 'failed', locked_until = null, "
+                    "last_error = ?, updated_at = ? where id = ?",
+                    (error, time.time(), job_id),
+                )
+            else:
+                connection.execute(
+                    "update jobs set status = 'pending', locked_until = null, "
+                    "available_at = ?, last_error = ?, updated_at = ? where id = ?",
+                    (retry_at, error, time.time(), job_id),
+                )
+
+    def release(self, job_ids: list[int]) -> None:
+        """종료하는 워커가 실행 중이던 작업을 바로 다시 가져갈 수 있게 돌려놓습니다."""
+        with self._connect() as connection:
+            connection.executemany(
+                "update jobs set status = 'pending', attempts = attempts - 1, "
+                "locked_until = null, updated_at = ? where id = ? and status = 'running'",
+                [(time.time(), job_id) for job_id in job_ids],
+            )
+
+    def purge_done(self, older_than: float) -> int:
+        with self._connect() as connection:
+            cursor = connection.execute(
+                "delete from jobs where status = 'done' and updated_at < ?",
+                (older_than,),
+            )
+            return cursor.rowcount
+
+    def count_by_status(self) -> dict[str, int]:
+        with self._connect() as connection:
+            rows = connection.execute(
+                "select status, count(*) as count from jobs group by status"
+            ).fetchall()
+        return {row["status"]: row["count"] for row in rows}
+
+    def list_jobs(self, status: str, limit: int) -> list[dict[str, Any]]:
+        with self._connect() as connection:
+            rows = connection.execute(
+                "select * from jobs where status = ? "
+                "order by priority, available_at limit ?",
+                (status, limit),
+            ).fetchall()
+        return [_row_to_job(row) for row in rows]
+
+
+def _retry_delay(attempts: int) -> float:
+    """지수적으로 늘어나는 재시도 대기 시간 (여러 작업이 동시에 몰리지 않도록 흔들어 줍니다)"""
+    delay = min(RETRY_BASE_SECONDS * 2 ** (attempts - 1), RETRY_MAX_SECONDS)
+    return delay * random.uniform(0.8, 1.2)
+
+
+class JobQueue:
+    """
+    프로세스를 다시 시작해도 사라지지 않는 백그라운드 작업 큐입니다. (같은 서버의 디스크에 저장합니다)
+
+    핸들러는 작업을 직접 처리하는 대신 enqueue 로 등록하고, 정해진 수의 작업자가
+    우선순위 순으로 작업을 가져가 실행합니다. 실패한 작업은 대기 시간을 늘려가며 재시도하고,
+    최대 시도 횟수를 넘기면 failed 상태로 남깁니다.
+    """
+
+    def __init__(self, store: JobStore, concurrency: int) -> None:
+        self.store = store
+        self._concurrency = concurrency
+        self._wakeup: asyncio.Event | None = None
+        self._running: dict[int, dict[str, Any]] = {}
+        # 지금 실행해도 되는 작업의 최저 우선순위 (부하가 높을 때 낮은 우선순위 작업을 미룹니다)
+        self.max_priority: Callable[[], int] = lambda: PRIORITY_LOW
+
+    async def enqueue(
+        self,
+        kind: str,
+        payload: dict[str, Any],
+        priority: int = PRIORITY_NORMAL,
+        delay_seconds: float = 0,
+        max_attempts: int = 5,
+    ) -> int:
+        """
+        작업을 등록합니다.
+
+        Args:
+            kind: 작업 종류 (job_handler 로 등록한 이름)
+            payload: 작업에 넘길 값 (JSON 으로 저장할 수 있어야 합니다)
+            priority: 우선순위 (PRIORITY_HIGH, PRIORITY_NORMAL, PRIORITY_LOW)
+            delay_seconds: 이 시간이 지난 뒤에 실행합니다.
+            max_attempts: 최대 시도 횟수
+        """
+        job_id = await run_file_io(
+            self.store.insert, kind, payload, priority, delay_seconds, max_attempts
+        )
+        if self._wakeup is not None and delay_seconds <= 0:
+            self._wakeup.set()
+        return job_id
+
+    async def run(self, client: AsyncWebClient) -> None:
+        """작업자를 실행합니다. 취소되면 실행 중이던 작업을 큐에 돌려놓습니다."""
+        # 작업 핸들러를 등록합니다.
+        import jobs.tasks  # noqa: F401
+
+        self._wakeup = asyncio.Event()
+        workers = [
+            asyncio.create_task(self._work(client)) for _ in range(self._concurrency)
+        ]
+        try:
+            while True:
+                await asyncio.sleep(60 * 60)
+                await run_file_io(
+                    self.store.purge_done, time.time() - DONE_RETENTION_SECONDS
+                )
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            if self._running:
+                await run_file_io(self.store.release, list(self._running))
+
+    async def _work(self, client: AsyncWebClient) -> None:
+        while True:
+            try:
+                job = await run_file_io(
+                    self.store.claim, VISIBILITY_TIMEOUT_SECONDS, self.max_priority()
+                )
+            except Exception as e:
+                logger.error(f"작업 가져오기 실패 - Error: {str(e)}")
+                job = None
+
+            if job is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(
+                        self._wakeup.wait(), timeout=POLL_INTERVAL_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            # 취소되면 실행 중인 작업으로 남겨 두었다가 run 에서 큐에 돌려놓습니다.
+            self._running[job["id"]] = job
+            try:
+                await self._execute(client, job)
+            except Exception as e:
+                # 결과를 기록하지 못한 작업은 제한 시간이 지나면 다시 실행됩니다.
+                logger.error(f"작업 결과 기록 실패 - ID: {job['id']}, Error: {str(e)}")
+            self._running.pop(job["id"], None)
+
+    async def _execute(self, client: AsyncWebClient, job: dict[str, Any]) -> None:
+        handler = _handlers.get(job["kind"])
+        try:
+            if handler is None:
+                raise ValueError(f"등록되지 않은 작업 종류입니다: {job['kind']}")
+            await asyncio.wait_for(
+                handler(client, job["payload"]), timeout=JOB_TIMEOUT_SECONDS
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}\n{traceback.format_exc(limit=5)}"
+            retry_at = None
+            if handler is not None and job["attempts"] < job["max_attempts"]:
+                retry_at = time.time() + _retry_delay(job["attempts"])
+            await run_file_io(self.store.fail, job["id"], error, retry_at)
+            logger.warning(
+                f"작업 실패 - ID: {job['id']}, Kind: {job['kind']}, "
+                f"Attempt: {job['attempts']}/{job['max_attempts']}, "
+                f"Retry: {retry_at is not None}, Error: {str(e)}"
+            )
+            return
+
+        await run_file_io(self.store.complete, job["id"])
+        logger.info(
+            f"작업 완료 - ID: {job['id']}, Kind: {job['kind']}, Attempt: {job['attempts']}"
+        )
+
+    async def status(self, limit: int = 10) -> dict[str, Any]:
+        """상태별 작업 수와 대기/실패 중인 작업 목록을 반환합니다."""
+        counts = await run_file_io(self.store.count_by_status)
+        pending = await run_file_io(self.store.list_jobs, "pending", limit)
+        failed = await run_file_io(self.store.list_jobs, "failed", limit)
+        return {"counts": counts, "pending": pending, "failed": failed}
+
+
+job_queue = JobQueue(JobStore(), concurrency=settings.JOB_QUEUE_CONCURRENCY)
+
+
+async def enqueue(
+    kind: str,
+    payload: dict[str, Any],
+    priority: int = PRIORITY_NORMAL,
+    delay_seconds: float = 0,
+    max_attempts: int = 5,
+) -> int:
+    """작업 큐에 작업을 등록합니다."""
+    return await job_queue.enqueue(
+        kind,
+        payload,
+        priority=priority,
+        delay_seconds=delay_seconds,
+        max_attempts=max_attempts,
+    )
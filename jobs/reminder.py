@@ -0,0 +1,156 @@
+import asyncio
+import datetime
+import time
+from dataclasses import dataclass
+
+from loguru import logger
+from slack_sdk.web.async_client import AsyncWebClient
+
+from config import settings
+from constants import DUE_DATES, SESSION_NAMES
+from database import get_submitted_user_ids
+from slack.members import get_channel_member_ids
+from slack.rate_limiter import AsyncRateLimiter
+from utils import format_remaining_time, tz_now
+
+# 동시에 보낼 수 있는 리마인더 DM 수
+REMINDER_CONCURRENCY = 5
+
+
+@dataclass
+class ReminderReport:
+    """리마인더 실행 결과"""
+
+    session_name: str
+    member_count: int
+    submitted_count: int
+    target_count: int
+    sent_count: int
+    failed_count: int
+    dry_run: bool
+    elapsed_seconds: float
+
+    def to_text(self) -> str:
+        mode = " (dry-run)" if self.dry_run else ""
+        return (
+            f"⏰ `{self.session_name}` 리마인더 실행 결과{mode}\n"
+            f"채널 멤버: {self.member_count}명 | 제출: {self.submitted_count}명 | "
+            f"대상: {self.target_count}명\n"
+            f"발송: {self.sent_count}건 | 실패: {self.failed_count}건 | "
+            f"소요 시간: {self.elapsed_seconds:.2f}초"
+        )
+
+
+def get_next_reminder(
+    current_time: datetime.datetime | None = None,
+) -> tuple[datetime.datetime, int] | None:
+    """
+    다음 리마인더 발송 시각과 대상 회차 인덱스를 반환합니다.
+
+    회차 인덱스 i 의 회고는 DUE_DATES[i] 까지 공유해야 하므로,
+    DUE_DATES[i] - 오프셋 시각에 SESSION_NAMES[i] 미제출자에게 알립니다.
+    """
+    if current_time is None:
+        current_time = tz_now()
+
+    candidates = [
+        (due_date - datetime.timedelta(hours=hours), session_idx)
+        for session_idx, due_date in enumerate(DUE_DATES)
+        for hours in settings.REMINDER_OFFSETS_HOURS
+        if due_date - datetime.timedelta(hours=hours) > current_time
+    ]
+    return min(candidates, default=None)
+
+
+async def send_reminders(
+    client: AsyncWebClient,
+    session_idx: int,
+    dry_run: bool = False,
+) -> ReminderReport:
+    """
+    채널 멤버 중 해당 회차 회고를 공유하지 않은 멤버에게 DM을 보냅니다.
+
+    Args:
+        client: 슬랙 클라이언트
+        session_idx: 대상 회차 인덱스
+        dry_run: True 이면 대상만 계산하고 DM은 보내지 않습니다.
+
+    Returns:
+        리마인더 실행 결과
+    """
+    started_at = time.perf_counter()
+    session_name = SESSION_NAMES[session_idx]
+
+    member_ids, submitted_ids, auth = await asyncio.gather(
+        get_channel_member_ids(client, settings.MEMBERS_CHANNEL),
+        get_submitted_user_ids(session_name),
+        client.auth_test(),
+    )
+    target_ids = member_ids - submitted_ids - {auth["user_id"]}
+
+    remaining = DUE_DATES[session_idx] - tz_now()
+    text = (
+        f"👋 아직 `{session_name}` 회고를 공유하지 않았어요!\n"
+        f"마감까지 `{format_remaining_time(remaining)}` 남았어요. "
+        "`/공유` 명령어로 회고를 공유해주세요. 🙌"
+    )
+
+    sent_count = 0
+    failed_count = 0
+    if not dry_run:
+        limiter = AsyncRateLimiter(settings.REMINDER_RATE_PER_SECOND)
+        semaphore = asyncio.Semaphore(REMINDER_CONCURRENCY)
+
+        async def send(user_id: str) -> bool:
+            async with semaphore:
+                try:
+                    await limiter.call(
+                        client.chat_postMessage, channel=user_id, text=text
+                    )
+                    return True
+                except Exception as e:
+                    logger.error(f"리마인더 발송 실패 - User: {user_id}, Error: {str(e)}")
+                    return False
+
+        results = await asyncio.gather(*(send(user_id) for user_id in target_ids))
+        sent_count = sum(results)
+        failed_count = len(results) - sent_count
+
+    report = ReminderReport(
+        session_name=session_name,
+        member_count=len(member_ids),
+        submitted_count=len(submitted_ids),
+        target_count=len(target_ids),
+        sent_count=sent_count,
+        failed_count=failed_count,
+        dry_run=dry_run,
+        elapsed_seconds=time.perf_counter() - started_at,
+    )
+    logger.info(report.to_text())
+    return report
+
+
+async def reminder_loop(client: AsyncWebClient) -> None:
+    """마감 전 설정된 시각마다 미제출자 리마인더를 보냅니다."""
+    if not settings.MEMBERS_CHANNEL:
+        logger.warning("MEMBERS_CHANNEL 환경변수가 존재하지 않습니다.")
+        return
+
+    while True:
+        next_reminder = get_next_reminder()
+        if next_reminder is None:
+            logger.info("남은 마감일이 없어 리마인더를 종료합니다.")
+            return
+
+        fire_at, session_idx = next_reminder
+        await asyncio.sleep((fire_at - tz_now()).total_seconds())
+
+        try:
+            report = await send_reminders(
+                client, session_idx, dry_run=settings.REMINDER_DRY_RUN
+            )
+            await client.chat_postMessage(
+                channel=settings.ADMIN_CHANNEL, text=report.to_text()
+            )
+        except Exception as e:
+            logger.error(f"리마인더 실행 실패 - Error: {str(e)}")
@@ -0,0 +1,153 @@
+from typing import Any
+
+from slack_sdk.errors import SlackApiError
+from slack_sdk.web.async_client import AsyncWebClient
+
+from config import settings
+from database import upsert_retrospectives_from_slack
+from file_io import run_file_io
+from jobs.queue import PRIORITY_LOW, enqueue, job_handler
+from utils import cleanup_temp_files
+
+SAVED_TEXT = "지연되었던 `{session_name}` 회고를 저장했어요. 기다려주셔서 고마워요! 🙌"
+
+
+@job_handler("post_message")
+async def post_message(client: AsyncWebClient, payload: dict[str, Any]) -> None:
+    """메시지를 보냅니다. (payload 는 chat_postMessage 인자)"""
+    await client.chat_postMessage(**payload)
+
+
+@job_handler("save_retrospective")
+async def save_retrospective(client: AsyncWebClient, payload: dict[str, Any]) -> None:
+    """
+    데이터베이스가 응답하지 않아 미뤄둔 회고를 저장합니다. (payload 는 회고 데이터)
+
+    같은 회차에 제출한 회고가 이미 저장되어 있으면 건너뜁니다.
+    작업 큐는 다시 배포하면 사라지므로, 저장이 끝난 뒤에야 멤버에게 저장했다고 알리고
+    임시 저장한 내용을 지웁니다.
+    """
+    await upsert_retrospectives_from_slack([payload])
+    await cleanup_temp_files(payload["user_id"])
+    await client.chat_postMessage(
+        channel=payload["user_id"],
+        text=SAVED_TEXT.format(session_name=payload["session_name"]),
+    )
+
+
+@job_handler("export_retrospectives")
+async def export_retrospectives(client: AsyncWebClient, payload: dict[str, Any]) -> None:
+    """
+    회고를 파일로 내보내 관리자 채널에 올리고, 요청한 관리자에게 알리는 작업을 등록합니다.
+
+    내보낸 파일은 작업을 실행한 서버의 디스크에만 있으므로 같은 작업에서 올리고 지웁니다.
+    """
+    from jobs.export import export_retrospectives as export
+    from slack.files import upload_file
+
+    user_id = payload["user_id"]
+    target = payload["target"]
+    path, row_count = await export(payload["export_format"], payload["session_names"])
+    try:
+        file = await upload_file(
+            client,
+            path,
+            channel=settings.ADMIN_CHANNEL,
+            title=f"회고 내보내기 - {target}",
+            initial_comment=f"<@{user_id}> `{target}` 회고 {row_count}건을 내보냈어요.",
+        )
+    finally:
+        await run_file_io(path.unlink, missing_ok=True)
+
+    await enqueue(
+        "post_message",
+        {
+            "channel": user_id,
+            "text": f"`{target}` 회고 {row_count}건을 내보냈어요. 👉 {file['permalink']}",
+        },
+        priority=PRIORITY_LOW,
+    )
+
+
+@job_handler("invite_member")
+async def invite_member(client: AsyncWebClient, payload: dict[str, Any]) -> None:
+    """멤버를 여러 채널에 초대하는 작업을 채널별 작업으로 나누어 등록합니다."""
+    user_id = payload["user_id"]
+    channel_ids = payload.get("channel_ids") or await _fetch_public_channel_ids(client)
+
+    await client.chat_postMessage(
+        channel=settings.ADMIN_CHANNEL,
+        text=f"<@{user_id}> 님의 채널 초대를 시작합니다.\n\n채널 수 : {len(channel_ids)} 개\n",
+    )
+    for channel_id in channel_ids:
+        await enqueue(
+            "invite_channel",
+            {"user_id": user_id, "channel_id": channel_id},
+            priority=PRIORITY_LOW,
+        )
+
+
+@job_handler("invite_channel")
+async def invite_channel(client: AsyncWebClient, payload: dict[str, Any]) -> None:
+    """채널에 멤버를 초대하고 결과를 관리자 채널에 알립니다."""
+    user_id = payload["user_id"]
+    channel_id = payload["channel_id"]
+
+    try:
+        await client.conversations_invite(channel=channel_id, users=user_id)
+        result = " -> ✅ (채널 초대)"
+    except SlackApiError as e:
+        # 봇이 채널에 없는 경우, 채널에 참여하고 초대합니다.
+        if e.response["error"] == "not_in_channel":
+            await client.conversations_join(channel=channel_id)
+            await client.conversations_invite(channel=channel_id, users=user_id)
+            result = " -> ✅ (시공봇도 함께 채널 초대)"
+        elif e.response["error"] == "already_in_channel":
+            result = " -> ✅ (이미 채널에 참여 중)"
+        elif e.response["error"] == "cant_invite_self":
+            result = " -> ✅ (시공봇이 자기 자신을 초대)"
+        elif e.response["error"] == "ratelimited":
+            # 작업 큐가 대기 시간을 늘려가며 다시 시도합니다.
+            raise
+        else:
+            link = "<https://api.slack.com/methods/conversations.invite#errors|문서 확인하기>"
+            result = f" -> 😵 ({e.response['error']}) 👉 {link}"
+
+    await client.chat_postMessage(
+        channel=settings.ADMIN_CHANNEL,
+        text=f"\n<#{channel_id}>" + result,
+    )
+
+
+@job_handler("replay_dead_letters")
+async def replay_dead_letters(client: AsyncWebClient, payload: dict[str, Any]) -> None:
+    """
+    보관된 이벤트를 나누어 재처리하고, 모두 끝나면 관리자 채널에 결과를 알립니다.
+
+    작업 시간 제한을 넘지 않도록 한 번에 일부만 처리하고 남은 이벤트는 다음 작업에 넘깁니다.
+    """
+    from jobs.dead_letter import replay_dead_letters as replay
+    from slack.event_handler import app
+
+    succeeded, failed, has_more = await replay(app, payload["before"])
+    succeeded += payload.get("succeeded", 0)
+    failed += payload.get("failed", 0)
+
+    if has_more:
+        await enqueue(
+            "replay_dead_letters",
+            {**payload, "succeeded": succeeded, "failed": failed},
+        )
+        return
+
+    await client.chat_postMessage(
+        channel=settings.ADMIN_CHANNEL,
+        text=f"<@{payload['user_id']}> 님이 요청한 이벤트 재처리가 끝났습니다.\n\n"
+        f"성공 : {succeeded} 개 | 실패 : {failed} 개",
+    )
+
+
+async def _fetch_public_channel_ids(client: AsyncWebClient) -> list[str]:
+    """모든 공개 채널의 아이디를 조회합니다."""
+    res = await client.conversations_list(limit=500, types="public_channel")
+    return [channel["id"] for channel in res["channels"]]
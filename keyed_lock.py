@@ -0,0 +1,73 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+
+class KeyedLock:
+    """
+    키(멤버 ID, 회고 ID 등)별로 잡는 비동기 잠금입니다.
+
+    잠금은 처음 필요할 때 만들고, 기다리는 곳이 없어지면 바로 정리하므로 사용 중인 키만
+    메모리에 남습니다. 사용 중인 키가 max_keys 개를 넘으면 새 키는 잠금을 잡지 못합니다.
+    """
+
+    def __init__(self, max_keys: int) -> None:
+        self._max_keys = max_keys
+        # 키별 잠금과, 잠금을 잡고 있거나 기다리는 수
+        self._locks: dict[str, tuple[asyncio.Lock, int]] = {}
+        self._contended = 0
+        self._timeouts = 0
+
+    @asynccontextmanager
+    async def hold(self, key: str, timeout: float | None = None) -> AsyncIterator[None]:
+        """
+        키의 잠금을 잡고 있는 동안 실행합니다.
+
+        Args:
+            key: 잠글 키
+            timeout: 잠금을 기다리는 최대 시간(초) (None 이면 계속 기다립니다)
+
+        Raises:
+            asyncio.TimeoutError: 시간 안에 잠금을 잡지 못했거나 사용 중인 키가 너무 많은 경우
+        """
+        if key not in self._locks and len(self._locks) >= self._max_keys:
+            self._timeouts += 1
+            raise asyncio.TimeoutError
+
+        lock, refs = self._locks.get(key, (asyncio.Lock(), 0))
+        self._locks[key] = (lock, refs + 1)
+        try:
+            if lock.locked():
+                self._contended += 1
+            try:
+                # wait_for 와 달리 잠금을 잡은 직후에 시간이 다 되어도 잡은 잠금을 놓치지 않습니다.
+                async with asyncio.timeout(timeout):
+                    await lock.acquire()
+            except asyncio.TimeoutError:
+                self._timeouts += 1
+                raise
+            try:
+                yield
+            finally:
+                lock.release()
+        finally:
+            lock, refs = self._locks[key]
+            if refs == 1:
+                del self._locks[key]
+            else:
+                self._locks[key] = (lock, refs - 1)
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            "keys": len(self._locks),
+            "max_keys": self._max_keys,
+            "contended": self._contended,
+            "timeouts": self._timeouts,
+        }
+
+
+# 같은 멤버의 회고 제출을 하나씩 처리합니다.
+submission_locks = KeyedLock(max_keys=1024)
+
+# 같은 회고를 여러 관리자가 동시에 수정하지 않도록 합니다.
+retrospective_locks = KeyedLock(max_keys=256)
@@ -0,0 +1,164 @@
+import asyncio
+import fcntl
+import os
+import socket
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Protocol
+
+from loguru import logger
+
+from config import settings
+
+# 같은 서버의 워커끼리 리더를 정할 때 사용하는 잠금 파일
+LOCK_PATH = Path("store/leader.lock")
+
+# Supabase 리스 이름과 유지 시간(초)
+LEASE_NAME = "scheduler"
+LEASE_TTL_SECONDS = 30
+
+
+class LeaderLock(Protocol):
+    async def try_acquire(self) -> bool: ...
+
+    async def release(self) -> None: ...
+
+
+class FileLeaderLock:
+    """
+    fcntl 파일 잠금으로 같은 서버의 워커 중 하나를 리더로 정합니다.
+
+    잠금은 프로세스가 종료되면 운영체제가 해제하므로 리더가 죽으면 다른 워커가 이어받습니다.
+    """
+
+    def __init__(self, path: Path = LOCK_PATH) -> None:
+        self._path = path
+        self._fd: int | None = None
+
+    async def try_acquire(self) -> bool:
+        if self._fd is not None:
+            return True
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        self._fd = fd
+        return True
+
+    async def release(self) -> None:
+        if self._fd is None:
+            return
+        fcntl.flock(self._fd, fcntl.LOCK_UN)
+        os.close(self._fd)
+        self._fd = None
+
+
+class PostgresLeaderLease:
+    """
+    Supabase 의 리스 행으로 여러 서버의 워커 중 하나를 리더로 정합니다. (leader.sql 적용 필요)
+
+    PostgREST 는 요청마다 연결을 돌려쓰므로 세션 단위 advisory lock 을 유지할 수 없습니다.
+    대신 함수 안에서 트랜잭션 단위 advisory lock 으로 순서를 맞추고, 만료 시각이 있는 리스를 갱신합니다.
+    """
+
+    def __init__(
+        self, name: str = LEASE_NAME, ttl_seconds: int = LEASE_TTL_SECONDS
+    ) -> None:
+        self._name = name
+        self._ttl_seconds = ttl_seconds
+        self._holder = f"{socket.gethostname()}:{os.getpid()}"
+
+    async def try_acquire(self) -> bool:
+        from database.supabase import supabase
+
+        result = await supabase.rpc(
+            "try_acquire_leader_lease",
+            {
+                "lease_name": self._name,
+                "lease_holder": self._holder,
+                "ttl_seconds": self._ttl_seconds,
+            },
+        ).execute()
+        return bool(result.data)
+
+    async def release(self) -> None:
+        from database.supabase import supabase
+
+        await supabase.rpc(
+            "release_leader_lease",
+            {"lease_name": self._name, "lease_holder": self._holder},
+        ).execute()
+
+
+class LeaderElection:
+    """
+    리더로 선출된 워커에서만 스케줄러 작업(리마인더, 백업 등)을 실행합니다.
+
+    주기적으로 리더 자격을 갱신하고, 자격을 잃으면 실행 중인 작업을 취소합니다.
+    갱신에 실패하면 다른 워커와 동시에 실행되지 않도록 리더에서 물러납니다.
+    """
+
+    def __init__(self, lock: LeaderLock, renew_interval: float) -> None:
+        self._lock = lock
+        self._renew_interval = renew_interval
+        self._tasks: dict[str, asyncio.Task] = {}
+        self.is_leader = False
+
+    async def run(self, jobs: dict[str, Callable[[], Awaitable[Any]]]) -> None:
+        """
+        리더 자격을 유지하며 작업을 실행합니다.
+
+        Args:
+            jobs: 작업 이름과 작업을 시작하는 함수
+        """
+        try:
+            while True:
+                try:
+                    acquired = await self._lock.try_acquire()
+                except Exception as e:
+                    logger.error(f"리더 자격 갱신 실패 - Error: {str(e)}")
+                    acquired = False
+
+                if acquired and not self.is_leader:
+                    self._start(jobs)
+                elif not acquired and self.is_leader:
+                    self._stop()
+
+                await asyncio.sleep(self._renew_interval)
+        finally:
+            self._stop()
+            try:
+                await self._lock.release()
+            except Exception as e:
+                logger.warning(f"리더 자격 반납 실패 - Error: {str(e)}")
+
+    def _start(self, jobs: dict[str, Callable[[], Awaitable[Any]]]) -> None:
+        self.is_leader = True
+        self._tasks = {name: asyncio.create_task(job()) for name, job in jobs.items()}
+        logger.info(
+            f"리더로 선출되어 스케줄러 작업을 시작합니다 - Worker: {settings.WORKER_ID}, "
+            f"Jobs: {', '.join(jobs)}"
+        )
+
+    def _stop(self) -> None:
+        if not self.is_leader:
+            return
+        self.is_leader = False
+        for task in self._tasks.values():
+            task.cancel()
+        self._tasks = {}
+        logger.warning(
+            f"리더 자격을 잃어 스케줄러 작업을 중지합니다 - Worker: {settings.WORKER_ID}"
+        )
+
+
+def create_leader_election() -> LeaderElection:
+    """LEADER_LOCK 설정에 맞는 리더 선출기를 만듭니다."""
+    if settings.LEADER_LOCK == "postgres":
+        return LeaderElection(
+            PostgresLeaderLease(), renew_interval=LEASE_TTL_SECONDS / 3
+        )
+    return LeaderElection(FileLeaderLock(), renew_interval=5)
@@ -16,7 +16,13 @@ def filter(record):
     return True
 
 
-logger.add("store/logs.csv", format="{time},{level},{message}", filter=filter)
+# 파일 쓰기가 이벤트 루프를 막지 않도록 별도 스레드의 큐를 통해 기록합니다.
+logger.add(
+    "store/logs.csv",
+    format="{time},{level},{message}",
+    filter=filter,
+    enqueue=True,
+)
 
 
 def default(obj: Any) -> str | list[Any] | dict[str, Any]:
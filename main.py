@@ -2,15 +2,106 @@ import asyncio
 import os
 import aiohttp
 from aiohttp import web
+from slack_bolt.adapter.aiohttp import to_aiohttp_response, to_bolt_request
 from loguru import logger
-from slack_bolt.adapter.socket_mode.aiohttp import AsyncSocketModeHandler
 from config import settings
+from database.realtime import change_feed, start_change_feed
+from database.resilience import supabase_resilience
+from database.supabase import SupabaseClient
+from file_io import file_io
+from jobs.queue import job_queue
+from jobs.reminder import reminder_loop
+from keyed_lock import retrospective_locks, submission_locks
+from leader import create_leader_election
+from slack.admission import admission
 from slack.event_handler import app as slack_app
+from slack.lazy import preload_listeners
+from slack.members import get_channel_member_ids
+from slack.socket_pool import MAX_CONNECTIONS, SocketModePool
+from startup import startup
+from utils import get_current_session_info
 
 async def health_check(request):
     return web.Response(text="OK", status=200)
 
 
+async def ready_check(request):
+    """시작 단계가 모두 끝나고 Slack 에 연결되어 있을 때만 200 을 반환합니다."""
+    report = await startup.report()
+    return web.json_response(report, status=200 if report["ready"] else 503)
+
+
+async def metrics(request):
+    """Socket Mode 연결 상태, 요청 우선순위 처리, 잠금, Supabase 회로 차단기와 연결 풀, 파일 I/O 스레드 풀 현황을 반환합니다."""
+    handler: SocketModePool | None = request.app["socket_mode"]
+    return web.json_response(
+        {
+            "socket_mode": await handler.metrics() if handler else None,
+            "admission": admission.metrics(),
+            "supabase": supabase_resilience.metrics(),
+            "supabase_http": SupabaseClient.metrics(),
+            "file_io": file_io.metrics(),
+            "locks": {
+                "submission": submission_locks.metrics(),
+                "retrospective": retrospective_locks.metrics(),
+            },
+        }
+    )
+
+
+async def slack_events(request):
+    """Events API 요청을 Bolt 앱으로 전달합니다. (서명은 Bolt 가 검증합니다)"""
+    bolt_response = await slack_app.async_dispatch(await to_bolt_request(request))
+    return await to_aiohttp_response(bolt_response)
+
+
+async def preload_emotion_analytics():
+    """감정 점수 분석 데이터를 미리 계산합니다. (numpy 를 시작 이후에 가져옵니다)"""
+    from analytics.emotion import get_emotion_analytics
+
+    await get_emotion_analytics()
+
+
+async def load_fulltext_index():
+    """전문 검색 색인을 불러옵니다. (검색 모듈을 시작 이후에 가져옵니다)"""
+    from search.fulltext import fulltext_index
+
+    await fulltext_index.ensure_loaded()
+
+
+async def load_typeahead():
+    """관리자 회고 검색 색인을 불러옵니다. (검색 모듈을 시작 이후에 가져옵니다)"""
+    from search.typeahead import typeahead
+
+    await typeahead.ensure_loaded()
+
+
+async def load_warm_store():
+    """현재 기수 회고를 메모리에 불러옵니다."""
+    from database.warm_store import warm_store
+
+    await warm_store.reload()
+
+
+async def run_backup_loop():
+    """야간 증분 백업을 실행합니다. (백업 모듈을 리더 워커에서만 가져옵니다)"""
+    from jobs.backup import backup_loop
+
+    await backup_loop()
+
+
+async def warm_up_supabase():
+    """Supabase 클라이언트를 만들고 (supabase 패키지를 스레드에서 가져옵니다) 연결을 미리 맺습니다."""
+    await asyncio.to_thread(SupabaseClient.get_instance)
+    await SupabaseClient.warm_up()
+
+
+async def preload_session_calendar():
+    """회차 일정을 계산해 두고 현재 회차를 기록합니다."""
+    session_idx, session_name, remaining, is_active = get_current_session_info()
+    logger.info(f"현재 회차: {session_name} (남은 시간: {remaining}, 활성: {is_active})")
+
+
 async def ping_self_loop():
     url = os.environ.get("KOYEB_URL", "").strip()
 
@@ -29,42 +120,123 @@ async def ping_self_loop():
         await asyncio.sleep(300)  # 5분 간격
 
 async def main():
+    if settings.SLACK_MODE not in ("socket", "http"):
+        raise ValueError(
+            f"SLACK_MODE 는 socket 또는 http 여야 합니다: {settings.SLACK_MODE}"
+        )
+    if settings.SLACK_MODE == "http" and not settings.SLACK_SIGNING_SECRET:
+        raise ValueError("HTTP 모드에서는 SLACK_SIGNING_SECRET 환경변수가 필요합니다.")
+
+    # Slack 핸들러 설정 (여러 연결을 유지해 재연결 중에도 요청을 받습니다)
+    # HTTP 모드에서는 Slack 이 /slack/events 로 요청을 보내므로 연결을 열지 않습니다.
+    handler = None
+    if settings.SLACK_MODE == "socket":
+        # 여러 워커로 실행하면 Slack 의 앱당 연결 수 제한을 넘지 않도록 워커별 연결 수를 나눕니다.
+        handler = SocketModePool(
+            app=slack_app,
+            app_token=settings.SLACK_APP_TOKEN,
+            size=min(
+                settings.SOCKET_MODE_CONNECTIONS,
+                max(1, MAX_CONNECTIONS // settings.WORKERS),
+            ),
+            max_age_seconds=settings.SOCKET_MODE_MAX_AGE_MINUTES * 60,
+        )
+
     # HTTP 서버 설정
     app = web.Application()
+    app["socket_mode"] = handler
     app.router.add_get("/", health_check)
     app.router.add_get("/health", health_check)
+    app.router.add_get("/ready", ready_check)
+    app.router.add_get("/metrics", metrics)
+    if handler is None:
+        app.router.add_post("/slack/events", slack_events)
     runner = web.AppRunner(app)
     await runner.setup()
-    site = web.TCPSite(runner, "0.0.0.0", 8000)
-    
-    # Slack 핸들러 설정
-    handler = AsyncSocketModeHandler(
-        app=slack_app,
-        app_token=settings.SLACK_APP_TOKEN,
-    )
+    # 여러 워커로 실행하면 같은 포트를 함께 열어 요청을 나누어 받습니다.
+    site = web.TCPSite(runner, "0.0.0.0", 8000, reuse_port=settings.WORKERS > 1)
     
     try:
         # HTTP 서버 시작
         await site.start()
         logger.info("Health check server started on port 8000")
         
-        # Self-ping 태스크 시작
-        ping_task = asyncio.create_task(ping_self_loop())
-        logger.info("Self-ping task started")
-        
-        # Slack 연결 시작
-        await handler.start_async()
-        logger.info("Slack Socket Mode started")
-        
+        # 데이터베이스 변경 피드 구독 (REALTIME_ENABLED=true 인 경우)
+        change_feed_task = asyncio.create_task(start_change_feed())
+
+        # 이벤트 루프 지연을 재서 부하가 높으면 낮은 등급 요청과 작업을 미룹니다.
+        admission_task = asyncio.create_task(admission.monitor())
+        job_queue.max_priority = admission.max_job_priority
+
+        # 백그라운드 작업 큐 (워커마다 정해진 수의 작업을 동시에 실행합니다)
+        job_queue_task = asyncio.create_task(job_queue.run(slack_app.client))
+
+        # Self-ping, 미제출자 리마인더, 야간 증분 백업은 리더 워커에서만 실행합니다.
+        leader_task = asyncio.create_task(
+            create_leader_election().run(
+                {
+                    "self_ping": ping_self_loop,
+                    "reminder": lambda: reminder_loop(slack_app.client),
+                    "backup": run_backup_loop,
+                }
+            )
+        )
+
+        # 캐시 준비와 Slack 연결을 동시에 진행합니다.
+        phases = {
+            "session_calendar": preload_session_calendar,
+            "slack_client": slack_app.client.auth_test,
+            "supabase_client": warm_up_supabase,
+            "handlers": preload_listeners,
+            "fulltext_index": load_fulltext_index,
+            "typeahead": load_typeahead,
+            "emotion_analytics": preload_emotion_analytics,
+        }
+        if settings.WARM_STORE_ENABLED:
+            phases["warm_store"] = load_warm_store
+        if settings.MEMBERS_CHANNEL:
+            phases["members"] = lambda: get_channel_member_ids(
+                slack_app.client, settings.MEMBERS_CHANNEL
+            )
+        if handler is not None:
+            phases["socket_mode"] = handler.connect_async
+            startup.set_connection_check(handler.is_connected)
+            await startup.run(phases, required=("socket_mode",))
+            logger.info("Slack Socket Mode started")
+        else:
+            await startup.run(phases, required=("slack_client",))
+            logger.info("Slack Events API started on /slack/events")
+
+        # 연결은 Socket Mode 클라이언트(또는 HTTP 서버)가 유지하므로 종료될 때까지 대기합니다.
+        await asyncio.Event().wait()
+
     finally:
-        if 'ping_task' in locals():
-            ping_task.cancel()
-        await handler.close_async()
+        if 'leader_task' in locals():
+            leader_task.cancel()
+            await asyncio.gather(leader_task, return_exceptions=True)
+        if 'job_queue_task' in locals():
+            # 실행 중이던 작업은 다음 실행 때 바로 다시 가져갈 수 있도록 돌려놓습니다.
+            job_queue_task.cancel()
+            await asyncio.gather(job_queue_task, return_exceptions=True)
+        if 'admission_task' in locals():
+            admission_task.cancel()
+        if 'change_feed_task' in locals():
+            change_feed_task.cancel()
+        await change_feed.stop()
+        if handler is not None:
+            await handler.close_async()
         await runner.cleanup()
+        await SupabaseClient.close()
+        file_io.shutdown()
         logger.info("서버가 종료되었습니다.")
 
 if __name__ == "__main__":
-    try:
-        asyncio.run(main())
-    except KeyboardInterrupt:
-        logger.info("\n프로그램을 종료합니다...")
\ No newline at end of file
+    if settings.WORKERS > 1:
+        from supervisor import run_workers
+
+        run_workers(settings.WORKERS)
+    else:
+        try:
+            asyncio.run(main())
+        except KeyboardInterrupt:
+            logger.info("\n프로그램을 종료합니다...")
\ No newline at end of file
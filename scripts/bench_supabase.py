@@ -0,0 +1,99 @@
+"""
+Supabase(PostgREST) 왕복 지연 시간을 연결 재사용 여부와 HTTP 버전별로 측정합니다.
+
+- cold: 요청마다 새 HTTP 클라이언트를 만들어 매번 연결(TLS 포함)을 새로 맺습니다.
+- warm: 서버와 같은 설정의 연결 풀 클라이언트 하나로 모든 요청을 보냅니다.
+
+데이터를 읽지 않는 가벼운 요청(`HEAD /rest/v1/`)을 보내며, 결과는 p50/p95 로 출력합니다.
+
+사용법:
+    python scripts/bench_supabase.py [--requests 50] [--concurrency 1]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import settings  # noqa: E402
+from database.supabase import create_http_client  # noqa: E402
+
+
+def _percentile(values: list[float], percent: int) -> float:
+    return statistics.quantiles(values, n=100, method="inclusive")[percent - 1]
+
+
+async def _request(client, url: str, headers: dict[str, str]) -> float:
+    """요청 하나의 왕복 시간(밀리초)을 반환합니다."""
+    started_at = time.perf_counter()
+    response = await client.head(url, headers=headers)
+    elapsed_ms = (time.perf_counter() - started_at) * 1000
+    if response.status_code >= 500:
+        raise RuntimeError(f"Supabase 응답 오류 - Status: {response.status_code}")
+    return elapsed_ms
+
+
+async def measure(
+    mode: str, http2: bool, requests: int, concurrency: int
+) -> list[float]:
+    """요청을 보내고 왕복 시간 목록을 반환합니다."""
+    url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/"
+    headers = {
+        "apikey": settings.SUPABASE_KEY,
+        "Authorization": f"Bearer {settings.SUPABASE_KEY}",
+    }
+    semaphore = asyncio.Semaphore(concurrency)
+
+    if mode == "cold":
+
+        async def send() -> float:
+            async with semaphore, create_http_client(http2=http2) as client:
+                return await _request(client, url, headers)
+
+        return await asyncio.gather(*(send() for _ in range(requests)))
+
+    async with create_http_client(http2=http2) as client:
+
+        async def send_pooled() -> float:
+            async with semaphore:
+                return await _request(client, url, headers)
+
+        # 연결 수립 시간이 포함되지 않도록 연결을 먼저 맺어둡니다.
+        await _request(client, url, headers)
+        return await asyncio.gather(*(send_pooled() for _ in range(requests)))
+
+
+async def run(requests: int, concurrency: int) -> None:
+    print(
+        f"Supabase 왕복 지연 시간 ({requests}회, 동시 {concurrency}개) - {settings.SUPABASE_URL}"
+    )
+    for http2 in (False, True):
+        for mode in ("cold", "warm"):
+            timings = await measure(mode, http2, requests, concurrency)
+            print(
+                f"  {'HTTP/2' if http2 else 'HTTP/1.1':8} {mode:4}  "
+                f"p50 {_percentile(timings, 50):7.1f}ms  "
+                f"p95 {_percentile(timings, 95):7.1f}ms"
+            )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Supabase 연결 재사용에 따른 지연 시간을 비교합니다.")
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=1)
+    args = parser.parse_args()
+
+    if not settings.SUPABASE_URL:
+        print("SUPABASE_URL 환경 변수를 입력해주세요.")
+        return 1
+
+    asyncio.run(run(max(2, args.requests), max(1, args.concurrency)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+# search 패키지 모듈 초기화
@@ -0,0 +1,351 @@
+import asyncio
+import os
+import time
+import unicodedata
+from pathlib import Path
+from typing import Any, Iterator
+
+import orjson
+import regex as re
+from loguru import logger
+
+from database import iter_retrospectives
+from database.changes import ChangeType, on_change, on_resync
+from file_io import run_file_io
+
+# 검색 대상 필드
+SEARCH_FIELDS = ("good_points", "improvements", "learnings", "action_item")
+
+# 색인 파일 경로
+INDEX_PATH = Path("store/search_index.json")
+
+# 변경 후 색인 파일을 저장하기까지 기다리는 시간(초)
+SAVE_DELAY_SECONDS = 30
+
+# 검색 결과 미리보기 앞뒤 글자 수
+SNIPPET_RADIUS = 30
+
+_WORD_PATTERN = re.compile(r"[\p{L}\p{N}]+")
+
+
+def normalize(text: str) -> str:
+    """검색을 위해 텍스트를 정규화합니다. (호환 문자 통일, 소문자 변환)"""
+    return unicodedata.normalize("NFKC", text).lower()
+
+
+def iter_grams(text: str) -> Iterator[str]:
+    """
+    텍스트를 글자 단위 2-gram, 3-gram 으로 나눕니다. (중복 포함)
+
+    형태소 분석기 없이도 "회고를" 에서 "회고" 를 찾을 수 있도록
+    단어를 겹치는 글자 조각으로 나눕니다.
+    """
+    for word in _WORD_PATTERN.findall(normalize(text)):
+        if len(word) < 3:
+            yield word
+        for size in (2, 3):
+            for start in range(len(word) - size + 1):
+                yield word[start : start + size]
+
+
+def tokenize(text: str) -> set[str]:
+    """텍스트를 색인할 글자 조각 집합으로 나눕니다."""
+    return set(iter_grams(text))
+
+
+def _query_grams(word: str) -> set[str]:
+    """검색어 단어가 반드시 포함해야 하는 글자 조각을 반환합니다."""
+    if len(word) < 3:
+        return {word}
+    return {word[start : start + 3] for start in range(len(word) - 2)}
+
+
+class FullTextIndex:
+    """
+    회고 내용 전문 검색용 역색인입니다.
+
+    글자 조각별로 회고 ID 집합을 보관하고, 검색 시 후보를 교집합으로 좁힌 뒤
+    원문에 검색어가 실제로 포함되어 있는지 확인합니다.
+    """
+
+    def __init__(self, path: Path = INDEX_PATH) -> None:
+        self._path = path
+        self._docs: dict[int, dict[str, Any]] = {}
+        self._texts: dict[int, str] = {}
+        self._postings: dict[str, set[int]] = {}
+        # 데이터베이스에서 마지막으로 가져온 변경 시각 (다른 워커가 쓴 회고를 놓치지 않도록
+        # 이 프로세스가 반영한 변경으로는 앞당기지 않습니다)
+        self._watermark: str | None = None
+        # 저장 중인 스냅샷과 함께 쓰고 있어, 바꾸기 전에 복사해야 하는 글자 조각 목록
+        self._shared_grams: set[str] | None = None
+        self._save_lock = asyncio.Lock()
+        self._loaded = False
+        self._load_task: asyncio.Task | None = None
+        self._save_handle: asyncio.TimerHandle | None = None
+        self.version = 0
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded
+
+    @property
+    def documents(self) -> dict[int, dict[str, Any]]:
+        """색인된 회고 데이터 (ID -> 회고)"""
+        return self._docs
+
+    def upsert(self, row: dict[str, Any]) -> None:
+        """회고 한 건을 색인에 추가하거나 갱신합니다."""
+        retrospective_id = row["id"]
+        self.remove(retrospective_id)
+
+        doc = {
+            "user_id": row["user_id"],
+            "session_name": row["session_name"],
+            "created_at": row["created_at"],
+            **{field: row[field] for field in SEARCH_FIELDS},
+        }
+        self._docs[retrospective_id] = doc
+        self._texts[retrospective_id] = normalize(doc_text(doc))
+        for gram in tokenize(doc_text(doc)):
+            ids = self._writable_postings(gram)
+            if ids is None:
+                ids = self._postings[gram] = set()
+            ids.add(retrospective_id)
+        self.version += 1
+
+    def remove(self, retrospective_id: int) -> None:
+        """회고 한 건을 색인에서 제거합니다."""
+        doc = self._docs.pop(retrospective_id, None)
+        if doc is None:
+            return
+
+        self._texts.pop(retrospective_id, None)
+        for gram in tokenize(doc_text(doc)):
+            ids = self._writable_postings(gram)
+            if ids is None:
+                continue
+            ids.discard(retrospective_id)
+            if not ids:
+                del self._postings[gram]
+        self.version += 1
+
+    def _writable_postings(self, gram: str) -> set[int] | None:
+        """글자 조각의 회고 ID 집합을 반환합니다. 저장 중인 스냅샷과 함께 쓰고 있으면 복사합니다."""
+        ids = self._postings.get(gram)
+        if ids is not None and self._shared_grams is not None:
+            if gram not in self._shared_grams:
+                ids = self._postings[gram] = set(ids)
+                self._shared_grams.add(gram)
+        return ids
+
+    def search(
+        self, query: str, user_id: str | None = None, limit: int = 20
+    ) -> list[dict[str, Any]]:
+        """
+        검색어의 모든 단어가 포함된 회고를 찾습니다.
+
+        Args:
+            query: 검색어 (공백으로 구분된 단어는 모두 포함되어야 합니다)
+            user_id: 지정하면 해당 사용자의 회고에서만 찾습니다.
+            limit: 최대 결과 수
+
+        Returns:
+            회고 ID, 작성자, 회차, 작성일, 미리보기 목록 (일치 횟수가 많은 순)
+        """
+        words = _WORD_PATTERN.findall(normalize(query))
+        if not words:
+            return []
+
+        grams = set().union(*(_query_grams(word) for word in words))
+        postings = sorted((self._postings.get(gram, set()) for gram in grams), key=len)
+        candidates = set(postings[0])
+        for other in postings[1:]:
+            if not candidates:
+                break
+            candidates &= other
+
+        results = []
+        for retrospective_id in candidates:
+            doc = self._docs[retrospective_id]
+            if user_id is not None and doc["user_id"] != user_id:
+                continue
+
+            # 글자 조각이 모두 있어도 이어져 있지 않을 수 있으므로 원문을 확인합니다.
+            text = self._texts[retrospective_id]
+            if not all(word in text for word in words):
+                continue
+
+            score = sum(text.count(word) for word in words)
+            results.append((score, retrospective_id, doc))
+
+        results.sort(key=lambda result: (result[0], result[1]), reverse=True)
+        return [
+            {
+                "id": retrospective_id,
+                "user_id": doc["user_id"],
+                "session_name": doc["session_name"],
+                "created_at": doc["created_at"],
+                "snippet": _snippet(doc, words[0]),
+            }
+            for _, retrospective_id, doc in results[:limit]
+        ]
+
+    async def load(self) -> None:
+        """
+        색인 파일을 불러온 뒤 그 이후 변경된 회고만 데이터베이스에서 가져옵니다.
+
+        색인 파일이 없으면 데이터베이스의 모든 회고로 색인을 만듭니다.
+        """
+        started_at = time.perf_counter()
+        snapshot = await run_file_io(_read_snapshot, self._path)
+        if snapshot:
+            self._docs = {int(key): doc for key, doc in snapshot["docs"].items()}
+            self._texts = {
+                key: normalize(doc_text(doc)) for key, doc in self._docs.items()
+            }
+            self._postings = {
+                gram: set(ids) for gram, ids in snapshot["postings"].items()
+            }
+            self._watermark = snapshot["watermark"]
+
+        changed = await self.refresh(detect_deletes=bool(snapshot))
+
+        self._loaded = True
+        self.version += 1
+        logger.info(
+            f"전문 검색 색인 로드 완료 - Docs: {len(self._docs)}, "
+            f"Grams: {len(self._postings)}, Changed: {changed}, "
+            f"Elapsed: {time.perf_counter() - started_at:.2f}s"
+        )
+        if changed:
+            await self.save()
+
+    async def refresh(self, detect_deletes: bool = True) -> int:
+        """
+        마지막으로 반영한 시각 이후 생성/수정된 회고와 삭제된 회고를 반영합니다.
+
+        Returns:
+            생성/수정/삭제된 회고 수
+        """
+        changed = 0
+        async for page in iter_retrospectives(updated_after=self._watermark):
+            for row in page:
+                self.upsert(row)
+                updated_at = row.get("updated_at")
+                if updated_at and (
+                    self._watermark is None or updated_at > self._watermark
+                ):
+                    self._watermark = updated_at
+            changed += len(page)
+
+        if detect_deletes:
+            existing_ids: set[int] = set()
+            async for page in iter_retrospectives(columns="id"):
+                existing_ids.update(row["id"] for row in page)
+            for retrospective_id in self._docs.keys() - existing_ids:
+                self.remove(retrospective_id)
+                changed += 1
+
+        return changed
+
+    def ensure_loaded(self) -> asyncio.Task:
+        """색인 로드를 시작하고, 이미 진행 중이거나 완료된 로드 태스크를 반환합니다."""
+        if self._load_task is None or (
+            self._load_task.done() and self._load_task.exception() is not None
+        ):
+            self._load_task = asyncio.create_task(self.load())
+        return self._load_task
+
+    async def save(self) -> None:
+        """
+        색인을 파일로 저장합니다.
+
+        직렬화는 파일 I/O 스레드에서 합니다. 그동안 바뀌는 글자 조각은 먼저 복사해 두고 바꾸므로
+        (copy-on-write) 스냅샷은 저장을 시작한 시점의 색인과 같습니다.
+        """
+        async with self._save_lock:
+            # 회고 데이터는 바꿀 때 새로 만들므로 목록만 복사하면 됩니다.
+            snapshot = {
+                "watermark": self._watermark,
+                "docs": dict(self._docs),
+                "postings": dict(self._postings),
+            }
+            self._shared_grams = set()
+            try:
+                await run_file_io(_write_snapshot, self._path, snapshot)
+            finally:
+                self._shared_grams = None
+
+    def schedule_save(self) -> None:
+        """잦은 변경 시 매번 저장하지 않도록 일정 시간 뒤에 한 번 저장합니다."""
+        if self._save_handle is not None:
+            return
+
+        def save() -> None:
+            self._save_handle = None
+            asyncio.create_task(self.save())
+
+        self._save_handle = asyncio.get_running_loop().call_later(
+            SAVE_DELAY_SECONDS, save
+        )
+
+
+def doc_text(doc: dict[str, Any]) -> str:
+    """검색 대상 필드를 하나의 텍스트로 합칩니다."""
+    return "\n".join(doc[field] or "" for field in SEARCH_FIELDS)
+
+
+def _snippet(doc: dict[str, Any], word: str) -> str:
+    """검색어가 처음 나오는 위치 주변의 문장을 반환합니다."""
+    for field in SEARCH_FIELDS:
+        text = doc[field] or ""
+        position = normalize(text).find(word)
+        if position >= 0:
+            start = max(position - SNIPPET_RADIUS, 0)
+            end = position + len(word) + SNIPPET_RADIUS
+            prefix = "…" if start > 0 else ""
+            suffix = "…" if end < len(text) else ""
+            return f"{prefix}{text[start:end]}{suffix}".replace("\n", " ")
+    return ""
+
+
+def _read_snapshot(path: Path) -> dict[str, Any] | None:
+    if not path.exists():
+        return None
+    return orjson.loads(path.read_bytes())
+
+
+def _write_snapshot(path: Path, snapshot: dict[str, Any]) -> None:
+    data = orjson.dumps(
+        {
+            "watermark": snapshot["watermark"],
+            "docs": {str(key): doc for key, doc in snapshot["docs"].items()},
+            "postings": {gram: list(ids) for gram, ids in snapshot["postings"].items()},
+        }
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(".tmp")
+    temp_path.write_bytes(data)
+    os.replace(temp_path, path)
+
+
+fulltext_index = FullTextIndex()
+
+
+@on_change
+def _apply_change(change_type: ChangeType, row: dict[str, Any]) -> None:
+    """회고 변경 사항을 전문 검색 색인에 반영합니다."""
+    if change_type == "delete":
+        fulltext_index.remove(row["id"])
+    else:
+        fulltext_index.upsert(row)
+    fulltext_index.schedule_save()
+
+
+@on_resync
+async def _resync() -> None:
+    """놓친 변경 사항을 데이터베이스에서 다시 읽어 반영합니다."""
+    if not fulltext_index.is_loaded:
+        return
+    if await fulltext_index.refresh():
+        fulltext_index.schedule_save()
@@ -0,0 +1,163 @@
+import asyncio
+from collections import Counter
+from typing import Any
+
+import numpy as np
+from scipy import sparse
+
+from search.fulltext import FullTextIndex, doc_text, fulltext_index, iter_grams
+
+# 이 유사도 이상이면 중복(복사) 의심으로 표시합니다.
+DUPLICATE_THRESHOLD = 0.85
+
+# 중복 탐색 시 한 번에 곱할 행 수
+BATCH_SIZE = 512
+
+
+class SimilarityEngine:
+    """
+    회고 내용의 TF-IDF 벡터로 유사한 회고를 찾습니다.
+
+    문서별 글자 조각 빈도는 한 번만 계산해 두고, 전문 검색 색인이 바뀌면
+    바뀐 문서만 다시 계산한 뒤 희소 행렬을 이어 붙여 다시 만듭니다.
+    행렬은 이벤트 루프를 막지 않도록 별도 스레드에서 만들며,
+    유사도는 정규화된 행렬 곱으로 한 번에 계산합니다.
+    """
+
+    def __init__(self, index: FullTextIndex) -> None:
+        self._index = index
+        self._vocabulary: dict[str, int] = {}
+        self._terms: dict[int, tuple[dict[str, Any], np.ndarray, np.ndarray]] = {}
+        self._built_version: int | None = None
+        self._ids = np.empty(0, dtype=np.int64)
+        self._positions: dict[int, int] = {}
+        self._matrix = sparse.csr_matrix((0, 0))
+        # 빈도와 단어 번호는 행렬을 만드는 스레드에서만 바꾸므로 한 번에 하나씩 만듭니다.
+        self._lock = asyncio.Lock()
+
+    def _term_vector(self, doc: dict[str, Any]) -> tuple[np.ndarray, np.ndarray]:
+        """문서의 (단어 번호, 빈도) 배열을 반환합니다."""
+        counts = Counter(iter_grams(doc_text(doc)))
+        columns = np.fromiter(
+            (self._vocabulary.setdefault(gram, len(self._vocabulary)) for gram in counts),
+            dtype=np.int64,
+            count=len(counts),
+        )
+        values = np.fromiter(counts.values(), dtype=np.float64, count=len(counts))
+        return columns, values
+
+    async def refresh(self) -> None:
+        """색인이 바뀌었으면 이벤트 루프 밖에서 행렬을 다시 만듭니다."""
+        async with self._lock:
+            version = self._index.version
+            if self._built_version == version:
+                return
+
+            # 회고 데이터는 바꿀 때 새로 만들므로 목록만 복사하면 됩니다.
+            docs = dict(self._index.documents)
+            self._ids, self._positions, self._matrix = await asyncio.to_thread(
+                self._build, docs
+            )
+            self._built_version = version
+
+    def _build(
+        self, docs: dict[int, dict[str, Any]]
+    ) -> tuple[np.ndarray, dict[int, int], sparse.csr_matrix]:
+        """바뀐 문서의 빈도만 다시 계산하고 (회고 ID 배열, ID별 행 번호, 행렬) 을 만듭니다."""
+        for retrospective_id in self._terms.keys() - docs.keys():
+            del self._terms[retrospective_id]
+        for retrospective_id, doc in docs.items():
+            cached = self._terms.get(retrospective_id)
+            if cached is None or cached[0] is not doc:
+                self._terms[retrospective_id] = (doc, *self._term_vector(doc))
+
+        ids = np.fromiter(self._terms.keys(), dtype=np.int64, count=len(self._terms))
+        vectors = list(self._terms.values())
+        n_docs = len(vectors)
+        n_terms = len(self._vocabulary)
+
+        if n_docs == 0:
+            matrix = sparse.csr_matrix((0, n_terms))
+        else:
+            lengths = np.fromiter((len(v[1]) for v in vectors), dtype=np.int64, count=n_docs)
+            indptr = np.concatenate(([0], np.cumsum(lengths)))
+            columns = np.concatenate([v[1] for v in vectors])
+            counts = np.concatenate([v[2] for v in vectors])
+
+            # TF-IDF 가중치 (sublinear tf, smooth idf) 후 행 단위 L2 정규화
+            document_frequency = np.bincount(columns, minlength=n_terms)
+            idf = np.log((1 + n_docs) / (1 + document_frequency)) + 1
+            weights = (1 + np.log(counts)) * idf[columns]
+            norms = np.sqrt(np.add.reduceat(weights * weights, indptr[:-1]))
+            weights /= np.repeat(np.where(norms > 0, norms, 1), lengths)
+
+            matrix = sparse.csr_matrix(
+                (weights, columns, indptr), shape=(n_docs, n_terms)
+            )
+
+        positions = {int(retrospective_id): i for i, retrospective_id in enumerate(ids)}
+        return ids, positions, matrix
+
+    async def most_similar(self, retrospective_id: int, k: int = 5) -> list[tuple[int, float]]:
+        """
+        주어진 회고와 가장 비슷한 회고를 찾습니다.
+
+        Args:
+            retrospective_id: 기준 회고 ID
+            k: 최대 결과 수
+
+        Returns:
+            (회고 ID, 코사인 유사도) 목록 (유사도가 높은 순)
+        """
+        await self.refresh()
+        position = self._positions.get(retrospective_id)
+        if position is None:
+            return []
+
+        scores = (self._matrix @ self._matrix[position].T).toarray().ravel()
+        scores[position] = -1
+        k = min(k, len(scores) - 1)
+        if k <= 0:
+            return []
+
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [
+            (int(self._ids[i]), float(scores[i])) for i in top if scores[i] > 0
+        ]
+
+    async def find_duplicates(
+        self, threshold: float = DUPLICATE_THRESHOLD
+    ) -> list[tuple[int, int, float]]:
+        """
+        유사도가 기준 이상인 회고 쌍을 모두 찾습니다.
+
+        Returns:
+            (회고 ID, 회고 ID, 코사인 유사도) 목록 (유사도가 높은 순)
+        """
+        await self.refresh()
+        return await asyncio.to_thread(
+            _find_duplicates, self._ids, self._matrix, threshold
+        )
+
+
+def _find_duplicates(
+    ids: np.ndarray, matrix: sparse.csr_matrix, threshold: float
+) -> list[tuple[int, int, float]]:
+    pairs = []
+    for start in range(0, matrix.shape[0], BATCH_SIZE):
+        block = (matrix[start : start + BATCH_SIZE] @ matrix.T).tocoo()
+        rows = block.row + start
+        mask = (block.data >= threshold) & (rows < block.col)
+        pairs.extend(
+            zip(
+                ids[rows[mask]].tolist(),
+                ids[block.col[mask]].tolist(),
+                block.data[mask].tolist(),
+            )
+        )
+
+    return sorted(pairs, key=lambda pair: pair[2], reverse=True)
+
+
+similarity_engine = SimilarityEngine(fulltext_index)
@@ -0,0 +1,155 @@
+import asyncio
+import heapq
+import time
+from typing import Any
+
+from loguru import logger
+
+from database import iter_retrospectives
+from database.changes import ChangeType, on_change, on_resync
+
+# 색인할 접두어 최대 길이
+MAX_PREFIX_LENGTH = 20
+
+# Slack 옵션 목록 최대 개수
+MAX_OPTIONS = 100
+
+
+class RetrospectiveTypeahead:
+    """
+    관리자 회고 검색용 접두어 색인입니다.
+
+    회고 ID, 작성자 ID, 회차, 작성일의 각 토큰에 대해 모든 접두어를 색인하여
+    입력할 때마다 데이터베이스를 조회하지 않고 메모리에서 바로 찾습니다.
+    """
+
+    def __init__(self) -> None:
+        self._docs: dict[int, tuple[str, list[str]]] = {}
+        self._prefixes: dict[str, set[int]] = {}
+        self._loaded = False
+        self._load_task: asyncio.Task | None = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded
+
+    def upsert(self, row: dict[str, Any]) -> None:
+        """회고 한 건을 색인에 추가하거나 갱신합니다."""
+        retrospective_id = row["id"]
+        self.remove(retrospective_id)
+
+        created_at = row["created_at"].split("T")[0]
+        label = f"{retrospective_id} | {row['session_name']} | {row['user_id']} | {created_at}"
+
+        tokens = {
+            str(retrospective_id),
+            row["user_id"].lower(),
+            row["session_name"].replace(" ", "").lower(),
+            created_at,
+            created_at.replace("-", ""),
+            *row["session_name"].lower().split(),
+        }
+        prefixes = list(
+            {
+                token[:length]
+                for token in tokens
+                for length in range(1, min(len(token), MAX_PREFIX_LENGTH) + 1)
+            }
+        )
+        for prefix in prefixes:
+            self._prefixes.setdefault(prefix, set()).add(retrospective_id)
+        self._docs[retrospective_id] = (label[:75], prefixes)
+
+    def remove(self, retrospective_id: int) -> None:
+        """회고 한 건을 색인에서 제거합니다."""
+        doc = self._docs.pop(retrospective_id, None)
+        if doc is None:
+            return
+
+        for prefix in doc[1]:
+            ids = self._prefixes.get(prefix)
+            if ids is None:
+                continue
+            ids.discard(retrospective_id)
+            if not ids:
+                del self._prefixes[prefix]
+
+    def search(self, query: str, limit: int = MAX_OPTIONS) -> list[tuple[int, str]]:
+        """
+        검색어의 모든 토큰과 일치하는 회고를 최신순으로 반환합니다.
+
+        Args:
+            query: 검색어 (공백으로 구분된 토큰은 모두 일치해야 합니다)
+            limit: 최대 결과 수
+
+        Returns:
+            (회고 ID, 표시 텍스트) 목록
+        """
+        tokens = [token[:MAX_PREFIX_LENGTH] for token in query.lower().split()]
+        if not tokens:
+            ids = self._docs.keys()
+        else:
+            candidates = sorted(
+                (self._prefixes.get(token, set()) for token in tokens), key=len
+            )
+            ids = set(candidates[0])
+            for other in candidates[1:]:
+                ids &= other
+
+        result_ids = heapq.nlargest(limit, ids)
+
+        # 회고 ID를 정확히 입력한 경우 해당 회고를 가장 먼저 보여줍니다.
+        if len(tokens) == 1 and tokens[0].isdigit() and int(tokens[0]) in self._docs:
+            exact_id = int(tokens[0])
+            result_ids = [exact_id] + [i for i in result_ids if i != exact_id][: limit - 1]
+
+        return [
+            (retrospective_id, self._docs[retrospective_id][0])
+            for retrospective_id in result_ids
+        ]
+
+    async def load(self) -> None:
+        """데이터베이스의 모든 회고로 색인을 만듭니다. (삭제된 회고는 색인에서 제거)"""
+        started_at = time.perf_counter()
+        existing_ids: set[int] = set()
+        async for page in iter_retrospectives(
+            columns="id,user_id,session_name,created_at"
+        ):
+            for row in page:
+                self.upsert(row)
+                existing_ids.add(row["id"])
+        for retrospective_id in self._docs.keys() - existing_ids:
+            self.remove(retrospective_id)
+        self._loaded = True
+        logger.info(
+            f"회고 검색 색인 로드 완료 - Docs: {len(self._docs)}, "
+            f"Prefixes: {len(self._prefixes)}, "
+            f"Elapsed: {time.perf_counter() - started_at:.2f}s"
+        )
+
+    def ensure_loaded(self) -> asyncio.Task:
+        """색인 로드를 시작하고, 이미 진행 중이거나 완료된 로드 태스크를 반환합니다."""
+        if self._load_task is None or (
+            self._load_task.done() and self._load_task.exception() is not None
+        ):
+            self._load_task = asyncio.create_task(self.load())
+        return self._load_task
+
+
+typeahead = RetrospectiveTypeahead()
+
+
+@on_change
+def _apply_change(change_type: ChangeType, row: dict[str, Any]) -> None:
+    """회고 변경 사항을 검색 색인에 반영합니다."""
+    if change_type == "delete":
+        typeahead.remove(row["id"])
+    else:
+        typeahead.upsert(row)
+
+
+@on_resync
+async def _resync() -> None:
+    """놓친 변경 사항을 반영하도록 색인을 다시 만듭니다."""
+    if typeahead.is_loaded:
+        await typeahead.load()
@@ -0,0 +1,265 @@
+import asyncio
+import functools
+import itertools
+import time
+from collections import Counter
+from typing import Any, Callable
+
+from loguru import logger
+from slack_bolt.async_app import AsyncApp
+from slack_bolt.request.async_request import AsyncBoltRequest
+from slack_bolt.response import BoltResponse
+from slack_sdk.models.blocks import SectionBlock
+from slack_sdk.models.views import View
+
+from jobs.dead_letter import describe_listener
+from jobs.queue import PRIORITY_HIGH, PRIORITY_LOW, PRIORITY_NORMAL
+from slack.lazy import RELEASE_KEY
+
+# 우선순위 등급 (앞에 있을수록 먼저 처리합니다)
+ACK = "ack"  # 3초 안에 응답해야 하는 가벼운 요청 (옵션 검색 등)
+SUBMISSION = "submission"  # 회고 제출
+READ = "read"  # 조회, 검색 등 멤버 요청
+ADMIN = "admin"  # 관리자 메뉴
+NOTIFICATION = "notification"  # 채널 이벤트와 알림
+
+CLASSES = (ACK, SUBMISSION, READ, ADMIN, NOTIFICATION)
+
+# 등급별로 동시에 처리할 수 있는 요청 수 (ACK 는 제한하지 않습니다)
+IN_FLIGHT_LIMITS = {
+    SUBMISSION: 64,
+    READ: 16,
+    ADMIN: 4,
+    NOTIFICATION: 8,
+}
+
+# 자리가 없을 때 기다리는 최대 시간(초) (Slack 은 3초 안에 응답을 받아야 합니다)
+ADMISSION_WAIT_SECONDS = 1
+
+# 부하 단계
+NORMAL = 0
+BUSY = 1
+OVERLOADED = 2
+
+# 이벤트 루프 지연(초)과 자리를 기다리는 요청 수로 부하 단계를 정합니다.
+BUSY_LAG_SECONDS = 0.1
+OVERLOADED_LAG_SECONDS = 0.5
+BUSY_QUEUE_DEPTH = 8
+OVERLOADED_QUEUE_DEPTH = 32
+
+# 이 부하 단계부터 요청을 처리하지 않고 바로 응답합니다. (제출은 부하로 거절하지 않습니다)
+SHED_LEVELS = {
+    NOTIFICATION: BUSY,
+    READ: OVERLOADED,
+    ADMIN: OVERLOADED,
+}
+
+# 부하 단계별로 실행할 백그라운드 작업의 최저 우선순위 (낮은 우선순위 작업은 미뤄둡니다)
+JOB_PRIORITY_LIMITS = {
+    NORMAL: PRIORITY_LOW,
+    BUSY: PRIORITY_NORMAL,
+    OVERLOADED: PRIORITY_HIGH,
+}
+
+# 이벤트 루프 지연을 재는 간격(초)
+MONITOR_INTERVAL_SECONDS = 0.25
+
+# 핸들러가 끝났다는 알림을 받지 못한 요청(리스너가 없는 요청 등)을 정리할 때까지의 시간(초)
+RESERVATION_TIMEOUT_SECONDS = 300
+
+# 리스너별 우선순위 등급 (없으면 요청 종류로 정합니다)
+LISTENER_CLASSES = {
+    "command:/공유": SUBMISSION,
+    "view_submission:retrospective_submit": SUBMISSION,
+    "command:/관리자": ADMIN,
+    "view_submission:admin_menu": ADMIN,
+    "view_submission:admin_edit_retrospective": ADMIN,
+    "view_submission:admin_delete_retrospective": ADMIN,
+    "action:invite_channel": ADMIN,
+    "view_submission:invite_channel_view": ADMIN,
+    "action:job_queue_status": ADMIN,
+    "action:dead_letter_status": ADMIN,
+    "view_submission:dead_letter_replay": ADMIN,
+    "action:edit_retrospective": ADMIN,
+    "action:delete_retrospective": ADMIN,
+}
+
+BUSY_TEXT = "지금 요청이 많아 처리하지 못했어요. 잠시 후 다시 시도해주세요. 🙏"
+
+
+def classify(body: dict[str, Any]) -> str:
+    """요청의 우선순위 등급을 정합니다."""
+    listener = describe_listener(body)
+    if listener in LISTENER_CLASSES:
+        return LISTENER_CLASSES[listener]
+    if listener.startswith("event:"):
+        return NOTIFICATION
+    if listener.startswith(("options:", "view_closed:")):
+        return ACK
+    return READ
+
+
+class AdmissionController:
+    """
+    우선순위 등급별로 동시에 처리하는 요청 수를 제한하고, 부하가 높을 때 낮은 등급의
+    요청을 거절합니다.
+
+    마감 직전처럼 요청이 몰릴 때 회고 제출이 조회나 알림에 밀리지 않도록 합니다.
+    """
+
+    def __init__(self, limits: dict[str, int]) -> None:
+        self._limits = limits
+        self._in_flight: dict[str, dict[int, float]] = {cls: {} for cls in CLASSES}
+        self._released = {cls: asyncio.Condition() for cls in CLASSES}
+        self._tokens = itertools.count(1)
+        self._waiting = 0
+        self._lag = 0.0
+        self._max_lag = 0.0
+        self._admitted: Counter[str] = Counter()
+        self._shed: Counter[str] = Counter()
+
+    def load_level(self) -> int:
+        if (
+            self._lag >= OVERLOADED_LAG_SECONDS
+            or self._waiting >= OVERLOADED_QUEUE_DEPTH
+        ):
+            return OVERLOADED
+        if self._lag >= BUSY_LAG_SECONDS or self._waiting >= BUSY_QUEUE_DEPTH:
+            return BUSY
+        return NORMAL
+
+    def max_job_priority(self) -> int:
+        """지금 실행해도 되는 백그라운드 작업의 최저 우선순위를 반환합니다."""
+        return JOB_PRIORITY_LIMITS[self.load_level()]
+
+    async def admit(self, cls: str) -> Callable[[], None] | None:
+        """
+        요청을 처리할 자리를 잡습니다.
+
+        Returns:
+            핸들러가 끝났을 때 호출할 함수 (거절하면 None)
+        """
+        if cls in SHED_LEVELS and self.load_level() >= SHED_LEVELS[cls]:
+            self._shed[cls] += 1
+            return None
+
+        limit = self._limits.get(cls)
+        if limit is not None and len(self._in_flight[cls]) >= limit:
+            self._waiting += 1
+            try:
+                async with self._released[cls]:
+                    await asyncio.wait_for(
+                        self._released[cls].wait_for(
+                            lambda: len(self._in_flight[cls]) < limit
+                        ),
+                        timeout=ADMISSION_WAIT_SECONDS,
+                    )
+            except asyncio.TimeoutError:
+                self._shed[cls] += 1
+                return None
+            finally:
+                self._waiting -= 1
+
+        token = next(self._tokens)
+        self._in_flight[cls][token] = time.monotonic()
+        self._admitted[cls] += 1
+        return functools.partial(self._release, cls, token)
+
+    def _release(self, cls: str, token: int) -> None:
+        if self._in_flight[cls].pop(token, None) is not None:
+            asyncio.ensure_future(self._notify(cls))
+
+    async def _notify(self, cls: str) -> None:
+        async with self._released[cls]:
+            self._released[cls].notify_all()
+
+    async def monitor(self) -> None:
+        """이벤트 루프 지연을 재고, 끝났다는 알림을 받지 못한 요청을 정리합니다."""
+        while True:
+            started_at = time.monotonic()
+            await asyncio.sleep(MONITOR_INTERVAL_SECONDS)
+            lag = max(0.0, time.monotonic() - started_at - MONITOR_INTERVAL_SECONDS)
+            # 지연이 커지면 바로 반영하고, 줄어들 때는 천천히 반영합니다.
+            self._lag = max(lag, self._lag * 0.5)
+            self._max_lag = max(self._max_lag, lag)
+
+            expired_at = time.monotonic() - RESERVATION_TIMEOUT_SECONDS
+            for cls, reservations in self._in_flight.items():
+                for token, reserved_at in list(reservations.items()):
+                    if reserved_at < expired_at:
+                        logger.warning(f"오래된 요청 자리 정리 - Class: {cls}")
+                        self._release(cls, token)
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            "load_level": self.load_level(),
+            "loop_lag_seconds": round(self._lag, 3),
+            "max_loop_lag_seconds": round(self._max_lag, 3),
+            "waiting": self._waiting,
+            "max_job_priority": self.max_job_priority(),
+            "classes": {
+                cls: {
+                    "in_flight": len(self._in_flight[cls]),
+                    "limit": self._limits.get(cls),
+                    "admitted": self._admitted[cls],
+                    "shed": self._shed[cls],
+                }
+                for cls in CLASSES
+            },
+        }
+
+
+admission = AdmissionController(IN_FLIGHT_LIMITS)
+
+
+def _busy_response(body: dict[str, Any]) -> BoltResponse:
+    """처리하지 않는 요청에 바로 응답합니다."""
+    if "command" in body:
+        return BoltResponse(
+            status=200, body={"response_type": "ephemeral", "text": BUSY_TEXT}
+        )
+    if body.get("type") == "view_submission":
+        # 작성 중인 모달이 닫히지 않도록 안내 모달을 위에 띄웁니다.
+        view = View(
+            type="modal",
+            title="잠깐!",
+            close="확인",
+            blocks=[SectionBlock(text=BUSY_TEXT)],
+        )
+        return BoltResponse(
+            status=200, body={"response_action": "push", "view": view.to_dict()}
+        )
+    return BoltResponse(status=200, body="")
+
+
+async def admission_middleware(
+    req: AsyncBoltRequest,
+    resp: BoltResponse,
+    next: Callable,
+) -> BoltResponse | None:
+    """우선순위 등급에 따라 요청을 처리하거나, 부하가 높으면 바로 응답합니다."""
+    cls = classify(req.body)
+    release = await admission.admit(cls)
+    if release is None:
+        logger.warning(f"요청 거절 - Class: {cls}, Listener: {describe_listener(req.body)}")
+        return _busy_response(req.body)
+
+    # 핸들러가 끝나면 lazy_listener 가, 리스너가 없으면 AdmissionApp 이 자리를 돌려줍니다.
+    req.context[RELEASE_KEY] = release
+    await next()
+
+
+class AdmissionApp(AsyncApp):
+    """
+    처리할 리스너가 없는 요청이 잡아둔 자리를 바로 돌려주는 Bolt 앱입니다.
+
+    Bolt 는 모든 미들웨어가 끝난 뒤 리스너를 찾으므로 미들웨어의 next() 로는 결과를 알 수 없습니다.
+    리스너가 없는 요청(핸들러가 없는 이벤트, URL 버튼, view_closed 등)은 404 로 응답하므로,
+    응답을 보고 자리를 돌려줍니다. (리스너가 실행된 경우에는 이미 돌려주었거나 끝날 때 돌려줍니다)
+    """
+
+    async def async_dispatch(self, req: AsyncBoltRequest) -> BoltResponse:
+        resp = await super().async_dispatch(req)
+        if resp.status == 404 and (release := req.context.get(RELEASE_KEY)):
+            release()
+        return resp
@@ -2,40 +2,16 @@ import re
 import traceback
 from typing import Callable
 from config import settings
-from slack_bolt.async_app import AsyncApp as SlackBoltAsyncApp
 
 from loguru import logger
 from slack_bolt.request import BoltRequest
 from slack_bolt.response import BoltResponse
-from slack_sdk.models.blocks import SectionBlock
-from slack_sdk.models.views import View
 
 from exception import BotException
-from slack.events.channel_created import handle_channel_created
-from slack.events.member_joined_channel import handle_member_joined_channel
-from slack.events.reaction_added import handle_reaction_added
-from slack.events.view_invite_channel import (
-    handle_action_view_invite_channel,
-    handle_invite_channel,
-)
-from slack.events.command_retrospective import handle_command_retrospective
-from slack.events.command_admin import handle_command_admin
-from slack.events.message import handle_message
-from slack.events.view_retrospective_submit import handle_view_retrospective_submit
-from slack.events.view_admin_menu import (
-    handle_view_admin_menu,
-    handle_admin_action_delete,
-    handle_admin_action_edit,
-    handle_view_admin_delete_retrospective,
-    handle_view_admin_edit_retrospective,
-)
-from slack.events.command_my_retrospectives import handle_command_my_retrospectives
-from slack.events.action_view_retrospective_detail import (
-    handle_action_view_retrospective_detail,
-)
-
+from slack.admission import AdmissionApp, admission_middleware
+from slack.lazy import lazy_listener
 
-app = SlackBoltAsyncApp()
+app = AdmissionApp(signing_secret=settings.SLACK_SIGNING_SECRET)
 
 
 @app.middleware
@@ -49,13 +25,32 @@ async def log_event_middleware(
     await next()
 
 
+# 우선순위 등급별로 동시에 처리할 요청 수를 제한하고, 부하가 높으면 낮은 등급 요청을 거절합니다.
+app.middleware(admission_middleware)
+
+
 @app.error
-async def handle_error(error, body):
+async def handle_error(error, body, context):
     """이벤트 핸들러에서 발생한 에러 처리"""
+    from slack_sdk.models.blocks import SectionBlock
+    from slack_sdk.models.views import View
+
+    from jobs.dead_letter import DEAD_LETTER_KEY, capture
+    from jobs.queue import PRIORITY_HIGH, enqueue
+
     logger.error(f'"{str(error)}"')
     trace = traceback.format_exc()
     logger.debug(dict(body=body, error=trace))
 
+    # 재처리 중 다시 실패한 경우에는 재처리 결과로만 기록합니다.
+    if context.get(DEAD_LETTER_KEY) is not None:
+        await capture(body, error, context)
+        return
+
+    # 처리하지 못한 이벤트는 관리자 메뉴에서 다시 처리할 수 있도록 보관합니다.
+    if not isinstance(error, BotException):
+        await capture(body, error, context)
+
     # 사용자에게 에러를 알립니다.
     if re.search(r"[\u3131-\uD79D]", str(error)):
         # 한글로 핸들링하는 메시지만 사용자에게 전송합니다.
@@ -74,53 +69,112 @@ async def handle_error(error, body):
             ),
         )
 
-    # 관리자에게 에러를 알립니다.
+    # 관리자에게 에러를 알립니다. (Slack 호출이 실패해도 재시작 후까지 재시도하도록 작업 큐에 맡깁니다)
     if isinstance(error, BotException):
-        await app.client.chat_postMessage(
-            channel=settings.ADMIN_CHANNEL,
-            text=f"🫢: {error=} 🕊️: {trace=} 👉🏼 💌: {body=}",
-        )
+        text = f"🫢: {error=} 🕊️: {trace=} 👉🏼 💌: {body=}"
     else:
-        await app.client.chat_postMessage(
-            channel=settings.ADMIN_CHANNEL,
-            text=f"⛈️ 핸들링이 필요한 에러입니다. 🫢: {error=} 🕊️: {trace=} 👉🏼 💌: {body=}",
-        )
+        text = f"⛈️ 핸들링이 필요한 에러입니다. 🫢: {error=} 🕊️: {trace=} 👉🏼 💌: {body=}"
+    await enqueue(
+        "post_message",
+        {"channel": settings.ADMIN_CHANNEL, "text": text},
+        priority=PRIORITY_HIGH,
+    )
 
 
 # message
-app.event("message")(handle_message)
+app.event("message")(lazy_listener("slack.events.message:handle_message"))
 
 # member_joined_channel
-app.event("member_joined_channel")(handle_member_joined_channel)
+app.event("member_joined_channel")(
+    lazy_listener("slack.events.member_joined_channel:handle_member_joined_channel")
+)
 
 # channel_created
-app.event("channel_created")(handle_channel_created)
+app.event("channel_created")(
+    lazy_listener("slack.events.channel_created:handle_channel_created")
+)
 
 # reaction_added
-app.event("reaction_added")(handle_reaction_added)
+app.event("reaction_added")(
+    lazy_listener("slack.events.reaction_added:handle_reaction_added")
+)
 
 # channel_join
-app.action("invite_channel")(handle_invite_channel)
-app.view("invite_channel_view")(handle_action_view_invite_channel)
+app.action("invite_channel")(
+    lazy_listener("slack.events.view_invite_channel:handle_invite_channel")
+)
+app.view("invite_channel_view")(
+    lazy_listener("slack.events.view_invite_channel:handle_action_view_invite_channel")
+)
 
 # retrospective
-app.command("/공유")(handle_command_retrospective)
-app.view("retrospective_submit")(handle_view_retrospective_submit)
+app.command("/공유")(
+    lazy_listener("slack.events.command_retrospective:handle_command_retrospective")
+)
+app.view("retrospective_submit")(
+    lazy_listener("slack.events.view_retrospective_submit:handle_view_retrospective_submit")
+)
 
 # my retrospectives
-app.command("/내회고")(handle_command_my_retrospectives)
-app.action("view_retrospective_detail")(handle_action_view_retrospective_detail)
+app.command("/내회고")(
+    lazy_listener("slack.events.command_my_retrospectives:handle_command_my_retrospectives")
+)
+app.action("view_retrospective_detail")(
+    lazy_listener("slack.events.action_view_retrospective_detail:handle_action_view_retrospective_detail")
+)
+
+# retrospective search
+app.command("/회고검색")(
+    lazy_listener("slack.events.command_search_retrospectives:handle_command_search_retrospectives")
+)
+app.action("open_retrospective_search")(
+    lazy_listener("slack.events.command_search_retrospectives:handle_action_open_retrospective_search")
+)
+app.view("retrospective_search")(
+    lazy_listener("slack.events.command_search_retrospectives:handle_view_retrospective_search")
+)
 
 # admin
-app.command("/관리자")(handle_command_admin)  # 관리자 메뉴 호출
-app.view("admin_menu")(handle_view_admin_menu)  # 관리자 메뉴 출력
+app.command("/관리자")(
+    lazy_listener("slack.events.command_admin:handle_command_admin")
+)  # 관리자 메뉴 호출
+app.view("admin_menu")(
+    lazy_listener("slack.events.view_admin_menu:handle_view_admin_menu")
+)  # 관리자 메뉴 출력
+app.options("retrospective_id_input")(
+    lazy_listener("slack.events.options_retrospective_id:handle_options_retrospective_id")
+)  # 관리자 메뉴 회고 검색
 app.view("admin_edit_retrospective")(
-    handle_view_admin_edit_retrospective
+    lazy_listener("slack.events.view_admin_menu:handle_view_admin_edit_retrospective")
 )  # 회고 수정 제출 처리
 app.view("admin_delete_retrospective")(
-    handle_view_admin_delete_retrospective
+    lazy_listener("slack.events.view_admin_menu:handle_view_admin_delete_retrospective")
 )  # 회고 삭제 모달 처리
 
+app.action("job_queue_status")(
+    lazy_listener("slack.events.view_job_queue:handle_job_queue_status")
+)  # 백그라운드 작업 현황
+app.action("dead_letter_status")(
+    lazy_listener("slack.events.view_dead_letter:handle_dead_letter_status")
+)  # 실패한 이벤트 현황
+app.view("dead_letter_replay")(
+    lazy_listener("slack.events.view_dead_letter:handle_view_dead_letter_replay")
+)  # 실패한 이벤트 재처리
+
+# 회고 통계
+app.command("/통계")(
+    lazy_listener("slack.events.command_statistics:handle_command_statistics")
+)  # 회차/기수 통계
+
+# 회고 내보내기
+app.command("/내보내기")(
+    lazy_listener("slack.events.command_export:handle_command_export")
+)  # 회고 데이터 파일 내보내기
+
 # 회고 관리 액션
-app.action("edit_retrospective")(handle_admin_action_edit)  # 회고 수정 버튼
-app.action("delete_retrospective")(handle_admin_action_delete)  # 회고 삭제 버튼
+app.action("edit_retrospective")(
+    lazy_listener("slack.events.view_admin_menu:handle_admin_action_edit")
+)  # 회고 수정 버튼
+app.action("delete_retrospective")(
+    lazy_listener("slack.events.view_admin_menu:handle_admin_action_delete")
+)  # 회고 삭제 버튼
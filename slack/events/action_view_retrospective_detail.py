@@ -26,8 +26,8 @@ async def handle_action_view_retrospective_detail(
         # 회고 데이터 가져오기
         retrospective = await get_retrospective_by_id(retrospective_id)
 
-        # 자신의 회고만 볼 수 있도록 체크
-        if retrospective["user_id"] != user_id:
+        # 자신의 회고만 볼 수 있도록 체크 (관리자는 모든 회고를 볼 수 있음)
+        if retrospective["user_id"] != user_id and user_id not in settings.ADMIN_IDS:
             # 권한 없음 메시지
             await client.views_open(
                 trigger_id=body["trigger_id"],
@@ -1,6 +1,7 @@
 from slack_bolt.async_app import AsyncAck
 from slack_sdk.web.async_client import AsyncWebClient
 from config import settings
+from jobs.queue import enqueue
 from slack.types import ChannelCreatedBodyType
 
 
@@ -14,7 +15,10 @@ async def handle_channel_created(
 
     channel_id = body["event"]["channel"]["id"]
     await client.conversations_join(channel=channel_id)
-    await client.chat_postMessage(
-        channel=settings.ADMIN_CHANNEL,
-        text=f"새로 만들어진 <#{channel_id}> 채널에 시공봇이 참여했습니다. 😋",
+    await enqueue(
+        "post_message",
+        {
+            "channel": settings.ADMIN_CHANNEL,
+            "text": f"새로 만들어진 <#{channel_id}> 채널에 시공봇이 참여했습니다. 😋",
+        },
     )
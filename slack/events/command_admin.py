@@ -6,13 +6,13 @@ from slack_sdk.models.blocks import (
     SectionBlock,
     DividerBlock,
     InputBlock,
-    PlainTextInputElement,
+    ExternalDataSelectElement,
     ActionsBlock,
     ButtonElement,
 )
 
 from config import settings
-from database.retrospective import get_latest_retrospectives
+from search.typeahead import typeahead
 
 
 async def handle_command_admin(
@@ -38,22 +38,8 @@ async def handle_command_admin(
         await client.views_open(trigger_id=body["trigger_id"], view=view)
         return
 
-    # 최근 회고 데이터 가져오기 (최대 20개)
-    retrospectives = await get_latest_retrospectives(limit=20)
-
-    # 회고 목록 옵션 생성
-    options_text = ""
-    for retro in retrospectives:
-        retro_id = retro["id"]
-        retro_user = retro["user_id"]
-        retro_session = retro["session_name"]
-        created_at = (
-            retro["created_at"].split("T")[0]
-            + " "
-            + retro["created_at"].split("T")[1].split(".")[0]
-        )
-
-        options_text += f"```회고ID: {retro_id} | {retro_session} | <@{retro_user}> | {created_at}\n```"
+    # 회고 검색 색인을 미리 불러옵니다.
+    typeahead.ensure_loaded()
 
     # 관리자 메뉴 모달 생성
     blocks = [
@@ -72,16 +58,38 @@ async def handle_command_admin(
             ],
         ),
         DividerBlock(),
+        SectionBlock(text="*대기 중이거나 실패한 백그라운드 작업을 확인합니다*"),
+        ActionsBlock(
+            elements=[
+                ButtonElement(
+                    text="작업 큐",
+                    action_id="job_queue_status",
+                    value="job_queue_status",
+                ),
+            ],
+        ),
+        DividerBlock(),
+        SectionBlock(text="*처리하지 못한 이벤트를 확인하고 다시 처리합니다*"),
+        ActionsBlock(
+            elements=[
+                ButtonElement(
+                    text="실패한 이벤트",
+                    action_id="dead_letter_status",
+                    value="dead_letter_status",
+                ),
+            ],
+        ),
+        DividerBlock(),
         SectionBlock(text="*회고를 수정 또는 삭제합니다*"),
         InputBlock(
             block_id="retrospective_id",
             label="관리할 회고 ID",
-            element=PlainTextInputElement(
+            element=ExternalDataSelectElement(
                 action_id="retrospective_id_input",
-                placeholder="최근 회고 목록에서 ID를 확인하고 입력하세요",
+                placeholder="회고 ID, 회차, 멤버 ID, 작성일로 검색하세요",
+                min_query_length=0,
             ),
         ),
-        SectionBlock(text=f"*최근 회고 목록*\n\n{options_text}"),
     ]
 
     # 모달 뷰 생성
@@ -0,0 +1,79 @@
+from loguru import logger
+from slack.types import CommandBodyType
+from slack_bolt.async_app import AsyncAck, AsyncRespond
+from slack_sdk.web.async_client import AsyncWebClient
+
+from config import settings
+from constants import SESSION_NAMES
+from jobs.export import EXPORT_FORMATS
+from jobs.queue import enqueue
+from utils import get_cohort_name, get_cohort_session_names
+
+USAGE = (
+    "`/내보내기 [형식] [회차|기수]` 형식으로 입력해주세요.\n"
+    f"형식: {', '.join(EXPORT_FORMATS)} (기본값: ndjson)\n"
+    "예: `/내보내기 csv 3기`, `/내보내기 parquet 3기 1회차`"
+)
+
+
+async def handle_command_export(
+    ack: AsyncAck, body: CommandBodyType, client: AsyncWebClient, respond: AsyncRespond
+):
+    """회고 데이터 내보내기 명령어 처리 (관리자 전용)"""
+    await ack()
+
+    user_id = body["user_id"]
+    if user_id not in settings.ADMIN_IDS:
+        await respond(
+            "관리자 기능에 접근할 권한이 없습니다. 관리자에게 문의하세요.",
+            response_type="ephemeral",
+        )
+        return
+
+    try:
+        export_format, session_names, target = _parse_text(body.get("text", ""))
+    except ValueError as e:
+        await respond(f"{e}\n\n{USAGE}", response_type="ephemeral")
+        return
+
+    # 내보내기는 오래 걸릴 수 있으므로 작업 큐에 맡깁니다.
+    await enqueue(
+        "export_retrospectives",
+        {
+            "user_id": user_id,
+            "export_format": export_format,
+            "session_names": session_names,
+            "target": target,
+        },
+        max_attempts=2,
+    )
+    logger.info(f"회고 내보내기 요청 - User: {user_id}, Target: {target}")
+
+    await respond(
+        f"`{target}` 회고를 {export_format} 형식으로 내보내고 있어요. "
+        f"완료되면 <#{settings.ADMIN_CHANNEL}> 채널에 파일을 올리고 DM 으로 알려드릴게요.",
+        response_type="ephemeral",
+    )
+
+
+def _parse_text(text: str) -> tuple[str, list[str] | None, str]:
+    """
+    명령어 입력값을 (형식, 회차 이름 목록, 대상 이름) 으로 변환합니다.
+
+    회차나 기수를 입력하지 않으면 전체 회고를 내보냅니다.
+    """
+    export_format, _, target = text.strip().partition(" ")
+    if export_format not in EXPORT_FORMATS:
+        export_format, target = "ndjson", text.strip()
+
+    target = target.strip()
+    if not target:
+        return export_format, None, "전체"
+    if target in SESSION_NAMES:
+        return export_format, [target], target
+
+    cohort_names = {get_cohort_name(name) for name in SESSION_NAMES}
+    if target in cohort_names:
+        return export_format, get_cohort_session_names(target), target
+
+    raise ValueError(f"`{target}` 회차 또는 기수를 찾을 수 없습니다.")
@@ -1,11 +1,22 @@
+import asyncio
+
 from slack.types import CommandBodyType
 from slack_bolt.async_app import AsyncAck
 from slack_sdk.web.async_client import AsyncWebClient
 from slack_sdk.models.views import View
-from slack_sdk.models.blocks import SectionBlock, DividerBlock, ButtonElement, Block
+from slack_sdk.models.blocks import (
+    SectionBlock,
+    DividerBlock,
+    ButtonElement,
+    Block,
+    ActionsBlock,
+)
 from loguru import logger
 
+from analytics.emotion import get_emotion_analytics
+from constants import COMMAND_PREFETCH_BUDGET_SECONDS
 from database.retrospective import get_retrospectives_by_user_id
+from slack.modal import open_modal_within_budget
 
 
 async def handle_command_my_retrospectives(
@@ -14,11 +25,24 @@ async def handle_command_my_retrospectives(
     """내 회고 목록 명령어 처리"""
     await ack()
 
-    user_id = body["user_id"]
+    # 조회가 늦어지면 trigger_id 가 만료되기 전에 로딩 모달을 먼저 엽니다.
+    await open_modal_within_budget(
+        client,
+        trigger_id=body["trigger_id"],
+        title="내 회고 목록",
+        build_view=_build_view(body["user_id"]),
+        loading_text="회고 목록을 불러오고 있어요... ⏳",
+    )
+
 
+async def _build_view(user_id: str) -> View:
+    """회고 목록과 감정 점수 요약을 동시에 조회해 모달을 만듭니다."""
     try:
-        # 사용자의 회고 데이터 가져오기
-        retrospectives = await get_retrospectives_by_user_id(user_id)
+        # 사용자의 회고 데이터와 감정 점수 요약 가져오기
+        retrospectives, emotion_summary = await asyncio.gather(
+            get_retrospectives_by_user_id(user_id),
+            _get_emotion_summary_text(user_id),
+        )
 
         if not retrospectives:
             # 회고가 없는 경우
@@ -31,9 +55,22 @@ async def handle_command_my_retrospectives(
             # 헤더 블록
             blocks = [
                 SectionBlock(text="*내가 작성한 회고 목록*"),
+                ActionsBlock(
+                    elements=[
+                        ButtonElement(
+                            text="🔍 내 회고 검색",
+                            action_id="open_retrospective_search",
+                            value="open_retrospective_search",
+                        ),
+                    ],
+                ),
                 DividerBlock(),
             ]
 
+            # 감정 점수 요약 블록
+            if emotion_summary:
+                blocks.extend([SectionBlock(text=emotion_summary), DividerBlock()])
+
             # created_at 시간 초 까지 표시
             # 회고 목록 블록 생성
             for retro in retrospectives:
@@ -62,16 +99,13 @@ async def handle_command_my_retrospectives(
                     blocks.append(DividerBlock())
 
         # 모달 뷰 생성
-        view = View(
+        return View(
             type="modal",
             title="내 회고 목록",
             close="닫기",
             blocks=blocks,
         )
 
-        # 모달 열기
-        await client.views_open(trigger_id=body["trigger_id"], view=view)
-
     except Exception as e:
         logger.error(f"회고 목록 조회 실패 - User: {user_id}, Error: {str(e)}")
         # 오류 메시지 모달
@@ -79,11 +113,49 @@ async def handle_command_my_retrospectives(
             SectionBlock(text=f"회고 목록을 불러오는 중 오류가 발생했습니다: {str(e)}")
         ]
 
-        view = View(
+        return View(
             type="modal",
             title="오류",
             close="확인",
             blocks=blocks,
         )
 
-        await client.views_open(trigger_id=body["trigger_id"], view=view)
+
+async def _get_emotion_summary_text(user_id: str) -> str | None:
+    """
+    사용자의 감정 점수 요약 텍스트를 반환합니다.
+
+    분석 데이터를 준비하는 데 시간이 오래 걸리면 요약 없이 모달을 엽니다.
+    준비는 백그라운드에서 계속되어 다음 조회부터 반영됩니다.
+    """
+    try:
+        analytics = await asyncio.wait_for(
+            asyncio.shield(get_emotion_analytics()),
+            timeout=COMMAND_PREFETCH_BUDGET_SECONDS,
+        )
+    except Exception as e:
+        logger.warning(f"감정 점수 요약 생략 - User: {user_id}, Error: {e!r}")
+        return None
+
+    summary = analytics.user_summary(user_id)
+    if not summary or summary["mean"] is None:
+        return None
+
+    lines = [
+        "*나의 감정 점수 흐름* :bar_chart:",
+        f"평균 `{summary['mean']:.1f}/10` ({summary['score_count']}회 기록)",
+    ]
+    if summary["moving_average"]:
+        lines.append(f"최근 3회 이동 평균 `{summary['moving_average'][-1]:.1f}`")
+    if summary["slope"] is not None:
+        arrow = "↗" if summary["slope"] > 0 else "↘" if summary["slope"] < 0 else "→"
+        lines.append(f"추세 {arrow} (회차당 {summary['slope']:+.2f}점)")
+    lines.append(
+        f"연속 공유 `{summary['current_streak']}회차` (최장 {summary['longest_streak']}회차)"
+    )
+    if summary["outlier_sessions"]:
+        lines.append(
+            f"평소와 많이 달랐던 회차: {', '.join(summary['outlier_sessions'])}"
+        )
+
+    return "\n".join(lines)
@@ -1,3 +1,6 @@
+import asyncio
+
+from loguru import logger
 from slack.types import CommandBodyType
 from slack_bolt.async_app import AsyncAck
 from slack_sdk.web.async_client import AsyncWebClient
@@ -15,6 +18,7 @@ from utils import (
     get_latest_temp_retrospective,
 )
 from database import check_user_submitted_this_session
+from slack.modal import open_modal_within_budget
 
 
 async def handle_command_retrospective(
@@ -23,26 +27,64 @@ async def handle_command_retrospective(
     """회고 제출 명령어 처리"""
     await ack()
 
-    user_id = body["user_id"]
-
     # 현재 회차 정보 가져오기
     current_session_info = get_current_session_info()
     session_name = current_session_info[1]
     remaining_time = current_session_info[2]
     remaining_time_str = format_remaining_time(remaining_time)
 
-    # 임시 저장된 데이터 확인
-    temp_values = get_latest_temp_retrospective(user_id)
+    # 조회가 늦어지면 trigger_id 가 만료되기 전에 로딩 모달을 먼저 엽니다.
+    await open_modal_within_budget(
+        client,
+        trigger_id=body["trigger_id"],
+        title="회고 공유",
+        build_view=_prefetch_view(body, session_name, remaining_time_str),
+        loading_text="회고 작성 화면을 준비하고 있어요... ⏳",
+    )
+
 
-    # 사용자가 현재 회차에 이미 회고를 제출했는지 확인
-    already_submitted = await check_user_submitted_this_session(
-        user_id=user_id,
+async def _prefetch_view(
+    body: CommandBodyType, session_name: str, remaining_time_str: str
+) -> View:
+    """임시 저장 데이터와 제출 여부를 동시에 조회해 모달을 만듭니다. (서로 독립적입니다)"""
+    temp_values, already_submitted = await asyncio.gather(
+        _fetch_temp_values(body["user_id"]),
+        check_user_submitted_this_session(
+            user_id=body["user_id"],
+            session_name=session_name,
+        ),
+    )
+    return _build_view(
+        body=body,
         session_name=session_name,
+        remaining_time_str=remaining_time_str,
+        temp_values=temp_values,
+        already_submitted=already_submitted,
     )
 
+
+async def _fetch_temp_values(user_id: str) -> dict | None:
+    """임시 저장된 회고 데이터를 조회합니다. 실패하면 없는 것으로 처리합니다."""
+    try:
+        return await get_latest_temp_retrospective(user_id)
+    except Exception as e:
+        logger.error(f"임시 저장 데이터 조회 실패 - User: {user_id}, Error: {str(e)}")
+        return None
+
+
+def _build_view(
+    body: CommandBodyType,
+    session_name: str,
+    remaining_time_str: str,
+    temp_values: dict | None,
+    already_submitted: bool,
+) -> View:
+    """조회 결과로 회고 공유 모달을 생성합니다."""
+    user_id = body["user_id"]
+
     # 이미 제출한 경우 알림창 표시
     if already_submitted:
-        view = View(
+        return View(
             type="modal",
             title="회고 공유",
             close="확인",
@@ -52,8 +94,6 @@ async def handle_command_retrospective(
                 ),
             ],
         )
-        await client.views_open(trigger_id=body["trigger_id"], view=view)
-        return
 
     # 블록 생성
     blocks = [
@@ -150,7 +190,7 @@ async def handle_command_retrospective(
     channel_id = body["channel_id"]
 
     # 모달 뷰 생성
-    view = View(
+    return View(
         type="modal",
         callback_id="retrospective_submit",
         title="회고 공유",
@@ -159,5 +199,3 @@ async def handle_command_retrospective(
         private_metadata=channel_id,  # 채널 ID를 private_metadata에 저장
     )
 
-    # 모달 열기
-    await client.views_open(trigger_id=body["trigger_id"], view=view)
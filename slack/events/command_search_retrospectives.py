@@ -0,0 +1,146 @@
+import asyncio
+
+from slack.types import ActionBodyType, CommandBodyType, ViewBodyType, ViewType
+from slack_bolt.async_app import AsyncAck
+from slack_sdk.web.async_client import AsyncWebClient
+from slack_sdk.models.views import View
+from slack_sdk.models.blocks import (
+    Block,
+    ButtonElement,
+    ContextBlock,
+    DividerBlock,
+    InputBlock,
+    PlainTextInputElement,
+    SectionBlock,
+)
+
+from config import settings
+from constants import COMMAND_PREFETCH_BUDGET_SECONDS
+from search.fulltext import fulltext_index
+
+# 검색 범위 (private_metadata 에 저장)
+SCOPE_ALL = "all"
+SCOPE_MINE = "mine"
+
+
+async def handle_command_search_retrospectives(
+    ack: AsyncAck, body: CommandBodyType, client: AsyncWebClient
+):
+    """회고 검색 명령어 처리 (관리자는 전체, 멤버는 자신의 회고에서 검색)"""
+    await ack()
+
+    user_id = body["user_id"]
+    scope = SCOPE_ALL if user_id in settings.ADMIN_IDS else SCOPE_MINE
+    query = body.get("text", "").strip()
+
+    results = await _search(query, scope, user_id) if query else None
+    await client.views_open(
+        trigger_id=body["trigger_id"],
+        view=_build_search_view(scope, query, results),
+    )
+
+
+async def handle_action_open_retrospective_search(
+    ack: AsyncAck, body: ActionBodyType, client: AsyncWebClient
+):
+    """내 회고 목록에서 회고 검색 모달 열기"""
+    await ack()
+
+    await client.views_push(
+        trigger_id=body["trigger_id"],
+        view=_build_search_view(SCOPE_MINE),
+    )
+
+
+async def handle_view_retrospective_search(
+    ack: AsyncAck, body: ViewBodyType, client: AsyncWebClient, view: ViewType
+):
+    """회고 검색 모달 제출 처리"""
+    user_id = body["user"]["id"]
+    scope = view["private_metadata"]
+
+    # 전체 검색은 관리자만 가능합니다.
+    if scope == SCOPE_ALL and user_id not in settings.ADMIN_IDS:
+        scope = SCOPE_MINE
+
+    query = view["state"]["values"]["query"]["query_input"]["value"].strip()
+    results = await _search(query, scope, user_id)
+
+    await ack(
+        response_action="update",
+        view=_build_search_view(scope, query, results),
+    )
+
+
+async def _search(query: str, scope: str, user_id: str) -> list[dict] | None:
+    """검색 결과를 반환합니다. 색인이 준비되지 않았다면 None 을 반환합니다."""
+    if not fulltext_index.is_loaded:
+        try:
+            await asyncio.wait_for(
+                asyncio.shield(fulltext_index.ensure_loaded()),
+                timeout=COMMAND_PREFETCH_BUDGET_SECONDS,
+            )
+        except asyncio.TimeoutError:
+            return None
+
+    return fulltext_index.search(
+        query, user_id=None if scope == SCOPE_ALL else user_id
+    )
+
+
+def _build_search_view(
+    scope: str, query: str = "", results: list[dict] | None = None
+) -> View:
+    """검색 입력창과 검색 결과로 모달을 생성합니다."""
+    blocks: list[Block] = [
+        InputBlock(
+            block_id="query",
+            label="검색어" if scope == SCOPE_MINE else "검색어 (전체 회고)",
+            element=PlainTextInputElement(
+                action_id="query_input",
+                initial_value=query or None,
+                placeholder="회고 내용에서 찾을 단어를 입력하세요",
+                min_length=2,
+                max_length=100,
+            ),
+        ),
+    ]
+
+    if query and results is None:
+        blocks.append(
+            SectionBlock(text="검색 색인을 준비하고 있어요. 잠시 후 다시 시도해주세요.")
+        )
+    elif query:
+        blocks.extend(
+            [
+                DividerBlock(),
+                ContextBlock(
+                    elements=[
+                        {"type": "mrkdwn", "text": f"`{query}` 검색 결과 {len(results)}건"}
+                    ]
+                ),
+            ]
+        )
+        for result in results:
+            created_at = result["created_at"].split("T")[0]
+            author = f" | <@{result['user_id']}>" if scope == SCOPE_ALL else ""
+            blocks.append(
+                SectionBlock(
+                    text=f"*{result['session_name']}* ({created_at}){author}\n>{result['snippet']}",
+                    accessory=ButtonElement(
+                        text="상세보기",
+                        value=f"{result['id']}",
+                        action_id="view_retrospective_detail",
+                    ),
+                )
+            )
+
+    return View(
+        type="modal",
+        callback_id="retrospective_search",
+        title="회고 검색",
+        submit="검색",
+        close="닫기",
+        blocks=blocks,
+        private_metadata=scope,
+    )
@@ -0,0 +1,183 @@
+import asyncio
+
+from loguru import logger
+from slack.types import CommandBodyType
+from slack_bolt.async_app import AsyncAck, AsyncBoltContext
+from slack_sdk.web.async_client import AsyncWebClient
+from slack_sdk.models.views import View
+from slack_sdk.models.blocks import SectionBlock, DividerBlock, ContextBlock
+
+from analytics.emotion import get_emotion_analytics
+from config import settings
+from constants import COMMAND_PREFETCH_BUDGET_SECONDS, SESSION_NAMES
+from database.statistics import get_cohort_stats, get_session_stats, summarize_stats
+from slack.members import get_channel_member_ids
+from slack.modal import open_modal_within_budget
+from utils import get_cohort_name, get_current_session_info
+
+
+async def handle_command_statistics(
+    ack: AsyncAck,
+    body: CommandBodyType,
+    client: AsyncWebClient,
+    context: AsyncBoltContext,
+):
+    """회차/기수 통계 명령어 처리"""
+    await ack()
+
+    user_id = body["user_id"]
+
+    # 관리자 권한 확인
+    if user_id not in settings.ADMIN_IDS:
+        view = View(
+            type="modal",
+            title="접근 거부",
+            close="확인",
+            blocks=[
+                SectionBlock(
+                    text="관리자 기능에 접근할 권한이 없습니다. 관리자에게 문의하세요."
+                ),
+            ],
+        )
+        await client.views_open(trigger_id=body["trigger_id"], view=view)
+        return
+
+    # 회차 이름을 입력하지 않으면 현재 회차 통계를 보여줍니다.
+    session_name = body.get("text", "").strip() or get_current_session_info()[1]
+    if session_name not in SESSION_NAMES:
+        view = View(
+            type="modal",
+            title="회고 통계",
+            close="확인",
+            blocks=[SectionBlock(text=f"`{session_name}` 회차를 찾을 수 없습니다.")],
+        )
+        await client.views_open(trigger_id=body["trigger_id"], view=view)
+        return
+
+    # 통계 조회가 늦어지면 trigger_id 가 만료되기 전에 로딩 모달을 먼저 엽니다.
+    await open_modal_within_budget(
+        client,
+        trigger_id=body["trigger_id"],
+        title="회고 통계",
+        build_view=_build_view(client, context, session_name),
+        loading_text="통계를 계산하고 있어요... ⏳",
+    )
+
+
+async def _build_view(
+    client: AsyncWebClient, context: AsyncBoltContext, session_name: str
+) -> View:
+    """회차/기수 통계와 멤버 수, 감정 점수 리포트를 동시에 조회해 모달을 만듭니다."""
+    cohort_name = get_cohort_name(session_name)
+    session_row, cohort_rows, member_count, emotion_report = await asyncio.gather(
+        get_session_stats(session_name),
+        get_cohort_stats(cohort_name),
+        _get_member_count(client, context),
+        _get_emotion_report_text(cohort_name),
+    )
+    session_stats = summarize_stats([session_row] if session_row else [])
+    cohort_stats = summarize_stats(cohort_rows)
+
+    blocks = [
+        SectionBlock(text=f"*`{session_name}` 회차 통계*"),
+        SectionBlock(text=_format_stats(session_stats, member_count)),
+        DividerBlock(),
+        SectionBlock(text=f"*`{cohort_name}` 전체 통계*"),
+        SectionBlock(text=_format_stats(cohort_stats, member_count)),
+        DividerBlock(),
+        SectionBlock(text=emotion_report),
+        DividerBlock(),
+        ContextBlock(
+            elements=[
+                {
+                    "type": "mrkdwn",
+                    "text": "`/통계 회차이름` 으로 다른 회차의 통계를 볼 수 있어요.",
+                }
+            ]
+        ),
+    ]
+
+    return View(
+        type="modal",
+        title="회고 통계",
+        close="닫기",
+        blocks=blocks,
+    )
+
+
+async def _get_member_count(
+    client: AsyncWebClient, context: AsyncBoltContext
+) -> int | None:
+    """참여율 계산에 사용할 멤버 수를 반환합니다. (봇 제외)"""
+    if not settings.MEMBERS_CHANNEL:
+        return None
+
+    member_ids = await get_channel_member_ids(client, settings.MEMBERS_CHANNEL)
+    return len(member_ids - {context.bot_user_id})
+
+
+def _format_stats(stats: dict, member_count: int | None) -> str:
+    """통계 데이터를 모달에 표시할 텍스트로 변환합니다."""
+    lines = [f"*제출 수:* {stats['submission_count']}건"]
+
+    if member_count and stats["session_count"]:
+        rate = stats["submission_count"] / (member_count * stats["session_count"])
+        lines.append(f"*참여율:* {rate:.0%} (멤버 {member_count}명 기준)")
+
+    if stats["emotion_score_mean"] is None:
+        lines.append("*감정 점수 평균:* 없음")
+        return "\n".join(lines)
+
+    lines.append(
+        f"*감정 점수 평균:* {stats['emotion_score_mean']:.1f}/10 "
+        f"({stats['emotion_score_count']}명 응답)"
+    )
+
+    # 감정 점수 분포를 막대로 표시합니다.
+    max_count = max(stats["emotion_score_counts"])
+    for score, count in enumerate(stats["emotion_score_counts"], start=1):
+        bar = "█" * round(count / max_count * 10) if max_count else ""
+        lines.append(f"`{score:>2}` {bar} {count}")
+
+    return "\n".join(lines)
+
+
+async def _get_emotion_report_text(cohort_name: str) -> str:
+    """기수의 감정 점수 추이와 주의가 필요한 멤버를 텍스트로 반환합니다."""
+    try:
+        analytics = await asyncio.wait_for(
+            asyncio.shield(get_emotion_analytics()),
+            timeout=COMMAND_PREFETCH_BUDGET_SECONDS,
+        )
+    except Exception as e:
+        logger.warning(f"감정 점수 리포트 생략 - Cohort: {cohort_name}, Error: {e!r}")
+        return "*감정 점수 추이*\n데이터를 준비하고 있어요. 잠시 후 다시 시도해주세요."
+
+    report = analytics.cohort_report(cohort_name)
+    lines = ["*감정 점수 추이*"]
+    if not report["sessions"]:
+        lines.append("기록된 감정 점수가 없습니다.")
+        return "\n".join(lines)
+
+    # 최근 회차부터 표시합니다.
+    moving_average = [None] * (len(report["sessions"]) - len(report["moving_average"]))
+    moving_average += report["moving_average"]
+    for session_name, mean, average in list(
+        zip(report["sessions"], report["session_means"], moving_average)
+    )[::-1][:6]:
+        average_text = f" (이동 평균 {average:.1f})" if average is not None else ""
+        lines.append(f"`{session_name}` {mean:.1f}{average_text}")
+
+    if report["declining_users"]:
+        users = ", ".join(
+            f"<@{user_id}> ({slope:+.2f})" for user_id, slope in report["declining_users"]
+        )
+        lines.append(f"\n*하락 추세 멤버:* {users}")
+
+    if report["latest_outliers"]:
+        users = ", ".join(
+            f"<@{user_id}> ({score:.0f}점)" for user_id, score in report["latest_outliers"]
+        )
+        lines.append(f"*최근 회차 이상치:* {users}")
+
+    return "\n".join(lines)
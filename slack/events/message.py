@@ -1,5 +1,6 @@
 from slack.types import MessageBodyType
 from config import settings
+from jobs.queue import PRIORITY_HIGH, enqueue
 
 from slack_bolt.async_app import AsyncAck, AsyncSay
 from slack_sdk.web.async_client import AsyncWebClient
@@ -24,7 +25,11 @@ async def handle_message(
         and not event.get("subtype")
         and not thread_ts
     ):
-        await client.chat_postMessage(
-            channel=settings.ADMIN_CHANNEL,
-            text=f"👋 <@{body['event']['user']}> 님이 <#{settings.SUPPORT_CHANNEL}> 에 문의를 남겼어요. 👀 <@{settings.ADMIN_IDS[0]}> <@{settings.ADMIN_IDS[1]}>",
+        await enqueue(
+            "post_message",
+            {
+                "channel": settings.ADMIN_CHANNEL,
+                "text": f"👋 <@{body['event']['user']}> 님이 <#{settings.SUPPORT_CHANNEL}> 에 문의를 남겼어요. 👀 <@{settings.ADMIN_IDS[0]}> <@{settings.ADMIN_IDS[1]}>",
+            },
+            priority=PRIORITY_HIGH,
         )
@@ -0,0 +1,36 @@
+import asyncio
+
+from slack_bolt.async_app import AsyncAck
+from slack_sdk.models.blocks import Option
+
+from config import settings
+from constants import COMMAND_PREFETCH_BUDGET_SECONDS
+from search.typeahead import typeahead
+
+
+async def handle_options_retrospective_id(ack: AsyncAck, body: dict):
+    """관리자 메뉴의 회고 검색 옵션 처리"""
+    user_id = body["user"]["id"]
+
+    # 관리자 권한 확인
+    if user_id not in settings.ADMIN_IDS:
+        await ack(options=[])
+        return
+
+    # 색인이 아직 준비되지 않았다면 잠시 기다립니다.
+    if not typeahead.is_loaded:
+        try:
+            await asyncio.wait_for(
+                asyncio.shield(typeahead.ensure_loaded()),
+                timeout=COMMAND_PREFETCH_BUDGET_SECONDS,
+            )
+        except asyncio.TimeoutError:
+            pass
+
+    results = typeahead.search(body.get("value", ""))
+    await ack(
+        options=[
+            Option(text=label, value=str(retrospective_id))
+            for retrospective_id, label in results
+        ]
+    )
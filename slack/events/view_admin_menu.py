@@ -1,5 +1,7 @@
+import asyncio
+
 from loguru import logger
-from exception import BotException
+from exception import BotException, ConflictException
 from slack.types import ViewBodyType, ViewType
 from slack_bolt.async_app import AsyncAck
 from slack_sdk.web.async_client import AsyncWebClient
@@ -15,7 +17,14 @@ from slack_sdk.models.blocks import (
     NumberInputElement,
 )
 from config import settings
+from constants import COMMAND_PREFETCH_BUDGET_SECONDS
 from database.retrospective import get_retrospective_by_id
+from keyed_lock import retrospective_locks
+from search.fulltext import fulltext_index
+from search.similarity import DUPLICATE_THRESHOLD, similarity_engine
+
+# 다른 관리자가 같은 회고를 수정하고 있을 때 기다리는 최대 시간(초)
+EDIT_LOCK_TIMEOUT_SECONDS = 1
 
 
 async def handle_view_admin_menu(
@@ -36,7 +45,9 @@ async def handle_view_admin_menu(
         # 모달에서 입력된 값 추출
         values = view["state"]["values"]
         retrospective_id = int(
-            values["retrospective_id"]["retrospective_id_input"]["value"]
+            values["retrospective_id"]["retrospective_id_input"]["selected_option"][
+                "value"
+            ]
         )
 
         # 회고 데이터 가져오기
@@ -84,6 +95,8 @@ async def handle_view_admin_menu(
                 f"*감정 이유:* {retrospective.get('emotion_reason', '없음')}"
             ),
             DividerBlock(),
+            SectionBlock(text=await _get_similar_retrospectives_text(retrospective_id)),
+            DividerBlock(),
             SectionBlock(text="수행할 작업을 선택하세요:"),
             ActionsBlock(
                 block_id="admin_actions",
@@ -132,6 +145,40 @@ async def handle_view_admin_menu(
         )
 
 
+async def _get_similar_retrospectives_text(retrospective_id: int) -> str:
+    """
+    유사한 회고 목록과 중복 의심 여부를 텍스트로 반환합니다.
+
+    유사도 행렬을 다시 만드는 데 오래 걸리면 목록 없이 모달을 엽니다.
+    행렬은 백그라운드에서 계속 만들어져 다음 조회부터 반영됩니다.
+    """
+    if not fulltext_index.is_loaded:
+        fulltext_index.ensure_loaded()
+        return "*유사한 회고*\n검색 색인을 준비하고 있어요."
+
+    try:
+        similar = await asyncio.wait_for(
+            asyncio.shield(similarity_engine.most_similar(retrospective_id, k=3)),
+            timeout=COMMAND_PREFETCH_BUDGET_SECONDS,
+        )
+    except asyncio.TimeoutError:
+        return "*유사한 회고*\n유사도를 계산하고 있어요. 잠시 후 다시 확인해주세요."
+    lines = ["*유사한 회고*"]
+    for similar_id, score in similar:
+        # 유사도 행렬을 만든 뒤 삭제된 회고는 건너뜁니다.
+        doc = fulltext_index.documents.get(similar_id)
+        if doc is None:
+            continue
+        warning = " ⚠️ *중복 의심*" if score >= DUPLICATE_THRESHOLD else ""
+        lines.append(
+            f"회고ID: {similar_id} | {doc['session_name']} | <@{doc['user_id']}> | "
+            f"유사도 {score:.0%}{warning}"
+        )
+    if len(lines) == 1:
+        return "*유사한 회고*\n없음"
+    return "\n".join(lines)
+
+
 async def handle_admin_action_delete(
     ack: AsyncAck, body: ViewBodyType, client: AsyncWebClient, action: dict
 ):
@@ -296,7 +343,8 @@ async def handle_admin_action_edit(
                 submit="저장",
                 close="취소",
                 blocks=blocks,
-                private_metadata=f"{retrospective_id}|{retrospective['slack_channel']}|{retrospective['slack_ts']}",
+                # 저장할 때 그 사이 다른 곳에서 수정했는지 확인할 수 있도록 updated_at 을 함께 보냅니다.
+                private_metadata=f"{retrospective_id}|{retrospective['slack_channel']}|{retrospective['slack_ts']}|{retrospective.get('updated_at') or ''}",
             ),
         )
 
@@ -388,8 +436,6 @@ async def handle_view_admin_edit_retrospective(
     ack: AsyncAck, body: ViewBodyType, client: AsyncWebClient, view: ViewType
 ):
     """회고 수정 모달 제출 처리"""
-    from database.retrospective import update_retrospective
-
     user_id = body["user"]["id"]
 
     # 관리자 권한 확인
@@ -409,6 +455,9 @@ async def handle_view_admin_edit_retrospective(
         retrospective_id = int(metadata_parts[0])
         slack_channel = metadata_parts[1]
         slack_ts = metadata_parts[2]
+        expected_updated_at = (
+            metadata_parts[3] if len(metadata_parts) > 3 and metadata_parts[3] else None
+        )
 
         # 수정할 데이터 준비
         update_data = {
@@ -435,87 +484,17 @@ async def handle_view_admin_edit_retrospective(
                 "emotion_reason_input"
             ]["value"]
 
-        # 회고 데이터 업데이트
-        updated_retro = await update_retrospective(retrospective_id, update_data)
-
-        # 슬랙 메시지 업데이트
-        try:
-            # 회고 작성자 정보 및 감정 점수 가져오기
-            retro_user = updated_retro["user_id"]
-            session_name = updated_retro["session_name"]
-
-            # 메시지 블록 생성
-            blocks = [
-                SectionBlock(
-                    text=f"*<@{retro_user}>님이 `{session_name}` 회고를 공유했어요! 🤗*"
-                ),
-                DividerBlock(),
-                ContextBlock(
-                    elements=[{"type": "mrkdwn", "text": "*잘했고 좋았던 점* 🌟"}]
-                ),
-                SectionBlock(text=update_data["good_points"]),
-                DividerBlock(),
-                ContextBlock(
-                    elements=[
-                        {"type": "mrkdwn", "text": "*아쉽고 개선하고 싶은 점* 🔧"}
-                    ]
-                ),
-                SectionBlock(text=update_data["improvements"]),
-                DividerBlock(),
-                ContextBlock(
-                    elements=[{"type": "mrkdwn", "text": "*새롭게 배운 점* 💡"}]
-                ),
-                SectionBlock(text=update_data["learnings"]),
-                DividerBlock(),
-                ContextBlock(
-                    elements=[{"type": "mrkdwn", "text": "*해볼만한 액션 아이템* 🚀"}]
-                ),
-                SectionBlock(text=update_data["action_item"]),
-            ]
-
-            # 감정 점수가 있다면 추가
-            if "emotion_score" in update_data:
-                blocks.extend(
-                    [
-                        DividerBlock(),
-                        SectionBlock(
-                            text=f"*오늘의 감정점수* :bar_chart: {update_data['emotion_score']}/10"
-                        ),
-                    ]
-                )
-
-                # 감정 이유가 입력되었다면 추가
-                if "emotion_reason" in update_data and update_data["emotion_reason"]:
-                    blocks.append(SectionBlock(text=update_data["emotion_reason"]))
-
-            # Footer 블록 생성
-            footer_blocks = [
-                DividerBlock(),
-                ContextBlock(
-                    elements=[
-                        {
-                            "type": "mrkdwn",
-                            "text": f"회고에 문제가 있다면 <#{settings.SUPPORT_CHANNEL}>에 문의를 남겨 주세요.",
-                        }
-                    ]
-                ),
-            ]
-
-            blocks.extend(footer_blocks)
-
-            # 업데이트된 블록으로 메시지 수정
-            await client.chat_update(
-                channel=slack_channel,
-                ts=slack_ts,
-                blocks=blocks,
-                text=f"*<@{retro_user}>님의 회고 (수정됨)*",
-            )
-
-            message = "회고가 성공적으로 수정되었습니다.\n슬랙 메시지도 함께 업데이트되었습니다."
-        except Exception as e:
-            message = f"회고가 성공적으로 수정되었습니다.\n슬랙 메시지 업데이트 중 오류 발생: {str(e)}"
-            logger.error(
-                f"슬랙 메시지 업데이트 실패 - Channel: {slack_channel}, TS: {slack_ts}, Error: {str(e)}"
+        # 같은 회고를 동시에 수정하지 않도록 잠그고, 그 사이 수정되었다면 덮어쓰지 않습니다.
+        async with retrospective_locks.hold(
+            str(retrospective_id), timeout=EDIT_LOCK_TIMEOUT_SECONDS
+        ):
+            message = await _update_retrospective_and_message(
+                client,
+                retrospective_id,
+                slack_channel,
+                slack_ts,
+                update_data,
+                expected_updated_at,
             )
 
         await ack()
@@ -531,9 +510,121 @@ async def handle_view_admin_edit_retrospective(
             ),
         )
 
+    except asyncio.TimeoutError:
+        await ack(
+            response_action="errors",
+            errors={
+                "good_points": "다른 관리자가 이 회고를 수정하고 있습니다. 잠시 후 다시 시도해주세요."
+            },
+        )
+
+    except ConflictException as e:
+        # 다른 관리자가 먼저 저장한 내용을 덮어쓰지 않고 알립니다.
+        logger.warning(f"회고 수정 충돌 - User: {user_id}, Error: {str(e)}")
+        await ack(response_action="errors", errors={"good_points": e.message})
+
     except Exception as e:
         logger.error(f"회고 수정 제출 처리 실패 - User: {user_id}, Error: {str(e)}")
         await ack(
             response_action="errors",
             errors={"good_points": f"오류 발생: {str(e)}"},
         )
+
+
+async def _update_retrospective_and_message(
+    client: AsyncWebClient,
+    retrospective_id: int,
+    slack_channel: str,
+    slack_ts: str,
+    update_data: dict,
+    expected_updated_at: str | None,
+) -> str:
+    """회고를 수정하고 게시된 슬랙 메시지에 반영한 뒤, 결과 메시지를 반환합니다."""
+    from database.retrospective import update_retrospective
+
+    # 회고 데이터 업데이트
+    updated_retro = await update_retrospective(
+        retrospective_id, update_data, expected_updated_at=expected_updated_at
+    )
+
+    # 슬랙 메시지 업데이트
+    try:
+        # 회고 작성자 정보 및 감정 점수 가져오기
+        retro_user = updated_retro["user_id"]
+        session_name = updated_retro["session_name"]
+
+        # 메시지 블록 생성
+        blocks = [
+            SectionBlock(
+                text=f"*<@{retro_user}>님이 `{session_name}` 회고를 공유했어요! 🤗*"
+            ),
+            DividerBlock(),
+            ContextBlock(
+                elements=[{"type": "mrkdwn", "text": "*잘했고 좋았던 점* 🌟"}]
+            ),
+            SectionBlock(text=update_data["good_points"]),
+            DividerBlock(),
+            ContextBlock(
+                elements=[
+                    {"type": "mrkdwn", "text": "*아쉽고 개선하고 싶은 점* 🔧"}
+                ]
+            ),
+            SectionBlock(text=update_data["improvements"]),
+            DividerBlock(),
+            ContextBlock(
+                elements=[{"type": "mrkdwn", "text": "*새롭게 배운 점* 💡"}]
+            ),
+            SectionBlock(text=update_data["learnings"]),
+            DividerBlock(),
+            ContextBlock(
+                elements=[{"type": "mrkdwn", "text": "*해볼만한 액션 아이템* 🚀"}]
+            ),
+            SectionBlock(text=update_data["action_item"]),
+        ]
+
+        # 감정 점수가 있다면 추가
+        if "emotion_score" in update_data:
+            blocks.extend(
+                [
+                    DividerBlock(),
+                    SectionBlock(
+                        text=f"*오늘의 감정점수* :bar_chart: {update_data['emotion_score']}/10"
+                    ),
+                ]
+            )
+
+            # 감정 이유가 입력되었다면 추가
+            if "emotion_reason" in update_data and update_data["emotion_reason"]:
+                blocks.append(SectionBlock(text=update_data["emotion_reason"]))
+
+        # Footer 블록 생성
+        footer_blocks = [
+            DividerBlock(),
+            ContextBlock(
+                elements=[
+                    {
+                        "type": "mrkdwn",
+                        "text": f"회고에 문제가 있다면 <#{settings.SUPPORT_CHANNEL}>에 문의를 남겨 주세요.",
+                    }
+                ]
+            ),
+        ]
+
+        blocks.extend(footer_blocks)
+
+        # 업데이트된 블록으로 메시지 수정
+        await client.chat_update(
+            channel=slack_channel,
+            ts=slack_ts,
+            blocks=blocks,
+            text=f"*<@{retro_user}>님의 회고 (수정됨)*",
+        )
+
+        message = "회고가 성공적으로 수정되었습니다.\n슬랙 메시지도 함께 업데이트되었습니다."
+    except Exception as e:
+        message = f"회고가 성공적으로 수정되었습니다.\n슬랙 메시지 업데이트 중 오류 발생: {str(e)}"
+        logger.error(
+            f"슬랙 메시지 업데이트 실패 - Channel: {slack_channel}, TS: {slack_ts}, Error: {str(e)}"
+        )
+
+    return message
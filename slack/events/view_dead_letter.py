@@ -0,0 +1,88 @@
+import datetime
+import time
+from typing import Any
+from zoneinfo import ZoneInfo
+
+from slack_bolt.async_app import AsyncAck
+from slack_sdk.web.async_client import AsyncWebClient
+from slack_sdk.models.views import View
+from slack_sdk.models.blocks import SectionBlock, DividerBlock
+
+from config import settings
+from file_io import run_file_io
+from jobs.dead_letter import dead_letter_store
+from jobs.queue import enqueue
+from slack.types import ActionBodyType, ViewBodyType
+
+# 모달에 표시할 최대 오류 종류 수
+FINGERPRINT_LIST_LIMIT = 15
+
+
+async def handle_dead_letter_status(
+    ack: AsyncAck,
+    body: ActionBodyType,
+    client: AsyncWebClient,
+) -> None:
+    """처리하지 못한 이벤트를 오류 종류별로 묶어 보여주는 모달을 엽니다."""
+    await ack()
+
+    # 관리자 권한 확인
+    if body["user"]["id"] not in settings.ADMIN_IDS:
+        return
+
+    summary = await run_file_io(dead_letter_store.summary)
+    total = sum(group["count"] for group in summary)
+
+    blocks = [
+        SectionBlock(text=f"*재처리 대기 중인 이벤트* {total}개"),
+        DividerBlock(),
+        SectionBlock(text=_format_summary(summary)),
+    ]
+
+    await client.views_push(
+        trigger_id=body["trigger_id"],
+        view=View(
+            type="modal",
+            callback_id="dead_letter_replay",
+            title="실패한 이벤트",
+            close="닫기",
+            # 재처리할 이벤트가 없으면 제출 버튼을 표시하지 않습니다.
+            submit="모두 재처리" if total else None,
+            blocks=blocks,
+        ),
+    )
+
+
+async def handle_view_dead_letter_replay(
+    ack: AsyncAck,
+    body: ViewBodyType,
+) -> None:
+    """보관된 이벤트를 다시 처리하는 작업을 등록합니다."""
+    await ack()
+
+    # 관리자 권한 확인
+    if body["user"]["id"] not in settings.ADMIN_IDS:
+        return
+
+    # 여러 번 눌러도 같은 이벤트를 동시에 재처리하지 않습니다.
+    await enqueue(
+        "replay_dead_letters",
+        {"user_id": body["user"]["id"], "before": time.time()},
+    )
+
+
+def _format_summary(summary: list[dict[str, Any]]) -> str:
+    if not summary:
+        return "없음"
+
+    lines = []
+    for group in summary[:FINGERPRINT_LIST_LIMIT]:
+        last_seen_at = datetime.datetime.fromtimestamp(
+            group["last_seen_at"], tz=ZoneInfo("Asia/Seoul")
+        ).strftime("%m-%d %H:%M:%S")
+        lines.append(
+            f"`{group['fingerprint']}` `{group['listener']}` | {group['count']}개 "
+            f"| 최근 {last_seen_at}\n> {group['error'].splitlines()[0][:150]}"
+        )
+    # Slack 섹션 텍스트는 3000자까지 표시할 수 있습니다.
+    return "\n".join(lines)[:3000]
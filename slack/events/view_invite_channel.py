@@ -1,6 +1,5 @@
 from slack_bolt.async_app import AsyncAck, AsyncSay
 from slack_sdk.web.async_client import AsyncWebClient
-from slack_sdk.errors import SlackApiError
 from slack_sdk.models.views import View
 from slack_sdk.models.blocks import (
     SectionBlock,
@@ -8,8 +7,7 @@ from slack_sdk.models.blocks import (
     UserSelectElement,
     InputBlock,
 )
-import tenacity
-from config import settings
+from jobs.queue import enqueue
 from slack.types import (
     ViewBodyType,
     ViewType,
@@ -75,63 +73,6 @@ async def handle_action_view_invite_channel(
     user_id = values["user"]["select_user"]["selected_user"]
     channel_ids = values["channel"]["select_channels"]["selected_channels"]
 
-    if not channel_ids:
-        channel_ids = await _fetch_public_channel_ids(client)
-
-    await client.chat_postMessage(
-        channel=settings.ADMIN_CHANNEL,
-        text=f"<@{user_id}> 님의 채널 초대를 시작합니다.\n\n채널 수 : {len(channel_ids)} 개\n",
-    )
-
-    for channel_id in channel_ids:
-        await _invite_channel(client, user_id, channel_id)
-
-    await client.chat_postMessage(
-        channel=settings.ADMIN_CHANNEL,
-        text="채널 초대가 완료되었습니다.",
-    )
-
-
-@tenacity.retry(
-    stop=tenacity.stop_after_attempt(3),
-    wait=tenacity.wait_fixed(1),
-    reraise=True,
-)
-async def _fetch_public_channel_ids(client: AsyncWebClient) -> list[str]:
-    """모든 공개 채널의 아이디를 조회합니다."""
-    res = await client.conversations_list(limit=500, types="public_channel")
-    return [channel["id"] for channel in res["channels"]]
-
-
-@tenacity.retry(
-    stop=tenacity.stop_after_attempt(3),
-    wait=tenacity.wait_fixed(1),
-    reraise=True,
-)
-async def _invite_channel(
-    client: AsyncWebClient,
-    user_id: str,
-    channel_id: str,
-) -> None:
-    """채널에 멤버를 초대합니다."""
-    try:
-        await client.conversations_invite(channel=channel_id, users=user_id)
-        result = " -> ✅ (채널 초대)"
-    except SlackApiError as e:
-        # 봇이 채널에 없는 경우, 채널에 참여하고 초대합니다.
-        if e.response["error"] == "not_in_channel":
-            await client.conversations_join(channel=channel_id)
-            await client.conversations_invite(channel=channel_id, users=user_id)
-            result = " -> ✅ (시공봇도 함께 채널 초대)"
-        elif e.response["error"] == "already_in_channel":
-            result = " -> ✅ (이미 채널에 참여 중)"
-        elif e.response["error"] == "cant_invite_self":
-            result = " -> ✅ (시공봇이 자기 자신을 초대)"
-        else:
-            link = "<https://api.slack.com/methods/conversations.invite#errors|문서 확인하기>"
-            result = f" -> 😵 ({e.response['error']}) 👉 {link}"
-
-    await client.chat_postMessage(
-        channel=settings.ADMIN_CHANNEL,
-        text=f"\n<#{channel_id}>" + result,
-    )
+    # 채널마다 초대하는 데 시간이 걸리므로 작업 큐에 맡깁니다.
+    # (채널을 선택하지 않으면 작업에서 모든 공개 채널을 조회합니다)
+    await enqueue("invite_member", {"user_id": user_id, "channel_ids": channel_ids})
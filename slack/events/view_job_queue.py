@@ -0,0 +1,73 @@
+import datetime
+from typing import Any
+from zoneinfo import ZoneInfo
+
+from slack_bolt.async_app import AsyncAck
+from slack_sdk.web.async_client import AsyncWebClient
+from slack_sdk.models.views import View
+from slack_sdk.models.blocks import SectionBlock, DividerBlock
+
+from config import settings
+from jobs.queue import job_queue
+from slack.types import ActionBodyType
+
+# 모달에 표시할 상태별 최대 작업 수
+JOB_LIST_LIMIT = 10
+
+
+async def handle_job_queue_status(
+    ack: AsyncAck,
+    body: ActionBodyType,
+    client: AsyncWebClient,
+) -> None:
+    """대기 중이거나 실패한 백그라운드 작업 현황 모달을 엽니다."""
+    await ack()
+
+    # 관리자 권한 확인
+    if body["user"]["id"] not in settings.ADMIN_IDS:
+        return
+
+    status = await job_queue.status(limit=JOB_LIST_LIMIT)
+    counts = status["counts"]
+
+    blocks = [
+        SectionBlock(
+            text="*작업 현황*\n"
+            f"대기: {counts.get('pending', 0)}개 | 실행 중: {counts.get('running', 0)}개 | "
+            f"실패: {counts.get('failed', 0)}개 | 완료: {counts.get('done', 0)}개"
+        ),
+        DividerBlock(),
+        SectionBlock(text=_format_jobs("대기 중인 작업", status["pending"])),
+        DividerBlock(),
+        SectionBlock(text=_format_jobs("실패한 작업", status["failed"])),
+    ]
+
+    await client.views_push(
+        trigger_id=body["trigger_id"],
+        view=View(
+            type="modal",
+            title="작업 큐",
+            close="닫기",
+            blocks=blocks,
+        ),
+    )
+
+
+def _format_jobs(title: str, jobs: list[dict[str, Any]]) -> str:
+    if not jobs:
+        return f"*{title}*\n없음"
+
+    lines = [f"*{title}*"]
+    for job in jobs:
+        available_at = datetime.datetime.fromtimestamp(
+            job["available_at"], tz=ZoneInfo("Asia/Seoul")
+        ).strftime("%m-%d %H:%M:%S")
+        line = (
+            f"#{job['id']} `{job['kind']}` | 시도 {job['attempts']}/{job['max_attempts']} "
+            f"| 실행 예정 {available_at}"
+        )
+        if job["last_error"]:
+            line += f"\n> {job['last_error'].splitlines()[0][:150]}"
+        lines.append(line)
+    # Slack 섹션 텍스트는 3000자까지 표시할 수 있습니다.
+    return "\n".join(lines)[:3000]
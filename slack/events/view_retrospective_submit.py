@@ -1,4 +1,5 @@
 import asyncio
+
 from loguru import logger
 from slack.types import ViewBodyType, ViewType
 from slack_bolt.async_app import AsyncAck
@@ -7,15 +8,77 @@ from slack_sdk.models.blocks import SectionBlock, DividerBlock, ContextBlock
 
 from utils import get_current_session_info
 from config import settings
-from database.retrospective import create_retrospective
+from database.retrospective import (
+    check_user_submitted_this_session,
+    create_retrospective,
+    upsert_retrospectives_from_slack,
+)
+from exception import ConflictException
+from jobs.dead_letter import capture, get_dead_letter_state
+from jobs.queue import PRIORITY_HIGH, PRIORITY_LOW, enqueue
+from keyed_lock import submission_locks
 from utils import save_temp_retrospective, cleanup_temp_files
 
+# 같은 멤버의 이전 제출이 끝나기를 기다리는 최대 시간(초) (Slack 은 3초 안에 응답을 받아야 합니다)
+SUBMIT_LOCK_TIMEOUT_SECONDS = 1
+
+SAVE_PENDING_TEXT = (
+    "`{session_name}` 회고를 공유했지만, 데이터베이스 응답이 늦어 아직 저장하지 못했어요. "
+    "잠시 후 자동으로 다시 저장하고, 저장되면 DM 으로 알려드릴게요. 🙏\n"
+    "한 시간이 지나도 알림이 없다면 `/공유` 로 다시 제출해주세요. "
+    "(서버가 다시 시작되면 저장이 취소될 수 있어요)"
+)
+
+ALREADY_SUBMITTED_TEXT = (
+    "`{session_name}` 회고는 이미 제출했어요. 제출한 회고는 `/내회고` 에서 확인할 수 있어요."
+)
+
+CONFLICT_TEXT = (
+    "`{session_name}` 회고는 이미 제출되어 있어 방금 제출한 회고는 공유하지 않았어요. "
+    "작성한 내용은 임시 저장해 두었어요. 제출한 회고는 `/내회고` 에서 확인할 수 있어요."
+)
+
 
 async def handle_view_retrospective_submit(
-    ack: AsyncAck, body: ViewBodyType, client: AsyncWebClient, view: ViewType
+    ack: AsyncAck,
+    body: ViewBodyType,
+    client: AsyncWebClient,
+    view: ViewType,
+    context: dict,
+):
+    """모달 제출 처리 (같은 멤버의 제출은 하나씩 처리합니다)"""
+    user_id = body["user"]["id"]
+
+    try:
+        async with submission_locks.hold(user_id, timeout=SUBMIT_LOCK_TIMEOUT_SECONDS):
+            await _submit_retrospective(ack, body, client, view, context)
+    except asyncio.TimeoutError:
+        logger.warning(f"회고 제출 중복 요청 - User: {user_id}")
+        await ack(
+            response_action="errors",
+            errors={
+                "good_points": "이전에 제출한 회고를 처리하고 있어요. 잠시 후 다시 시도해주세요."
+            },
+        )
+
+
+async def _submit_retrospective(
+    ack: AsyncAck,
+    body: ViewBodyType,
+    client: AsyncWebClient,
+    view: ViewType,
+    context: dict,
 ):
-    """모달 제출 처리"""
+    """
+    회고를 게시하고 저장합니다.
+
+    실패한 제출을 재처리할 때는 처음 제출할 때의 회차를 사용하고, 이미 게시한 메시지는
+    다시 게시하지 않습니다.
+    """
     user_id = body["user"]["id"]
+    replay_state = get_dead_letter_state(context)
+    # 재처리할 때 이어서 처리하는 데 필요한 값
+    state = {}
 
     try:
         # 모달에서 입력된 값 추출
@@ -45,9 +108,23 @@ async def handle_view_retrospective_submit(
             .get("value", "")
         )
 
+        # 저장하지 못했을 때 임시 저장할 내용
+        draft = {
+            "good_points": good_points,
+            "improvements": improvements,
+            "learnings": learnings,
+            "action_item": action_item,
+            "emotion_score": emotion_score,
+            "emotion_reason": emotion_reason,
+        }
+
         # 현재 회차 정보 가져오기
-        current_session_info = get_current_session_info()
-        session_name = current_session_info[1]
+        if replay_state:
+            session_name = replay_state["session_name"]
+        else:
+            current_session_info = get_current_session_info()
+            session_name = current_session_info[1]
+        state["session_name"] = session_name
 
         # 메시지 블록 생성
         blocks = [
@@ -111,19 +188,38 @@ async def handle_view_retrospective_submit(
             else body["user"]["id"]
         )
 
+        state["slack_channel"] = original_channel_id
+
+        # 잠금을 잡은 뒤 다시 확인하므로, 같은 모달이나 다른 모달로 앞서 제출해 저장된 회고가 있으면
+        # 게시하거나 저장하지 않고 모달에 안내합니다. (재처리할 때 실패로 기록되었지만 실제로는 저장된 경우 포함)
+        # 잠금은 한 워커 안의 제출만 순서대로 처리하므로, 워커 사이의 중복은 데이터베이스의
+        # 유니크 인덱스가 막습니다. (database/schemas/submission.sql)
+        if await check_user_submitted_this_session(user_id, session_name):
+            logger.info(f"이미 제출된 회고 생략 - User: {user_id}")
+            await ack(
+                response_action="errors",
+                errors={"good_points": ALREADY_SUBMITTED_TEXT.format(session_name=session_name)},
+            )
+            return
+
         await ack()
 
-        # 원래의 채널에 회고 내용 게시
-        response = await client.chat_postMessage(
-            channel=original_channel_id,
-            blocks=blocks,
-            text=f"*<@{user_id}>님이 `{session_name}` 회고를 공유했어요! 🤗*",
-        )
+        if replay_state and replay_state.get("slack_ts"):
+            # 이미 게시한 메시지는 다시 게시하지 않습니다.
+            slack_ts = replay_state["slack_ts"]
+        else:
+            # 원래의 채널에 회고 내용 게시
+            response = await client.chat_postMessage(
+                channel=original_channel_id,
+                blocks=blocks,
+                text=f"*<@{user_id}>님이 `{session_name}` 회고를 공유했어요! 🤗*",
+            )
 
-        # 메시지 타임스탬프 가져오기
-        slack_ts = response["ts"]
-        # Supabase에 데이터 저장
-        await create_retrospective(
+            # 메시지 타임스탬프 가져오기
+            slack_ts = response["ts"]
+        state["slack_ts"] = slack_ts
+
+        retrospective = dict(
             user_id=user_id,
             session_name=session_name,
             slack_channel=original_channel_id,
@@ -135,19 +231,65 @@ async def handle_view_retrospective_submit(
             emotion_score=int(emotion_score) if emotion_score else None,
             emotion_reason=emotion_reason if emotion_reason else None,
         )
+        # Supabase에 데이터 저장
+        if replay_state:
+            # 재처리할 때는 같은 메시지의 회고가 두 번 저장되지 않도록 합니다.
+            await upsert_retrospectives_from_slack([retrospective])
+            saved = None
+        else:
+            try:
+                saved = await create_retrospective(**retrospective)
+            except ConflictException:
+                # 다른 워커가 같은 회차의 회고를 먼저 저장했으므로 방금 게시한 메시지를 지우고,
+                # 모달은 이미 닫혔으므로 작성한 내용을 임시 저장해 두고 멤버에게 알립니다.
+                logger.info(f"이미 제출된 회고로 게시 취소 - User: {user_id}")
+                try:
+                    await client.chat_delete(channel=original_channel_id, ts=slack_ts)
+                except Exception as e:
+                    logger.error(f"중복 회고 메시지 삭제 실패 - User: {user_id}, Error: {str(e)}")
+                await _keep_and_notify(
+                    user_id, draft, CONFLICT_TEXT.format(session_name=session_name)
+                )
+                return
+
+        if saved is not None and saved.get("deferred"):
+            # 아직 저장되지 않았으므로 작성한 내용을 임시 저장해 두고 멤버에게 알립니다.
+            logger.info(f"회고 제출 완료 (저장 지연) - User: {user_id}")
+            await _keep_and_notify(
+                user_id, draft, SAVE_PENDING_TEXT.format(session_name=session_name)
+            )
+        else:
+            # 성공적으로 저장되면 임시 파일 삭제
+            await cleanup_temp_files(user_id)
 
-        # 성공적으로 저장되면 임시 파일 삭제
-        cleanup_temp_files(user_id)
+            # 로깅 추가
+            logger.info(f"회고 제출 완료 - User: {user_id}")
 
-        # 로깅 추가
-        logger.info(f"회고 제출 완료 - User: {user_id}")
+        # 스레드에 추가 메시지 전송
+        # 회고 공유와는 무관하므로 작업 큐에 맡기고, 부모 메시지 딜레이를 감안하여 3초 뒤에 보냅니다.
+        try:
+            await enqueue(
+                "post_message",
+                {
+                    "channel": original_channel_id,
+                    "thread_ts": slack_ts,  # 스레드로 연결
+                    "text": "멋진 회고를 공유해주셔서 고마워요! 타임트래커 이미지도 스레드에 공유해볼까요? 🖼️",
+                },
+                priority=PRIORITY_LOW,
+                delay_seconds=3,
+            )
+        except Exception as e:
+            logger.error(f"스레드 메시지 등록 실패 - User: {user_id}, Error: {str(e)}")
 
     except Exception as e:
         logger.error(f"회고 제출 실패 - User: {user_id}, Error: {str(e)}")
 
+        # 관리자 메뉴에서 다시 처리할 수 있도록 보관합니다.
+        await capture(body, e, context, state)
+
         # 에러 발생 시 임시 저장
         try:
-            save_temp_retrospective(
+            await save_temp_retrospective(
                 user_id,
                 {
                     "good_points": good_points,
@@ -168,11 +310,19 @@ async def handle_view_retrospective_submit(
             },
         )
 
-    # 스레드에 추가 메시지 전송
-    # 회고 공유와는 무관하므로 공유 완료 후 처리
-    await asyncio.sleep(3)  # 부모 메시지 딜레이를 감안하여 3초 대기
-    await client.chat_postMessage(
-        channel=original_channel_id,
-        thread_ts=slack_ts,  # 스레드로 연결
-        text="멋진 회고를 공유해주셔서 고마워요! 타임트래커 이미지도 스레드에 공유해볼까요? 🖼️",
-    )
+
+async def _keep_and_notify(user_id: str, values: dict, text: str) -> None:
+    """저장하지 못한 회고를 임시 저장하고, 그 이유를 멤버에게 DM 으로 알립니다. (모달이 이미 닫힌 경우)"""
+    try:
+        await save_temp_retrospective(user_id, values)
+    except Exception as e:
+        logger.error(f"임시 저장 실패 - User: {user_id}, Error: {str(e)}")
+
+    try:
+        await enqueue(
+            "post_message",
+            {"channel": user_id, "text": text},
+            priority=PRIORITY_HIGH,
+        )
+    except Exception as e:
+        logger.error(f"회고 저장 안내 등록 실패 - User: {user_id}, Error: {str(e)}")
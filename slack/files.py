@@ -0,0 +1,58 @@
+import os
+from pathlib import Path
+from typing import Any
+
+import aiohttp
+from slack_sdk.web.async_client import AsyncWebClient
+
+from file_io import run_file_io
+
+# 파일 본문을 올리는 최대 시간(초) (작업 제한 시간 안에 끝나도록 합니다)
+UPLOAD_TIMEOUT_SECONDS = 120
+
+
+async def upload_file(
+    client: AsyncWebClient,
+    path: Path,
+    channel: str,
+    title: str,
+    initial_comment: str | None = None,
+) -> dict[str, Any]:
+    """
+    파일을 디스크에서 읽으며 채널에 올립니다.
+
+    files_upload_v2 는 파일 전체를 메모리에 읽어 올리므로, 같은 세 단계
+    (업로드 URL 발급 -> 본문 전송 -> 업로드 완료) 를 직접 호출하고 본문은
+    aiohttp 가 스레드에서 조금씩 읽어 보내도록 파일 객체로 넘깁니다.
+
+    Returns:
+        올린 파일 정보 (permalink 등)
+    """
+    size = (await run_file_io(os.stat, path)).st_size
+    response = await client.files_getUploadURLExternal(
+        filename=path.name, length=size
+    )
+
+    file = await run_file_io(open, path, "rb")
+    try:
+        async with aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=UPLOAD_TIMEOUT_SECONDS)
+        ) as session:
+            async with session.post(
+                response["upload_url"],
+                data=file,
+                headers={"Content-Length": str(size)},
+            ) as upload:
+                if upload.status != 200:
+                    raise ValueError(
+                        f"파일 업로드 중 오류가 발생했습니다: {upload.status} {await upload.text()}"
+                    )
+    finally:
+        await run_file_io(file.close)
+
+    completion = await client.files_completeUploadExternal(
+        files=[{"id": response["file_id"], "title": title}],
+        channel_id=channel,
+        initial_comment=initial_comment,
+    )
+    return completion["files"][0]
@@ -0,0 +1,75 @@
+import asyncio
+import importlib
+import inspect
+from typing import Any, Callable
+
+# 지연 등록된 핸들러 모듈 이름 (시작 후 미리 불러올 때 사용)
+_module_names: set[str] = set()
+
+# 요청 context 에 이 키로 Future 가 있으면 핸들러가 끝났을 때 결과를 알려줍니다.
+# (ack 이후에도 핸들러가 계속 실행되므로, 재처리할 때 끝날 때까지 기다리는 데 사용합니다)
+COMPLETION_KEY = "listener_completion"
+
+# 요청 context 에 이 키로 함수가 있으면 핸들러가 끝났을 때 호출합니다. (slack/admission.py)
+RELEASE_KEY = "admission_release"
+
+
+def lazy_listener(path: str) -> Callable:
+    """
+    "모듈:함수" 경로의 핸들러를 처음 호출될 때 불러오는 리스너를 반환합니다.
+
+    Bolt 는 리스너의 인자 이름을 보고 값을 넘겨주므로, 리스너에서 쓸 수 있는 인자를
+    모두 받은 뒤 실제 핸들러가 선언한 인자만 골라 전달합니다.
+    """
+    module_name, function_name = path.split(":")
+    _module_names.add(module_name)
+    resolved: tuple[Callable, list[str]] | None = None
+
+    async def listener(
+        ack,
+        body,
+        client,
+        context,
+        logger,
+        payload,
+        respond,
+        say,
+        event,
+        action,
+        command,
+        view,
+        options,
+        shortcut,
+    ) -> Any:
+        nonlocal resolved
+        if resolved is None:
+            function = getattr(importlib.import_module(module_name), function_name)
+            resolved = (function, list(inspect.signature(function).parameters))
+
+        available = locals()
+        function, parameter_names = resolved
+        completion: asyncio.Future | None = context.get(COMPLETION_KEY)
+        release: Callable[[], None] | None = context.get(RELEASE_KEY)
+        try:
+            result = await function(**{name: available[name] for name in parameter_names})
+        except Exception as e:
+            if completion is not None and not completion.done():
+                completion.set_exception(e)
+            raise
+        finally:
+            if release is not None:
+                release()
+        if completion is not None and not completion.done():
+            completion.set_result(result)
+        return result
+
+    # Bolt 로그에 실제 핸들러 이름이 표시되도록 합니다.
+    listener.__name__ = function_name
+    listener.__qualname__ = function_name
+    return listener
+
+
+async def preload_listeners() -> None:
+    """지연 등록된 핸들러 모듈을 이벤트 루프를 막지 않도록 스레드에서 미리 불러옵니다."""
+    for module_name in sorted(_module_names):
+        await asyncio.to_thread(importlib.import_module, module_name)
@@ -0,0 +1,32 @@
+import time
+
+from slack_sdk.web.async_client import AsyncWebClient
+
+# 채널 멤버 목록 캐시 유지 시간(초)
+MEMBERSHIP_CACHE_TTL_SECONDS = 600
+
+_membership_cache: dict[str, tuple[float, frozenset[str]]] = {}
+
+
+async def get_channel_member_ids(
+    client: AsyncWebClient, channel_id: str
+) -> frozenset[str]:
+    """채널 멤버 ID 목록을 조회합니다. 일정 시간 동안 캐시합니다."""
+    cached = _membership_cache.get(channel_id)
+    if cached and time.monotonic() - cached[0] < MEMBERSHIP_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    member_ids: set[str] = set()
+    cursor = None
+    while True:
+        res = await client.conversations_members(
+            channel=channel_id, limit=1000, cursor=cursor
+        )
+        member_ids.update(res["members"])
+        cursor = res.get("response_metadata", {}).get("next_cursor")
+        if not cursor:
+            break
+
+    members = frozenset(member_ids)
+    _membership_cache[channel_id] = (time.monotonic(), members)
+    return members
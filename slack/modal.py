@@ -0,0 +1,77 @@
+import asyncio
+from typing import Awaitable
+
+from loguru import logger
+from slack_sdk.errors import SlackApiError
+from slack_sdk.models.blocks import SectionBlock
+from slack_sdk.models.views import View
+from slack_sdk.web.async_client import AsyncWebClient
+
+from constants import COMMAND_PREFETCH_BUDGET_SECONDS, COMMAND_PREFETCH_TIMEOUT_SECONDS
+
+LOADING_TEXT = "화면을 준비하고 있어요... ⏳"
+ERROR_TEXT = "화면을 불러오지 못했어요. 잠시 후 다시 시도해주세요. 🙏"
+
+
+def _message_view(title: str, text: str) -> View:
+    return View(type="modal", title=title, close="닫기", blocks=[SectionBlock(text=text)])
+
+
+async def open_modal_within_budget(
+    client: AsyncWebClient,
+    trigger_id: str,
+    title: str,
+    build_view: Awaitable[View],
+    loading_text: str = LOADING_TEXT,
+) -> None:
+    """
+    조회가 필요한 모달을 trigger_id 가 만료되기 전에 엽니다.
+
+    모달이 COMMAND_PREFETCH_BUDGET_SECONDS 안에 준비되면 바로 열고, 그렇지 않으면 로딩
+    모달을 먼저 연 뒤 준비가 끝나면 교체합니다. COMMAND_PREFETCH_TIMEOUT_SECONDS 안에
+    준비되지 않거나 실패하면 오류 안내로 교체합니다.
+
+    Args:
+        client: Slack 클라이언트
+        trigger_id: 모달을 열 trigger_id
+        title: 로딩, 오류 모달의 제목
+        build_view: 모달을 만드는 코루틴 (조회를 포함합니다)
+        loading_text: 로딩 모달에 표시할 문구
+    """
+    task = asyncio.ensure_future(build_view)
+    done, _ = await asyncio.wait({task}, timeout=COMMAND_PREFETCH_BUDGET_SECONDS)
+    if done:
+        if task.exception() is None:
+            view = task.result()
+        else:
+            logger.error(f"모달 준비 실패 - {title}, Error: {str(task.exception())}")
+            view = _message_view(title, ERROR_TEXT)
+        await client.views_open(trigger_id=trigger_id, view=view)
+        return
+
+    logger.info(f"모달 준비 지연 - {title}")
+    try:
+        response = await client.views_open(
+            trigger_id=trigger_id, view=_message_view(title, loading_text)
+        )
+    except BaseException:
+        task.cancel()
+        raise
+
+    try:
+        async with asyncio.timeout(COMMAND_PREFETCH_TIMEOUT_SECONDS):
+            view = await task
+    except Exception as e:
+        # 시간 초과(TimeoutError)로 취소된 경우를 포함합니다.
+        logger.error(f"모달 준비 실패 - {title}, Error: {e!r}")
+        view = _message_view(title, ERROR_TEXT)
+
+    try:
+        await client.views_update(
+            view_id=response["view"]["id"],
+            hash=response["view"]["hash"],
+            view=view,
+        )
+    except SlackApiError as e:
+        # 멤버가 로딩 모달을 닫았거나 그 사이 모달이 바뀐 경우입니다.
+        logger.warning(f"모달 교체 실패 - {title}, Error: {e.response['error']}")
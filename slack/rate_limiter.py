@@ -0,0 +1,46 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable
+
+from loguru import logger
+from slack_sdk.errors import SlackApiError
+
+
+class AsyncRateLimiter:
+    """
+    Slack API 호출 간격을 제한합니다.
+
+    초당 호출 수를 넘지 않도록 호출 사이에 대기하고,
+    429 응답을 받으면 Retry-After 만큼 기다린 뒤 다시 시도합니다.
+    """
+
+    def __init__(self, rate_per_second: float, max_retries: int = 3) -> None:
+        self._interval = 1.0 / rate_per_second
+        self._max_retries = max_retries
+        self._lock = asyncio.Lock()
+        self._next_at = 0.0
+
+    async def wait(self) -> None:
+        """다음 호출이 가능할 때까지 대기합니다."""
+        async with self._lock:
+            now = time.monotonic()
+            if self._next_at > now:
+                await asyncio.sleep(self._next_at - now)
+                now = time.monotonic()
+            self._next_at = now + self._interval
+
+    async def call(
+        self, api_method: Callable[..., Awaitable[Any]], **kwargs: Any
+    ) -> Any:
+        """호출 간격을 지키며 Slack API를 호출합니다."""
+        for attempt in range(self._max_retries + 1):
+            await self.wait()
+            try:
+                return await api_method(**kwargs)
+            except SlackApiError as e:
+                if e.response.status_code != 429 or attempt == self._max_retries:
+                    raise
+                retry_after = float(e.response.headers.get("Retry-After", 1))
+                logger.warning(f"Slack API 호출 제한 - {retry_after}초 후 재시도합니다.")
+                # 다른 호출도 함께 기다리도록 다음 호출 시각을 미룹니다.
+                self._next_at = max(self._next_at, time.monotonic() + retry_after)
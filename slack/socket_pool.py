@@ -0,0 +1,288 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any
+
+from loguru import logger
+from slack_bolt.adapter.socket_mode.async_internals import (
+    run_async_bolt_app,
+    send_async_response,
+)
+from slack_bolt.app.async_app import AsyncApp
+from slack_sdk.socket_mode.aiohttp import SocketModeClient
+from slack_sdk.socket_mode.request import SocketModeRequest
+from slack_sdk.socket_mode.response import SocketModeResponse
+
+# 중복 확인을 위해 기억해 둘 최근 요청 수
+RECENT_ENVELOPES = 2000
+
+# 교체된 연결에서 처리 중인 요청의 응답(ack)을 기다리는 최대 시간(초)
+DRAIN_TIMEOUT_SECONDS = 3
+
+# 연결 상태 확인 간격(초)
+WATCH_INTERVAL_SECONDS = 1
+
+# Slack 이 허용하는 앱당 최대 동시 연결 수 (교체 중 1개를 더 사용합니다)
+MAX_CONNECTIONS = 9
+
+
+class _GapStats:
+    """끊긴 시간의 횟수, 마지막 값, 최댓값, 합계를 기록합니다."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.last = 0.0
+        self.max = 0.0
+        self.total = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.count += 1
+        self.last = seconds
+        self.max = max(self.max, seconds)
+        self.total += seconds
+
+    def summary(self) -> dict[str, float]:
+        return {
+            "last": round(self.last, 3),
+            "max": round(self.max, 3),
+            "total": round(self.total, 3),
+        }
+
+
+class _PooledClient(SocketModeClient):
+    """연결 풀에 속한 Socket Mode 클라이언트"""
+
+    def __init__(self, pool: "SocketModePool", slot: int, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.pool = pool
+        self.slot = slot
+        self.retiring = False
+        self.in_flight = 0
+        self.connected_at: float | None = None
+        self.rotate_at: float | None = None
+
+    async def connect(self) -> None:
+        await super().connect()
+        self.connected_at = time.monotonic()
+
+    async def connect_to_new_endpoint(self, force: bool = False) -> None:
+        # 교체 중인 연결은 다시 연결하지 않고 새 연결에 맡깁니다.
+        if self.retiring or self.closed:
+            return
+        started_at = time.monotonic()
+        await super().connect_to_new_endpoint(force)
+        if self.connected_at is not None and self.connected_at > started_at:
+            self.pool.record_reconnect(self, time.monotonic() - started_at)
+
+    async def run_message_listeners(self, message: dict, raw_message: str) -> None:
+        # Slack 의 연결 종료 예고는 같은 연결을 다시 맺는 대신 새 연결을 먼저 연 뒤 교체합니다.
+        if message.get("type") == "disconnect":
+            self.pool.rotate_soon(self, message.get("reason", ""))
+            return
+        await super().run_message_listeners(message, raw_message)
+
+
+class SocketModePool:
+    """
+    여러 개의 Socket Mode 연결을 동시에 유지합니다.
+
+    Slack 은 열린 연결들에 요청을 나누어 보내므로, 한 연결이 끊기거나 교체되는 동안에도
+    다른 연결로 요청을 받을 수 있습니다. 응답(ack)은 요청을 받은 연결로 보냅니다.
+    Slack 의 연결 종료 예고(disconnect)를 받으면 새 연결을 먼저 연 뒤 기존 연결을 닫고,
+    여러 연결로 다시 전달된 요청은 한 번만 처리합니다.
+    """
+
+    def __init__(
+        self,
+        app: AsyncApp,
+        app_token: str,
+        size: int = 2,
+        max_age_seconds: float = 0,
+    ) -> None:
+        """
+        Args:
+            app: Bolt 앱
+            app_token: xapp- 으로 시작하는 앱 토큰
+            size: 동시에 유지할 연결 수
+            max_age_seconds: 0 보다 크면 이 시간이 지난 연결을 미리 교체합니다.
+        """
+        self.app = app
+        self.app_token = app_token
+        self.size = max(1, min(size, MAX_CONNECTIONS))
+        self.max_age_seconds = max_age_seconds
+        self._clients: list[_PooledClient] = []
+        self._retiring: set[_PooledClient] = set()
+        self._seen: OrderedDict[str, None] = OrderedDict()
+        self._tasks: set[asyncio.Task] = set()
+        self._watch_task: asyncio.Task | None = None
+        self._down_since: float | None = None
+
+        self.received_count = 0
+        self.duplicate_count = 0
+        self.rotation_count = 0
+        self.reconnect_gaps = _GapStats()
+        self.outage_gaps = _GapStats()
+
+    def _create_client(self, slot: int) -> _PooledClient:
+        client = _PooledClient(
+            self,
+            slot,
+            app_token=self.app_token,
+            logger=self.app.logger,
+            web_client=self.app.client,
+        )
+        client.socket_mode_request_listeners.append(self.handle)
+        return client
+
+    async def connect_async(self) -> None:
+        """모든 연결을 동시에 엽니다."""
+        self._clients = [self._create_client(slot) for slot in range(self.size)]
+        await asyncio.gather(*(client.connect() for client in self._clients))
+
+        # 정해진 시간마다 교체하는 경우 연결마다 시점을 나누어 동시에 교체되지 않도록 합니다.
+        if self.max_age_seconds > 0:
+            now = time.monotonic()
+            interval = self.max_age_seconds / self.size
+            for client in self._clients:
+                client.rotate_at = now + interval * (client.slot + 1)
+
+        self._watch_task = asyncio.create_task(self._watch())
+        logger.info(f"Socket Mode 연결 완료 - Connections: {self.size}")
+
+    async def close_async(self) -> None:
+        """모든 연결을 닫습니다."""
+        if self._watch_task is not None:
+            self._watch_task.cancel()
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(
+            *(client.close() for client in [*self._clients, *self._retiring]),
+            return_exceptions=True,
+        )
+        self._clients = []
+        self._retiring.clear()
+
+    async def is_connected(self) -> bool:
+        """연결이 하나라도 살아 있으면 True 를 반환합니다."""
+        return await self.connected_count() > 0
+
+    async def connected_count(self) -> int:
+        states = await asyncio.gather(
+            *(client.is_connected() for client in self._clients)
+        )
+        return sum(states)
+
+    def _is_duplicate(self, req: SocketModeRequest) -> bool:
+        # 이벤트 재전송은 다른 연결로 새 envelope_id 를 달고 오므로 event_id 로 확인합니다.
+        key = req.envelope_id
+        if req.type == "events_api" and req.payload.get("event_id"):
+            key = req.payload["event_id"]
+
+        if key in self._seen:
+            return True
+        self._seen[key] = None
+        while len(self._seen) > RECENT_ENVELOPES:
+            self._seen.popitem(last=False)
+        return False
+
+    async def handle(self, client: _PooledClient, req: SocketModeRequest) -> None:
+        """받은 요청을 Bolt 앱으로 처리하고 같은 연결로 응답합니다."""
+        self.received_count += 1
+        if self._is_duplicate(req):
+            self.duplicate_count += 1
+            await client.send_socket_mode_response(
+                SocketModeResponse(envelope_id=req.envelope_id)
+            )
+            return
+
+        client.in_flight += 1
+        try:
+            started_at = time.time()
+            bolt_response = await run_async_bolt_app(self.app, req)
+            await send_async_response(client, req, bolt_response, started_at)
+        finally:
+            client.in_flight -= 1
+
+    def _spawn(self, coroutine) -> None:
+        task = asyncio.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def rotate_soon(self, client: _PooledClient, reason: str) -> None:
+        """연결 교체를 예약합니다."""
+        if client.retiring or client not in self._clients:
+            return
+        logger.info(
+            f"Socket Mode 연결 교체 시작 - Slot: {client.slot}, Reason: {reason}"
+        )
+        client.retiring = True
+        self._spawn(self._rotate(client))
+
+    async def _rotate(self, old: _PooledClient) -> None:
+        started_at = time.monotonic()
+        new = self._create_client(old.slot)
+        await new.connect()
+        if self.max_age_seconds > 0:
+            new.rotate_at = time.monotonic() + self.max_age_seconds
+
+        self._clients[self._clients.index(old)] = new
+        self._retiring.add(old)
+        self.rotation_count += 1
+        logger.info(
+            f"Socket Mode 연결 교체 완료 - Slot: {old.slot}, "
+            f"Elapsed: {time.monotonic() - started_at:.2f}s"
+        )
+
+        # 기존 연결로 받은 요청의 응답을 보낼 수 있도록 잠시 기다린 뒤 닫습니다.
+        deadline = time.monotonic() + DRAIN_TIMEOUT_SECONDS
+        while old.in_flight and time.monotonic() < deadline:
+            await asyncio.sleep(0.1)
+        try:
+            await old.close()
+        finally:
+            self._retiring.discard(old)
+
+    def record_reconnect(self, client: _PooledClient, gap_seconds: float) -> None:
+        """Socket Mode 클라이언트가 스스로 다시 연결한 경우를 기록합니다."""
+        self.reconnect_gaps.record(gap_seconds)
+        logger.warning(
+            f"Socket Mode 재연결 - Slot: {client.slot}, Gap: {gap_seconds:.2f}s"
+        )
+
+    async def _watch(self) -> None:
+        """모든 연결이 끊긴 시간을 기록하고, 오래된 연결을 교체합니다."""
+        while True:
+            await asyncio.sleep(WATCH_INTERVAL_SECONDS)
+            now = time.monotonic()
+            try:
+                connected = await self.connected_count()
+            except Exception as e:
+                logger.error(f"Socket Mode 연결 상태 확인 실패 - Error: {str(e)}")
+                continue
+
+            if connected == 0 and self._down_since is None:
+                self._down_since = now
+                logger.error("Socket Mode 연결이 모두 끊겼습니다.")
+            elif connected > 0 and self._down_since is not None:
+                gap = now - self._down_since
+                self._down_since = None
+                self.outage_gaps.record(gap)
+                logger.warning(f"Socket Mode 연결 복구 - Gap: {gap:.2f}s")
+
+            for client in list(self._clients):
+                if client.rotate_at is not None and now >= client.rotate_at:
+                    self.rotate_soon(client, "max_age")
+
+    async def metrics(self) -> dict[str, Any]:
+        """연결 상태와 재연결 횟수, 끊긴 시간 통계를 반환합니다."""
+        return {
+            "connections": self.size,
+            "connected": await self.connected_count(),
+            "received": self.received_count,
+            "duplicates": self.duplicate_count,
+            "rotations": self.rotation_count,
+            "reconnects": self.reconnect_gaps.count,
+            "reconnect_gap_seconds": self.reconnect_gaps.summary(),
+            "outages": self.outage_gaps.count,
+            "outage_seconds": self.outage_gaps.summary(),
+        }
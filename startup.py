@@ -0,0 +1,92 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable
+
+from loguru import logger
+
+
+class StartupTracker:
+    """
+    서버 시작 단계별 소요 시간과 준비 상태를 기록합니다.
+
+    모든 시작 단계가 끝나고 Slack 연결이 살아 있을 때만 준비된 것으로 봅니다.
+    캐시 준비 단계는 실패해도 서비스는 가능하므로 실패로 기록만 하고,
+    필수(required) 단계가 실패하면 서버를 종료합니다.
+    """
+
+    def __init__(self) -> None:
+        self._started_at = time.perf_counter()
+        self._phases: dict[str, dict[str, Any]] = {}
+        self._completed_at: float | None = None
+        self._connection_check: Callable[[], Awaitable[bool]] | None = None
+
+    async def run_phase(
+        self, name: str, phase: Callable[[], Awaitable[Any]], required: bool = False
+    ) -> None:
+        """시작 단계 하나를 실행하고 소요 시간과 결과를 기록합니다."""
+        started_at = time.perf_counter()
+        self._phases[name] = {"status": "running", "required": required}
+        try:
+            await phase()
+            status, error = "ok", None
+        except Exception as e:
+            status, error = "failed", str(e)
+            logger.error(f"시작 단계 실패 - Phase: {name}, Error: {error}")
+
+        elapsed = time.perf_counter() - started_at
+        self._phases[name].update(
+            status=status, error=error, elapsed_seconds=round(elapsed, 3)
+        )
+        logger.info(f"시작 단계 완료 - Phase: {name}, Status: {status}, Elapsed: {elapsed:.2f}s")
+
+    async def run(
+        self,
+        phases: dict[str, Callable[[], Awaitable[Any]]],
+        required: tuple[str, ...] = (),
+    ) -> None:
+        """시작 단계를 동시에 실행합니다. 필수 단계가 실패하면 RuntimeError 를 발생시킵니다."""
+        await asyncio.gather(
+            *(
+                self.run_phase(name, phase, required=name in required)
+                for name, phase in phases.items()
+            )
+        )
+        self._completed_at = time.perf_counter()
+
+        failed = [name for name in required if self._phases[name]["status"] != "ok"]
+        if failed:
+            raise RuntimeError(f"필수 시작 단계가 실패했습니다: {', '.join(failed)}")
+        logger.info(
+            f"서버 시작 완료 - Elapsed: {self._completed_at - self._started_at:.2f}s"
+        )
+
+    def set_connection_check(self, check: Callable[[], Awaitable[bool]]) -> None:
+        """준비 상태 확인 시 함께 확인할 Slack 연결 상태 함수를 등록합니다."""
+        self._connection_check = check
+
+    async def is_ready(self) -> bool:
+        if self._completed_at is None:
+            return False
+        if any(
+            phase["required"] and phase["status"] != "ok"
+            for phase in self._phases.values()
+        ):
+            return False
+        if self._connection_check is not None and not await self._connection_check():
+            return False
+        return True
+
+    async def report(self) -> dict[str, Any]:
+        """준비 상태와 단계별 소요 시간을 반환합니다."""
+        return {
+            "ready": await self.is_ready(),
+            "startup_seconds": (
+                round(self._completed_at - self._started_at, 3)
+                if self._completed_at is not None
+                else None
+            ),
+            "phases": self._phases,
+        }
+
+
+startup = StartupTracker()
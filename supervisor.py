@@ -0,0 +1,102 @@
+import asyncio
+import multiprocessing
+import os
+import signal
+import time
+
+from loguru import logger
+
+from config import settings
+
+# 워커가 비정상 종료된 경우 다시 실행하기 전 최대 대기 시간(초)
+MAX_RESTART_DELAY_SECONDS = 30
+
+# 이 시간 이상 실행된 워커가 종료되면 대기 시간을 처음부터 다시 늘립니다.
+HEALTHY_RUN_SECONDS = 60
+
+
+def _run_worker() -> None:
+    """워커 프로세스에서 서버를 실행합니다."""
+    # 종료 요청(SIGTERM)을 받아도 연결 정리 코드가 실행되도록 KeyboardInterrupt 로 바꿉니다.
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    from main import main
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
+
+
+def run_workers(count: int) -> None:
+    """
+    워커 프로세스를 count 개 실행하고, 비정상 종료된 워커는 다시 실행합니다.
+
+    HTTP 모드에서는 워커들이 같은 포트를 함께 열어(SO_REUSEPORT) 요청을 나누어 받고,
+    Socket Mode 에서는 워커마다 연결을 열어 Slack 이 요청을 나누어 보냅니다.
+    스케줄러 작업은 리더로 선출된 워커 하나에서만 실행됩니다.
+    """
+    if not settings.REALTIME_ENABLED:
+        logger.warning(
+            "여러 워커로 실행할 때 REALTIME_ENABLED 가 꺼져 있으면 "
+            "다른 워커가 저장한 회고가 각 워커의 검색 색인과 캐시에 늦게 반영됩니다."
+        )
+
+    context = multiprocessing.get_context("spawn")
+    workers: dict[int, multiprocessing.Process] = {}
+    started_at: dict[int, float] = {}
+    restart_at: dict[int, float] = {}
+    restart_delays: dict[int, float] = {}
+    stopping = False
+
+    def start(worker_id: int) -> None:
+        # spawn 으로 만든 프로세스는 시작 시점의 환경 변수를 물려받습니다.
+        os.environ["WORKER_ID"] = str(worker_id)
+        process = context.Process(target=_run_worker, name=f"worker-{worker_id}")
+        process.start()
+        workers[worker_id] = process
+        started_at[worker_id] = time.monotonic()
+        logger.info(f"워커 시작 - Worker: {worker_id}, PID: {process.pid}")
+
+    def stop(signum, frame) -> None:
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    for worker_id in range(count):
+        start(worker_id)
+
+    while not stopping:
+        time.sleep(1)
+        now = time.monotonic()
+        for worker_id, process in workers.items():
+            if process.is_alive():
+                continue
+
+            if worker_id not in restart_at:
+                if now - started_at[worker_id] >= HEALTHY_RUN_SECONDS:
+                    restart_delays[worker_id] = 0.5
+                delay = min(
+                    restart_delays.get(worker_id, 0.5) * 2, MAX_RESTART_DELAY_SECONDS
+                )
+                restart_delays[worker_id] = delay
+                restart_at[worker_id] = now + delay
+                logger.error(
+                    f"워커 종료 감지 - Worker: {worker_id}, "
+                    f"Exit code: {process.exitcode}, Restart in: {delay:.0f}s"
+                )
+            elif now >= restart_at[worker_id]:
+                del restart_at[worker_id]
+                start(worker_id)
+
+    logger.info("워커를 종료합니다...")
+    for process in workers.values():
+        if process.is_alive():
+            process.terminate()
+    for process in workers.values():
+        process.join(timeout=10)
+        if process.is_alive():
+            process.kill()
+    logger.info("모든 워커가 종료되었습니다.")
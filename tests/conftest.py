@@ -0,0 +1,11 @@
+import os
+import sys
+from pathlib import Path
+
+# 설정을 가져오기 전에 테스트용 환경 변수를 넣습니다. (네트워크 호출은 없습니다)
+os.environ.setdefault("ENV", "test")
+os.environ.setdefault("SLACK_BOT_TOKEN", "xoxb-test")
+os.environ.setdefault("SUPABASE_URL", "https://example.supabase.co")
+os.environ.setdefault("SUPABASE_KEY", "test-key")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,47 @@
+"""테스트에서 함께 사용하는 Slack 요청, 클라이언트 대역"""
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.views: list[dict] = []
+        self.messages: list[dict] = []
+        self.deleted: list[dict] = []
+
+    async def views_open(self, trigger_id, view):
+        self.views.append(view.to_dict())
+        return {"view": {"id": "V1", "hash": "h1"}}
+
+    async def views_update(self, view_id, hash, view):
+        self.views.append(view.to_dict())
+        return {"view": {"id": view_id, "hash": hash}}
+
+    async def chat_postMessage(self, **kwargs):
+        self.messages.append(kwargs)
+        return {"ts": f"1700000000.{len(self.messages):06d}"}
+
+    async def chat_delete(self, **kwargs):
+        self.deleted.append(kwargs)
+        return {"ok": True}
+
+
+async def ack(*args, **kwargs):
+    return None
+
+
+FAILING_GOOD_POINTS = "저장에 실패할 회고"
+
+
+def submission_body(user_id: str, view_id: str, good_points: str) -> dict:
+    def text(value):
+        return {"value": value}
+
+    values = {
+        "good_points": {"good_points_input": text(good_points)},
+        "improvements": {"improvements_input": text("아쉬운 점")},
+        "learnings": {"learnings_input": text("배운 점")},
+        "action_item": {"action_item_input": text("액션 아이템")},
+        "emotion_score": {"emotion_score_input": text("7")},
+        "emotion_reason": {"emotion_reason_input": text("이유")},
+    }
+    view = {"id": view_id, "private_metadata": "C1", "state": {"values": values}}
+    return {"type": "view_submission", "user": {"id": user_id}, "view": view}
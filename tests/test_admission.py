@@ -0,0 +1,110 @@
+import asyncio
+
+import pytest
+from slack_bolt.authorization import AuthorizeResult
+from slack_bolt.request.async_request import AsyncBoltRequest
+
+from slack import admission as admission_module
+from slack.admission import (
+    ACK,
+    ADMIN,
+    BUSY_LAG_SECONDS,
+    IN_FLIGHT_LIMITS,
+    NOTIFICATION,
+    OVERLOADED_LAG_SECONDS,
+    READ,
+    SUBMISSION,
+    AdmissionApp,
+    AdmissionController,
+    admission_middleware,
+    classify,
+)
+from slack.lazy import lazy_listener
+
+
+@pytest.mark.parametrize(
+    "body, cls",
+    [
+        ({"command": "/공유"}, SUBMISSION),
+        ({"type": "view_submission", "view": {"callback_id": "retrospective_submit"}}, SUBMISSION),
+        ({"command": "/관리자"}, ADMIN),
+        ({"type": "block_actions", "actions": [{"action_id": "edit_retrospective"}]}, ADMIN),
+        ({"type": "event_callback", "event": {"type": "member_joined_channel"}}, NOTIFICATION),
+        ({"type": "block_suggestion", "action_id": "search_user"}, ACK),
+        ({"type": "view_closed", "view": {"callback_id": "retrospective_submit"}}, ACK),
+        ({"command": "/내회고"}, READ),
+    ],
+)
+def test_classify(body, cls):
+    assert classify(body) == cls
+
+
+@pytest.mark.parametrize(
+    "lag, admitted",
+    [
+        (0.0, {SUBMISSION, READ, ADMIN, NOTIFICATION}),
+        (BUSY_LAG_SECONDS, {SUBMISSION, READ, ADMIN}),
+        (OVERLOADED_LAG_SECONDS, {SUBMISSION}),
+    ],
+    ids=["normal", "busy", "overloaded"],
+)
+def test_lower_classes_are_shed_as_load_rises(lag, admitted):
+    controller = AdmissionController(IN_FLIGHT_LIMITS)
+    controller._lag = lag
+
+    async def run():
+        return {
+            cls
+            for cls in (SUBMISSION, READ, ADMIN, NOTIFICATION)
+            if await controller.admit(cls) is not None
+        }
+
+    assert asyncio.run(run()) == admitted
+
+
+async def handle_mention(ack, event):
+    await ack()
+
+
+async def authorize(enterprise_id, team_id, user_id):
+    # auth.test 를 호출하지 않도록 토큰 정보를 바로 반환합니다.
+    return AuthorizeResult(
+        enterprise_id=enterprise_id, team_id=team_id, bot_token="xoxb-test", bot_user_id="UB"
+    )
+
+
+def event_request(event_type: str) -> AsyncBoltRequest:
+    return AsyncBoltRequest(
+        body={
+            "type": "event_callback",
+            "team_id": "T1",
+            "api_app_id": "A1",
+            "event": {"type": event_type, "user": "U1", "channel": "C1", "ts": "1.0"},
+        },
+        mode="socket_mode",
+    )
+
+
+@pytest.mark.parametrize(
+    "event_type, status",
+    [("app_mention", 200), ("reaction_added", 404)],
+    ids=["matched", "unmatched"],
+)
+def test_slot_is_released_with_or_without_listener(monkeypatch, event_type, status):
+    controller = AdmissionController(IN_FLIGHT_LIMITS)
+    monkeypatch.setattr(admission_module, "admission", controller)
+
+    app = AdmissionApp(signing_secret="secret", authorize=authorize)
+    app.middleware(admission_middleware)
+    app.event("app_mention")(lazy_listener("tests.test_admission:handle_mention"))
+
+    async def run():
+        response = await app.async_dispatch(event_request(event_type))
+        # 리스너는 응답한 뒤에도 백그라운드에서 실행되므로 끝날 때까지 기다립니다.
+        while controller.metrics()["classes"][NOTIFICATION]["in_flight"]:
+            await asyncio.sleep(0.01)
+        return response
+
+    response = asyncio.run(asyncio.wait_for(run(), timeout=5))
+    assert response.status == status
+    assert controller.metrics()["classes"][NOTIFICATION]["admitted"] == 1
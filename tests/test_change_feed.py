@@ -0,0 +1,202 @@
+import asyncio
+
+import pytest
+
+from config import settings
+from constants import SESSION_NAMES
+from database import realtime, warm_store as warm_store_module
+from database.changes import is_change_feed_active, notify_change
+from database.realtime import ChangeFeed, LocalChangePublisher
+from database.warm_store import WarmStore
+from search import fulltext, typeahead as typeahead_module
+from search.fulltext import FullTextIndex
+from search.typeahead import RetrospectiveTypeahead
+from utils import get_cohort_name, get_cohort_session_names
+
+SESSION_NAME = SESSION_NAMES[2]
+
+
+def retrospective(retrospective_id: int, good_points: str, updated_at: str) -> dict:
+    return {
+        "id": retrospective_id,
+        "user_id": "U1",
+        "session_name": SESSION_NAME,
+        "slack_channel": "C1",
+        "slack_ts": "1700000000.000100",
+        "good_points": good_points,
+        "improvements": "아쉬운 점",
+        "learnings": "배운 점",
+        "action_item": "액션 아이템",
+        "emotion_score": 7,
+        "emotion_reason": "이유",
+        "created_at": "2025-05-01T10:00:00+00:00",
+        "updated_at": updated_at,
+    }
+
+
+async def drain(feed: ChangeFeed) -> None:
+    """피드가 받은 변경을 리스너에 모두 전달할 때까지 기다립니다."""
+    while feed._tasks:
+        await asyncio.gather(*feed._tasks)
+
+
+@pytest.fixture
+def stores(tmp_path, monkeypatch):
+    """변경 리스너가 테스트 전용 메모리 저장소, 검색 색인, 변경 피드를 사용하도록 바꿉니다."""
+    store = WarmStore()
+    cohort_name = get_cohort_name(SESSION_NAME)
+    store._cohort_name = cohort_name
+    store._session_names = frozenset(get_cohort_session_names(cohort_name))
+    index = FullTextIndex(tmp_path / "search_index.json")
+    typeahead = RetrospectiveTypeahead()
+    feed = ChangeFeed()
+
+    monkeypatch.setattr(warm_store_module, "warm_store", store)
+    monkeypatch.setattr(fulltext, "fulltext_index", index)
+    monkeypatch.setattr(typeahead_module, "typeahead", typeahead)
+    monkeypatch.setattr(realtime, "change_feed", feed)
+    return store, index, typeahead, feed
+
+
+def test_feed_changes_update_warm_store_and_search_indexes(stores):
+    store, index, typeahead, feed = stores
+    publisher = LocalChangePublisher()
+
+    async def run():
+        await feed.start(publisher)
+        try:
+            publisher.publish("insert", record=retrospective(1, "코드 리뷰", "t1"))
+            await drain(feed)
+            assert store.get_by_id(1)["good_points"] == "코드 리뷰"
+            assert store.has_submitted("U1", SESSION_NAME)
+            assert [result["id"] for result in index.search("리뷰")] == [1]
+            assert [result[0] for result in typeahead.search("U1")] == [1]
+
+            publisher.publish("update", record=retrospective(1, "페어 프로그래밍", "t2"))
+            await drain(feed)
+            assert store.get_by_id(1)["good_points"] == "페어 프로그래밍"
+            assert index.search("리뷰") == []
+            assert [result["id"] for result in index.search("페어")] == [1]
+
+            # 삭제 알림에는 기본 키만 담겨 옵니다.
+            publisher.publish("delete", old_record={"id": 1})
+            await drain(feed)
+            assert store.get_by_id(1) is None
+            assert not store.has_submitted("U1", SESSION_NAME)
+            assert index.search("페어") == []
+            assert typeahead.search("U1") == []
+        finally:
+            await feed.stop()
+
+    asyncio.run(run())
+    assert feed.received_count == 3
+    assert feed.skipped_count == 0
+
+
+def test_local_changes_are_not_applied_twice(stores):
+    store, index, _, feed = stores
+    publisher = LocalChangePublisher()
+    applied = []
+    original_upsert = index.upsert
+
+    def upsert(row):
+        applied.append(row["id"])
+        original_upsert(row)
+
+    index.upsert = upsert
+
+    async def run():
+        await feed.start(publisher)
+        try:
+            row = retrospective(2, "회고 작성", "t1")
+            await notify_change("insert", row)
+            # 봇이 저장한 변경이 피드로 다시 들어옵니다.
+            publisher.publish("insert", record=row)
+            await drain(feed)
+        finally:
+            await feed.stop()
+
+    asyncio.run(run())
+    assert applied == [2]
+    assert store.get_by_id(2) is not None
+    assert feed.skipped_count == 1
+
+
+def test_reconnect_resyncs_and_toggles_feed_state(stores):
+    _, _, _, feed = stores
+    publisher = LocalChangePublisher()
+    resynced = []
+
+    async def run():
+        await feed.start(publisher)
+        try:
+            assert is_change_feed_active()
+            publisher.disconnect()
+            assert not is_change_feed_active()
+
+            store = warm_store_module.warm_store
+            store.reload = lambda: resynced.append("warm_store")
+            store._ready = True
+            publisher.reconnect()
+            await drain(feed)
+            assert is_change_feed_active()
+        finally:
+            await feed.stop()
+
+    asyncio.run(run())
+    assert feed.resync_count == 1
+    assert resynced == ["warm_store"]
+    assert not is_change_feed_active()
+
+
+def test_submissions_are_read_from_memory_only_when_all_writes_arrive(monkeypatch):
+    store = WarmStore()
+    store._cohort_name = warm_store_module._get_active_cohort_name()
+    store._session_names = frozenset(get_cohort_session_names(store._cohort_name))
+    store._ready = True
+    session_name = next(iter(store._session_names))
+    publisher = LocalChangePublisher()
+    feed = ChangeFeed()
+
+    monkeypatch.setattr(settings, "WORKERS", 1)
+    assert store.covers_submissions(session_name)
+
+    # 워커가 여러 개이면 다른 워커가 저장한 회고를 변경 피드로만 알 수 있습니다.
+    monkeypatch.setattr(settings, "WORKERS", 2)
+    assert not store.covers_submissions(session_name)
+
+    async def run():
+        await feed.start(publisher)
+        try:
+            assert store.covers_submissions(session_name)
+            publisher.disconnect()
+            assert not store.covers_submissions(session_name)
+        finally:
+            await feed.stop()
+
+    asyncio.run(run())
+
+
+def test_failed_load_is_retried_on_next_lookup():
+    store = WarmStore()
+    attempts = []
+
+    async def load():
+        attempts.append(len(attempts))
+        if len(attempts) == 1:
+            raise TimeoutError("데이터베이스 응답 없음")
+        store._cohort_name = warm_store_module._get_active_cohort_name()
+        store._ready = True
+
+    store.load = load
+
+    async def run():
+        with pytest.raises(TimeoutError):
+            await store.reload()
+        # 실패한 뒤 처음 조회할 때 다시 불러옵니다.
+        assert not store.is_ready()
+        await store._load_task
+        assert store.is_ready()
+
+    asyncio.run(run())
+    assert len(attempts) == 2
@@ -0,0 +1,170 @@
+import asyncio
+import sys
+import threading
+import uuid
+from pathlib import Path
+
+import pytest
+
+import logging_config  # noqa: F401  (로그 파일 싱크도 함께 확인합니다)
+from file_io import FileIOExecutor
+from slack.events import command_retrospective, view_retrospective_submit
+from tests.helpers import FAILING_GOOD_POINTS, FakeClient, ack, submission_body
+
+# 이벤트 루프에서 발생하면 안 되는 파일 I/O 감사(audit) 이벤트
+FILE_IO_EVENTS = {
+    "open",
+    "os.listdir",
+    "os.scandir",
+    "os.mkdir",
+    "os.remove",
+    "os.rmdir",
+    "os.rename",
+    "shutil.rmtree",
+}
+
+# 감시 중인 이벤트 루프 스레드와, 그 스레드에서 발생한 파일 I/O
+_watched_thread: int | None = None
+_blocking_calls: list[tuple[str, tuple]] = []
+
+
+def _audit(event: str, args: tuple) -> None:
+    if event in FILE_IO_EVENTS and threading.get_ident() == _watched_thread:
+        _blocking_calls.append((event, args))
+
+
+sys.addaudithook(_audit)
+
+
+def run_on_watched_loop(coro) -> list[tuple[str, tuple]]:
+    """코루틴을 실행하고, 이벤트 루프 스레드에서 직접 한 파일 I/O 목록을 반환합니다."""
+
+    async def watched():
+        global _watched_thread
+        _watched_thread = threading.get_ident()
+        try:
+            await coro
+        finally:
+            _watched_thread = None
+
+    _blocking_calls.clear()
+    asyncio.run(watched())
+    return list(_blocking_calls)
+
+
+@pytest.fixture
+def handlers(tmp_path, monkeypatch):
+    """임시 디렉터리에서 데이터베이스와 작업 큐 없이 회고 핸들러를 실행합니다."""
+    monkeypatch.chdir(tmp_path)
+
+    async def not_submitted(*args, **kwargs):
+        return False
+
+    async def create_retrospective(**retrospective):
+        # 첫 번째 모달의 회고는 저장에 실패합니다.
+        if retrospective["good_points"] == FAILING_GOOD_POINTS:
+            raise ValueError("저장 실패")
+        return retrospective
+
+    async def noop(*args, **kwargs):
+        return None
+
+    monkeypatch.setattr(
+        command_retrospective, "check_user_submitted_this_session", not_submitted
+    )
+    monkeypatch.setattr(
+        view_retrospective_submit, "check_user_submitted_this_session", not_submitted
+    )
+    monkeypatch.setattr(
+        view_retrospective_submit, "create_retrospective", create_retrospective
+    )
+    monkeypatch.setattr(view_retrospective_submit, "enqueue", noop)
+    monkeypatch.setattr(view_retrospective_submit, "capture", noop)
+    return tmp_path
+
+
+async def submit_then_reopen_then_resubmit(client: FakeClient) -> None:
+    """저장에 실패해 임시 저장하고, 모달을 다시 열어 불러온 뒤, 다시 제출해 임시 파일을 지웁니다."""
+    body = submission_body("U1", uuid.uuid4().hex, FAILING_GOOD_POINTS)
+    await view_retrospective_submit.handle_view_retrospective_submit(
+        ack=ack, body=body, client=client, view=body["view"], context={}
+    )
+    await command_retrospective.handle_command_retrospective(
+        ack=ack,
+        body={"user_id": "U1", "trigger_id": "T1", "channel_id": "C1"},
+        client=client,
+    )
+    body = submission_body("U1", uuid.uuid4().hex, "좋았던 점")
+    await view_retrospective_submit.handle_view_retrospective_submit(
+        ack=ack, body=body, client=client, view=body["view"], context={}
+    )
+
+
+def test_retrospective_handlers_do_not_block_loop_on_file_io(handlers):
+    # 처음 실행할 때 가져오는 모듈 파일은 확인 대상이 아니므로 한 번 실행해 둡니다.
+    asyncio.run(submit_then_reopen_then_resubmit(FakeClient()))
+
+    client = FakeClient()
+    blocking_calls = run_on_watched_loop(submit_then_reopen_then_resubmit(client))
+
+    assert blocking_calls == []
+    # 임시 저장한 회고를 모달에 불러오고, 저장에 성공한 뒤 임시 파일을 지웠는지 확인합니다.
+    assert FAILING_GOOD_POINTS in str(client.views[0])
+    assert not (Path(handlers) / "temp" / "U1").exists()
+
+
+def test_blocking_file_io_on_loop_is_detected(tmp_path):
+    async def blocking_handler():
+        (tmp_path / "blocking.txt").write_text("blocking")
+
+    assert [event for event, _ in run_on_watched_loop(blocking_handler())] == ["open"]
+
+
+def test_file_io_wait_is_bounded():
+    executor = FileIOExecutor(max_workers=1, max_in_flight=1, wait_timeout=0.05)
+    release = threading.Event()
+
+    async def run():
+        slow = asyncio.ensure_future(executor.run(release.wait))
+        await asyncio.sleep(0)
+        with pytest.raises(asyncio.TimeoutError):
+            await executor.run(lambda: None)
+        release.set()
+        await slow
+
+    asyncio.run(run())
+    executor.shutdown()
+
+    metrics = executor.metrics()
+    assert metrics["wait_timeouts"] == 1
+    assert metrics["completed"] == 1
+    assert metrics["waiting"] == 0
+    assert metrics["in_flight"] == 0
+
+
+def test_deferred_save_keeps_temp_copy_and_tells_member(handlers, monkeypatch):
+    enqueued = []
+
+    async def create_deferred(**retrospective):
+        return {**retrospective, "id": None, "created_at": None, "deferred": True}
+
+    async def enqueue(kind, payload, **kwargs):
+        enqueued.append((kind, payload))
+
+    monkeypatch.setattr(view_retrospective_submit, "create_retrospective", create_deferred)
+    monkeypatch.setattr(view_retrospective_submit, "enqueue", enqueue)
+
+    async def submit():
+        body = submission_body("U2", uuid.uuid4().hex, "좋았던 점")
+        await view_retrospective_submit.handle_view_retrospective_submit(
+            ack=ack, body=body, client=FakeClient(), view=body["view"], context={}
+        )
+
+    assert run_on_watched_loop(submit()) == []
+    # 아직 저장되지 않았으므로 임시 저장한 내용을 남겨 두고 멤버에게 알립니다.
+    assert list((Path(handlers) / "temp" / "U2").iterdir())
+    assert ("U2", True) in [
+        (payload["channel"], "아직 저장하지 못했어요" in payload["text"])
+        for kind, payload in enqueued
+        if kind == "post_message"
+    ]
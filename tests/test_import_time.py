@@ -0,0 +1,18 @@
+from scripts.check_import_time import measure
+
+# 시작할 때 가져오지 않고 처음 사용할 때 가져오는 모듈
+LAZY_MODULES = {
+    "analytics.emotion",
+    "jobs.backup",
+    "numpy",
+    "search.fulltext",
+    "search.similarity",
+    "search.typeahead",
+    "supabase",
+}
+
+
+def test_main_does_not_import_lazy_modules():
+    _, timings = measure("main")
+    assert not LAZY_MODULES & {name.strip() for _, name in timings}
+
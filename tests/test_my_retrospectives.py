@@ -0,0 +1,116 @@
+import asyncio
+
+import pytest
+from postgrest.exceptions import APIError
+from storage3.exceptions import StorageApiError
+
+from database import archive, retrospective as retrospective_module
+from database.archive import ArchiveStore
+from database.resilience import (
+    FAILURE_THRESHOLD,
+    OPEN_SECONDS,
+    CircuitBreaker,
+    Resilience,
+)
+from database.warm_store import WarmStore, _get_active_cohort_name
+from slack.events import command_my_retrospectives
+from tests.helpers import FakeClient, ack
+from utils import get_cohort_session_names
+
+# archive.sql 을 적용하지 않았거나 데이터베이스가 응답하지 않을 때의 오류
+MISSING_TABLE = APIError(
+    {"code": "42P01", "message": 'relation "archived_cohorts" does not exist'}
+)
+MISSING_BUCKET = StorageApiError("Bucket not found", "Bucket not found", 404)
+UNAVAILABLE = TimeoutError()
+
+
+class FakeStorageBucket:
+    def __init__(self, error: Exception | None) -> None:
+        self.error = error
+
+    async def download(self, path):
+        raise self.error or AssertionError(path)
+
+
+class FakeQuery:
+    def __init__(self, error: Exception | None) -> None:
+        self.error = error
+
+    def select(self, *args, **kwargs):
+        return self
+
+    async def execute(self):
+        if self.error:
+            raise self.error
+        # 보관된 기수는 있지만 버킷이 없는 경우입니다.
+        return type(
+            "Result", (), {"data": [{"cohort_name": "1기", "archived_at": "2025-01-01"}]}
+        )
+
+
+class FakeSupabase:
+    """archived_cohorts 조회나 보관 버킷 다운로드가 실패하는 Supabase 대역"""
+
+    def __init__(self, table_error: Exception | None, storage_error: Exception | None) -> None:
+        self.table_error = table_error
+        self.storage = type(
+            "Storage", (), {"from_": lambda _, bucket: FakeStorageBucket(storage_error)}
+        )()
+
+    def table(self, name):
+        return FakeQuery(self.table_error)
+
+
+@pytest.mark.parametrize(
+    "table_error, storage_error",
+    [(MISSING_TABLE, None), (None, MISSING_BUCKET), (UNAVAILABLE, None)],
+    ids=["missing_table", "missing_bucket", "unavailable"],
+)
+def test_my_retrospectives_without_archive(tmp_path, monkeypatch, table_error, storage_error):
+    store = WarmStore()
+    store._cohort_name = _get_active_cohort_name()
+    store._session_names = frozenset(get_cohort_session_names(store._cohort_name))
+    store._ready = True
+    store.apply_change(
+        "insert",
+        {
+            "id": 1,
+            "user_id": "U1",
+            "session_name": next(iter(store._session_names)),
+            "slack_channel": "C1",
+            "slack_ts": "1700000000.000100",
+            "good_points": "좋았던 점",
+            "improvements": "아쉬운 점",
+            "learnings": "배운 점",
+            "action_item": "액션 아이템",
+            "emotion_score": 7,
+            "emotion_reason": "이유",
+            "created_at": "2025-05-01T10:00:00+00:00",
+            "updated_at": "2025-05-01T10:00:00+00:00",
+        },
+    )
+
+    async def no_summary(user_id):
+        return None
+
+    monkeypatch.setattr(retrospective_module, "warm_store", store)
+    monkeypatch.setattr(retrospective_module, "archive_store", ArchiveStore(tmp_path))
+    monkeypatch.setattr(archive, "supabase", FakeSupabase(table_error, storage_error))
+    monkeypatch.setattr(
+        archive,
+        "supabase_resilience",
+        Resilience(CircuitBreaker("test", FAILURE_THRESHOLD, OPEN_SECONDS)),
+    )
+    monkeypatch.setattr(command_my_retrospectives, "_get_emotion_summary_text", no_summary)
+
+    client = FakeClient()
+    asyncio.run(
+        command_my_retrospectives.handle_command_my_retrospectives(
+            ack=ack, body={"user_id": "U1", "trigger_id": "T1"}, client=client
+        )
+    )
+
+    # 보관된 회고 없이 현재 기수의 회고 목록을 보여줍니다.
+    assert client.views[0]["title"]["text"] == "내 회고 목록"
+    assert '"value": "1"' in str(client.views[0]).replace("'", '"')
@@ -0,0 +1,139 @@
+import asyncio
+import uuid
+from pathlib import Path
+
+import pytest
+
+from exception import ConflictException
+from jobs.dead_letter import DEAD_LETTER_KEY
+from slack.events import view_retrospective_submit
+from tests.helpers import FakeClient, ack, submission_body
+
+
+@pytest.fixture
+def saved(tmp_path, monkeypatch):
+    """데이터베이스 대신 메모리에 저장하고, 저장된 (user_id, session_name) 목록을 반환합니다."""
+    monkeypatch.chdir(tmp_path)
+    rows: list[dict] = []
+
+    async def check_user_submitted_this_session(user_id, session_name):
+        return any(
+            row["user_id"] == user_id and row["session_name"] == session_name
+            for row in rows
+        )
+
+    async def create_retrospective(**retrospective):
+        rows.append(retrospective)
+        return retrospective
+
+    async def upsert_retrospectives_from_slack(new_rows):
+        rows.extend(new_rows)
+        return new_rows
+
+    async def noop(*args, **kwargs):
+        return None
+
+    monkeypatch.setattr(
+        view_retrospective_submit,
+        "check_user_submitted_this_session",
+        check_user_submitted_this_session,
+    )
+    monkeypatch.setattr(
+        view_retrospective_submit, "create_retrospective", create_retrospective
+    )
+    monkeypatch.setattr(
+        view_retrospective_submit,
+        "upsert_retrospectives_from_slack",
+        upsert_retrospectives_from_slack,
+    )
+    monkeypatch.setattr(view_retrospective_submit, "enqueue", noop)
+    monkeypatch.setattr(view_retrospective_submit, "capture", noop)
+    return rows
+
+
+def replay_context(session_name: str, slack_ts: str | None) -> dict:
+    state = {"session_name": session_name, "slack_channel": "C1"}
+    if slack_ts:
+        state["slack_ts"] = slack_ts
+    return {DEAD_LETTER_KEY: {"state": state}}
+
+
+async def submit(client: FakeClient, context: dict | None = None) -> None:
+    body = submission_body("U1", uuid.uuid4().hex, "좋았던 점")
+    await view_retrospective_submit.handle_view_retrospective_submit(
+        ack=ack, body=body, client=client, view=body["view"], context=context or {}
+    )
+
+
+@pytest.mark.parametrize("slack_ts", [None, "1690000000.000001"])
+def test_replay_skips_when_member_already_resubmitted(saved, slack_ts):
+    client = FakeClient()
+
+    async def run():
+        # 처음 제출은 실패해 보관되었고, 그 사이 멤버가 다시 제출해 저장되었습니다.
+        await submit(client)
+        session_name = saved[0]["session_name"]
+        await submit(client, replay_context(session_name, slack_ts))
+
+    asyncio.run(run())
+    assert len(saved) == 1
+    assert len(client.messages) == 1
+
+
+def test_replay_with_posted_message_saves_without_reposting(saved):
+    client = FakeClient()
+    session_name = view_retrospective_submit.get_current_session_info()[1]
+
+    asyncio.run(submit(client, replay_context(session_name, "1690000000.000001")))
+
+    assert [row["slack_ts"] for row in saved] == ["1690000000.000001"]
+    assert client.messages == []
+
+
+def test_second_submission_from_another_modal_is_rejected_in_modal(saved):
+    client = FakeClient()
+    acks = []
+
+    async def record_ack(**kwargs):
+        acks.append(kwargs)
+
+    async def run():
+        # 모달을 두 개 열어 차례로 제출했습니다.
+        await submit(client)
+        body = submission_body("U1", uuid.uuid4().hex, "좋았던 점")
+        await view_retrospective_submit.handle_view_retrospective_submit(
+            ack=record_ack, body=body, client=client, view=body["view"], context={}
+        )
+
+    asyncio.run(run())
+    assert len(saved) == 1
+    assert len(client.messages) == 1
+    # 모달을 닫지 않고 이미 제출했다고 안내합니다.
+    assert acks[0]["response_action"] == "errors"
+    assert "이미 제출했어요" in acks[0]["errors"]["good_points"]
+
+
+def test_conflict_from_another_worker_keeps_draft_and_tells_member(saved, monkeypatch):
+    client = FakeClient()
+    enqueued = []
+
+    async def create_retrospective(**retrospective):
+        # 다른 워커가 같은 회차의 회고를 먼저 저장했습니다.
+        raise ConflictException("이미 제출했습니다.")
+
+    async def enqueue(kind, payload, **kwargs):
+        enqueued.append((kind, payload))
+
+    monkeypatch.setattr(
+        view_retrospective_submit, "create_retrospective", create_retrospective
+    )
+    monkeypatch.setattr(view_retrospective_submit, "enqueue", enqueue)
+
+    asyncio.run(submit(client))
+    assert saved == []
+    assert client.deleted == [{"channel": "C1", "ts": "1700000000.000001"}]
+    # 작성한 내용을 임시 저장하고 멤버에게 DM 으로 알립니다.
+    assert list(Path("temp", "U1").iterdir())
+    assert [payload["channel"] for kind, payload in enqueued if kind == "post_message"] == [
+        "U1"
+    ]
@@ -6,10 +6,12 @@ import regex as re
 import datetime
 
 import csv
+import shutil
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
-from constants import DUE_DATES, SESSION_NAMES
+from constants import DEFAULT_COHORT_NAME, DUE_DATES, SESSION_NAMES
+from file_io import run_file_io
 
 
 def tz_now(tz: str = "Asia/Seoul") -> datetime.datetime:
@@ -88,6 +90,17 @@ def get_current_session_info(
     raise ValueError("현재 회차를 찾을 수 없습니다.")
 
 
+def get_cohort_name(session_name: str) -> str:
+    """회차 이름으로 기수 이름을 반환합니다. (예: "3기 1회차" -> "3기")"""
+    match = re.match(r"^(\d+기) ", session_name)
+    return match.group(1) if match else DEFAULT_COHORT_NAME
+
+
+def get_cohort_session_names(cohort_name: str) -> list[str]:
+    """기수에 속한 회차 이름 목록을 반환합니다."""
+    return [name for name in SESSION_NAMES if get_cohort_name(name) == cohort_name]
+
+
 def format_remaining_time(remaining: datetime.timedelta) -> str:
     """
     남은 시간을 읽기 쉬운 형식으로 변환합니다.
@@ -110,8 +123,22 @@ def format_remaining_time(remaining: datetime.timedelta) -> str:
         return f"{minutes}분"
 
 
-def save_temp_retrospective(user_id: str, values: dict):
+async def save_temp_retrospective(user_id: str, values: dict) -> None:
     """회고 임시 저장"""
+    await run_file_io(_save_temp_retrospective, user_id, values)
+
+
+async def get_latest_temp_retrospective(user_id: str) -> dict | None:
+    """가장 최근 임시 저장된 회고 데이터 조회"""
+    return await run_file_io(_get_latest_temp_retrospective, user_id)
+
+
+async def cleanup_temp_files(user_id: str) -> None:
+    """유저의 임시 파일들 삭제"""
+    await run_file_io(_cleanup_temp_files, user_id)
+
+
+def _save_temp_retrospective(user_id: str, values: dict) -> None:
     # temp/유저아이디 디렉토리 생성
     temp_dir = Path(f"temp/{user_id}")
     temp_dir.mkdir(parents=True, exist_ok=True)
@@ -128,8 +155,7 @@ def save_temp_retrospective(user_id: str, values: dict):
             writer.writerow([field, value])
 
 
-def get_latest_temp_retrospective(user_id: str) -> dict | None:
-    """가장 최근 임시 저장된 회고 데이터 조회"""
+def _get_latest_temp_retrospective(user_id: str) -> dict | None:
     temp_dir = Path(f"temp/{user_id}")
     if not temp_dir.exists():
         return None
@@ -151,10 +177,7 @@ def get_latest_temp_retrospective(user_id: str) -> dict | None:
     return values
 
 
-def cleanup_temp_files(user_id: str):
-    """유저의 임시 파일들 삭제"""
+def _cleanup_temp_files(user_id: str) -> None:
     temp_dir = Path(f"temp/{user_id}")
     if temp_dir.exists():
-        import shutil
-
         shutil.rmtree(temp_dir)